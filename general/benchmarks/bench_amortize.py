@@ -0,0 +1,67 @@
+"""
+Benchmark the segment-wise amortization of a variable-rate loan with lump sums
+and skipped months against stepping through every month, for terms of
+increasing length with the same few change points.
+
+Run with: python general/benchmarks/bench_amortize.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from budget_core.amortization import amortize, monthly_payment
+
+PRINCIPAL = 400000
+RESETS = {1: 0.055, 61: 0.0675, 73: 0.0725, 85: 0.0625}  # A 5/1 ARM
+EXTRA_PAYMENTS = {24: 15000, 96: 30000}
+SKIPPED_MONTHS = (50, 51)
+ROUNDS = 200
+
+
+def stepped(principal, resets, n_payments, extra_payments, skipped_months):
+    """Reference amortization, one month at a time, returning the total interest."""
+    balance = principal
+    total_interest = 0.0
+    payment = None
+    annual_rate = None
+    for month in range(1, n_payments + 1):
+        if month in resets or month - 1 in skipped_months:
+            annual_rate = resets.get(month, annual_rate)
+            payment = monthly_payment(balance, annual_rate, n_payments - month + 1)
+        interest = balance * annual_rate / 12
+        total_interest += interest
+        if month in skipped_months:
+            balance += interest
+            continue
+        paid = min(payment + extra_payments.get(month, 0), balance + interest)
+        if month == n_payments:
+            paid = balance + interest
+        balance += interest - paid
+        if balance <= 0.005:
+            break
+    return total_interest
+
+
+def best_of(function, rounds=ROUNDS):
+    """Fastest of several runs, in seconds, and the last result."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == '__main__':
+    print(f"{len(RESETS)} rate resets, {len(EXTRA_PAYMENTS)} lump sums, {len(SKIPPED_MONTHS)} skipped months")
+    for years in (15, 30, 100):
+        n_payments = years * 12
+        segment_time, result = best_of(lambda: amortize(
+            PRINCIPAL, RESETS, n_payments, EXTRA_PAYMENTS, SKIPPED_MONTHS, include_schedule=False))
+        schedule_time, _ = best_of(lambda: amortize(PRINCIPAL, RESETS, n_payments, EXTRA_PAYMENTS, SKIPPED_MONTHS))
+        step_time, interest = best_of(lambda: stepped(PRINCIPAL, RESETS, n_payments, EXTRA_PAYMENTS, set(SKIPPED_MONTHS)))
+        assert abs(interest - result['total_interest']) < 1e-6 * interest
+        print(f"  {years:3} years: segments {segment_time * 1e6:6.0f} us, with schedule {schedule_time * 1e6:6.0f} us, "
+              f"stepping {step_time * 1e6:6.0f} us ({result['segments']} segments, {result['months']} months)")
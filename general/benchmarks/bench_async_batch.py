@@ -0,0 +1,64 @@
+"""
+Benchmark the asyncio batch API against computing each profile as it arrives
+from a slow source, one MonthlyBudget at a time.
+
+The source simulates I/O: it pauses before every page of profiles.
+
+Run with: python general/benchmarks/bench_async_batch.py [profiles]
+"""
+import asyncio
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from budget_core.async_batch import compute_budgets
+from budget_core.service import compute_budget
+from budget_service import EXAMPLE_PROFILE
+
+PAGE = 500
+PAGE_DELAY = 0.02
+
+
+def make_profiles(count):
+    profiles = []
+    for index in range(count):
+        profile = copy.deepcopy(EXAMPLE_PROFILE)
+        profile['income']['gross_annual_salary'] = 30000 + (index % 5000) * 40
+        profiles.append(profile)
+    return profiles
+
+
+async def source(profiles):
+    """Yield the profiles a page at a time, waiting on simulated I/O before each page."""
+    for start in range(0, len(profiles), PAGE):
+        await asyncio.sleep(PAGE_DELAY)
+        for profile in profiles[start:start + PAGE]:
+            yield profile
+
+
+async def one_at_a_time(profiles):
+    total = 0.0
+    async for profile in source(profiles):
+        total += compute_budget(profile)['free_money']
+    return total
+
+
+async def batched(profiles):
+    total = 0.0
+    async for result in compute_budgets(source(profiles), batch_size=PAGE):
+        total += result['free_money']
+    return total
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    profiles = make_profiles(count)
+    print(f"{count} profiles, {PAGE_DELAY * 1e3:.0f} ms of I/O per page of {PAGE}: {count / PAGE * PAGE_DELAY:.2f} s of I/O")
+    for name, run in (('one at a time', one_at_a_time), ('async batches', batched)):
+        start = time.perf_counter()
+        total = asyncio.run(run(profiles))
+        elapsed = time.perf_counter() - start
+        print(f"{name:>14}: {elapsed:.2f} s, {count / elapsed:,.0f} profiles/s (checksum {total:.2f})")
@@ -0,0 +1,59 @@
+"""
+Benchmark the integer-cents mode against the float path: vectorized net income
+for many households, and single loan schedules. Also reports how far the float
+results are from the exact ones.
+
+Run with: python general/benchmarks/bench_cents.py [households]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from budget_core import MonthlyNetIncome, loan_schedule_columns
+from budget_core.cents import MonthlyNetIncomeCents, loan_schedule_cents, to_cents
+
+FEDERAL_TAX_BRACKETS = [(11000, 0.10), (44725, 0.12), (95375, 0.22), (182100, 0.24)]
+STATE_TAX_BRACKETS = [(1000, 0.02), (2000, 0.04), (3000, 0.0475), (250000, 0.05)]
+ROUNDS = 5
+
+
+def best_of(function, rounds=ROUNDS):
+    """Fastest of several runs, in seconds, and the last result."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == '__main__':
+    households = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = np.random.default_rng(0)
+    salaries = np.round(rng.uniform(20000, 300000, households), 2)
+
+    def float_path():
+        income = MonthlyNetIncome(salaries, FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS, 0.032, 0.062, 1454, 8024, 0.10, 3960)
+        return income.calculate_net_monthly_income()
+
+    def cents_path():
+        income = MonthlyNetIncomeCents(salaries, FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS, 0.032, 0.062, 1454, 8024, 0.10, 3960)
+        return income.calculate_net_monthly_income()
+
+    float_time, float_result = best_of(float_path)
+    cents_time, cents_result = best_of(cents_path)
+    print(f"Net monthly income of {households:,} households:")
+    print(f"  float64:     {float_time * 1e3:7.1f} ms")
+    print(f"  int64 cents: {cents_time * 1e3:7.1f} ms")
+    difference = np.abs(to_cents(float_result) - cents_result)
+    print(f"  float results off the exact cent: {int(np.count_nonzero(difference)):,}, by up to {int(difference.max())} cents")
+
+    float_time, float_schedule = best_of(lambda: loan_schedule_columns(32000, 0.05, 30, 500), 200)
+    cents_time, cents_schedule = best_of(lambda: loan_schedule_cents(32000, 0.05, 30, 500), 200)
+    print("30-year $32,000 loan at 5% with $500 extra per month:")
+    print(f"  float: {float_time * 1e6:7.1f} us, final balance {float_schedule.remaining_balance[-1]:.10f}")
+    print(f"  cents: {cents_time * 1e6:7.1f} us, final balance {cents_schedule.remaining_balance[-1]} cents")
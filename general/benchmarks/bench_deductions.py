@@ -0,0 +1,58 @@
+"""
+Benchmark the deduction pipeline over a large population: the one-pass
+calculate_deduction_stages against asking MonthlyNetIncome for each figure
+separately, which recomputes the taxable income and the taxes for every call.
+
+Run with: python general/benchmarks/bench_deductions.py [households]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from budget_core import MonthlyNetIncome, tax_tables
+
+YEAR = 2024
+ROUNDS = 5
+
+
+def best_of(function, rounds=ROUNDS):
+    """Fastest of several runs, in seconds, and the last result."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == '__main__':
+    households = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = np.random.default_rng(0)
+    salaries = np.round(rng.lognormal(11.3, 0.7, households), 2)
+    retirement = np.round(salaries * rng.uniform(0, 0.15, households), 2)
+    health_premiums = np.round(rng.uniform(0, 3000, households), 2)
+
+    def make(retirement_pre_tax):
+        return MonthlyNetIncome(
+            salaries, tax_tables.federal(YEAR), tax_tables.state(YEAR, 'MD'), 0.032, 0.0, 1454, retirement,
+            0.10, 3960, tax_tables.social_security(YEAR), tax_tables.medicare(YEAR),
+            health_premiums, retirement_pre_tax
+        )
+
+    post_tax = make(False)
+    pre_tax = make(rng.random(households) < 0.8)
+
+    separate_time, (separate_taxes, separate_net) = best_of(
+        lambda: (pre_tax.calculate_total_taxes(), pre_tax.calculate_net_annual_income()))
+    stages_time, stages = best_of(pre_tax.calculate_deduction_stages)
+    assert np.allclose(stages['total_taxes'], separate_taxes) and np.allclose(stages['net_annual_income'], separate_net)
+
+    print(f"{households:,} households, taxes and net income")
+    print(f"  separate calls:            {separate_time * 1000:8.1f} ms")
+    print(f"  calculate_deduction_stages: {stages_time * 1000:7.1f} ms  ({separate_time / stages_time:.1f}x)")
+    saved = post_tax.calculate_total_taxes() - stages['total_taxes']
+    print(f"  taxes saved by pre-tax contributions: {saved.mean():,.2f} a year on average")
@@ -0,0 +1,57 @@
+"""
+Benchmark the SQLite budget history: bulk-insert monthly snapshots for many
+households (rows built together with snapshot_rows, and one at a time with
+snapshot_row for comparison), then time period range queries.
+
+Run with: python general/benchmarks/bench_history.py [households]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from budget_core import MonthlyNetIncome, MortgageAndDebt, Utilities
+from budget_core.storage import BudgetHistory, snapshot_row, snapshot_rows
+
+FEDERAL_TAX_BRACKETS = [(11000, 0.10), (44725, 0.12), (95375, 0.22), (182100, 0.24)]
+STATE_TAX_BRACKETS = [(1000, 0.02), (2000, 0.04), (3000, 0.0475), (250000, 0.05)]
+PERIODS = [f"{year}-{month:02d}" for year in range(2000, 2027) for month in range(1, 13)]
+
+
+def household_snapshots(household):
+    """Snapshots of one household for every month from 2000 to 2026."""
+    mortgage_and_debt = MortgageAndDebt(1500, 350, 350, 300)
+    utilities = Utilities(250, 75, 75, 75, 30, 43)
+    for index, period in enumerate(PERIODS):
+        monthly_net_income = MonthlyNetIncome(
+            60000 + household * 50 + index * 100, FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS,
+            0.032, 0.062, 1454, 8024, 0.10, 3960
+        )
+        yield f"household-{household}", period, monthly_net_income, mortgage_and_debt, utilities
+
+
+if __name__ == '__main__':
+    households = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    with tempfile.TemporaryDirectory() as directory:
+        with BudgetHistory(os.path.join(directory, 'history.sqlite3')) as history:
+            start = time.perf_counter()
+            for household in range(households):
+                history.save_rows(snapshot_rows(household_snapshots(household)))
+            elapsed = time.perf_counter() - start
+            print(f"Inserted {households * len(PERIODS)} snapshots in {elapsed:.2f} s")
+
+            start = time.perf_counter()
+            rows = [snapshot_row(*snapshot) for snapshot in household_snapshots(households)]
+            per_row = (time.perf_counter() - start) / len(rows)
+            start = time.perf_counter()
+            rows = snapshot_rows(household_snapshots(households))
+            bulk = (time.perf_counter() - start) / len(rows)
+            print(f"Building rows: snapshot_row {per_row * 1e6:.1f} us each, snapshot_rows {bulk * 1e6:.1f} us each")
+
+            start = time.perf_counter()
+            for household in range(households):
+                leftover = history.leftover_by_period(f"household-{household}", "2020-01", "2026-12")
+            elapsed = time.perf_counter() - start
+            print(f"Leftover by month for 2020-2026: {len(leftover)} months, {elapsed / households * 1e3:.3f} ms per query")
@@ -0,0 +1,51 @@
+"""
+Benchmark the loan comparison report on hundreds of offers against building
+every full schedule with loan_schedule and summing it.
+
+Run with: python general/benchmarks/bench_loan_report.py [offers]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from budget_core import LoanComparison, loan_schedule
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = np.random.default_rng(0)
+    scenarios = [
+        {
+            'name': f'offer {i}', 'principal': 350000, 'annual_rate': round(rate, 4), 'years': int(years),
+            'extra_payment': float(extra), 'fees': round(fees, 2),
+        }
+        for i, (rate, years, extra, fees) in enumerate(zip(
+            rng.uniform(0.045, 0.075, count), rng.choice([15, 20, 30], count),
+            rng.choice([0, 100, 250, 500], count), rng.uniform(0, 8000, count)
+        ))
+    ]
+
+    start = time.perf_counter()
+    comparison = LoanComparison(scenarios)
+    text = comparison.render('text')
+    csv_text = comparison.render('csv')
+    report_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    schedules = [
+        loan_schedule(s['principal'], s['annual_rate'], s['years'], s['extra_payment']) for s in scenarios
+    ]
+    interest = [sum(row['Interest Payment'] for row in schedule) for schedule in schedules]
+    schedule_time = time.perf_counter() - start
+
+    assert np.allclose(interest, comparison.total_interest)
+    assert [len(schedule) for schedule in schedules] == comparison.payoff_month.tolist()
+    print(f"{count:,} offers")
+    print(f"  closed-form report, text and CSV: {report_time * 1000:8.1f} ms ({len(text.splitlines())} lines, {len(csv_text):,} bytes)")
+    print(f"  full schedules:                   {schedule_time * 1000:8.1f} ms "
+          f"({sum(len(schedule) for schedule in schedules):,} rows)")
+    best = int(np.argmin(comparison.total_cost))
+    print(f"  cheapest: {comparison.names[best]}, total cost {comparison.total_cost[best]:,.2f}")
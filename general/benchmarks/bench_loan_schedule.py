@@ -0,0 +1,58 @@
+"""
+Benchmark a sweep over loan terms that only needs each payoff month and total
+interest: a DataFrame per call (as the vehicle script used to build), the
+list-of-rows loan_schedule, and the columnar loan_schedule_columns. Also
+reports the import cost that pandas adds.
+
+Run with: python general/benchmarks/bench_loan_schedule.py [loans]
+"""
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from budget_core.amortization import loan_schedule, loan_schedule_columns
+
+
+def import_seconds(module):
+    """Time a fresh interpreter importing a module, minus the bare interpreter start."""
+    def run(code):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+        return time.perf_counter() - start
+    bare = min(run('pass') for _ in range(3))
+    return min(run(f'import {module}') for _ in range(3)) - bare
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = np.random.default_rng(0)
+    loans = list(zip(rng.uniform(5000, 60000, count).round(2), rng.uniform(0.02, 0.12, count).round(4),
+                     rng.choice([3, 4, 5, 6, 7], count).tolist(), rng.choice([0, 100, 250, 500], count).tolist()))
+
+    import pandas as pd
+
+    start = time.perf_counter()
+    frames = [pd.DataFrame(loan_schedule(*loan)) for loan in loans]
+    frame_summary = [(len(frame), frame['Interest Payment'].sum()) for frame in frames]
+    frame_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rows_summary = [(len(rows), sum(row['Interest Payment'] for row in rows)) for rows in map(lambda loan: loan_schedule(*loan), loans)]
+    rows_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns_summary = [(len(schedule), schedule.total_interest) for schedule in (loan_schedule_columns(*loan) for loan in loans)]
+    columns_time = time.perf_counter() - start
+
+    assert [months for months, _ in columns_summary] == [months for months, _ in frame_summary]
+    assert np.allclose([interest for _, interest in columns_summary], [interest for _, interest in rows_summary])
+    print(f"{count:,} loans, payoff month and total interest")
+    print(f"  DataFrame per call:    {frame_time * 1000:8.1f} ms")
+    print(f"  loan_schedule rows:    {rows_time * 1000:8.1f} ms")
+    print(f"  loan_schedule_columns: {columns_time * 1000:8.1f} ms")
+    print(f"Import time: budget_core {import_seconds('budget_core') * 1000:.0f} ms, pandas {import_seconds('pandas') * 1000:.0f} ms")
@@ -0,0 +1,56 @@
+"""
+Benchmark the payroll taxes (Social Security wage base and additional Medicare
+tax) in the vectorized tax path, against the flat FICA rate, and report how much
+the flat rate overstates the deductions of high earners.
+
+Run with: python general/benchmarks/bench_payroll.py [households]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from budget_core import MonthlyNetIncome, tax_tables
+
+YEAR = 2024
+ROUNDS = 5
+
+
+def best_of(function, rounds=ROUNDS):
+    """Fastest of several runs, in seconds, and the last result."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+if __name__ == '__main__':
+    households = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = np.random.default_rng(0)
+    salaries = np.round(rng.lognormal(11.3, 0.7, households), 2)
+    federal_tax_brackets = tax_tables.federal(YEAR)
+    state_tax_brackets = tax_tables.state(YEAR, 'MD')
+
+    flat = MonthlyNetIncome(salaries, federal_tax_brackets, state_tax_brackets, 0.032, 0.062, 0, 0, 0.10, 0)
+    modeled = MonthlyNetIncome(
+        salaries, federal_tax_brackets, state_tax_brackets, 0.032, 0.0, 0, 0, 0.10, 0,
+        tax_tables.social_security(YEAR), tax_tables.medicare(YEAR)
+    )
+    flat_time, flat_taxes = best_of(flat.calculate_total_taxes)
+    modeled_time, modeled_taxes = best_of(modeled.calculate_total_taxes)
+
+    print(f"{households:,} households, total taxes")
+    print(f"  flat FICA rate:  {flat_time * 1000:8.1f} ms")
+    print(f"  payroll taxes:   {modeled_time * 1000:8.1f} ms  "
+          f"(+{(modeled_time - flat_time) / households * 1e9:.0f} ns per household)")
+
+    above_wage_base = salaries > tax_tables.social_security(YEAR)[0][0]
+    overstated = flat.calculate_fica() - modeled.calculate_fica()
+    print(f"  households above the Social Security wage base: {above_wage_base.mean():.1%}")
+    print(f"  FICA overstated by the flat rate for them: {overstated[above_wage_base].mean():,.2f} a year on average")
+    print(f"  additional Medicare tax paid: {(modeled.calculate_medicare_tax() - 0.0145 * salaries).sum():,.0f} in total")
@@ -0,0 +1,74 @@
+"""
+Benchmark the pie chart redraw: the old ax.clear() + ax.pie() path against the
+persistent-artist PieChart (with its render cache disabled).
+
+Run with: python general/benchmarks/bench_pie_chart.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import matplotlib.pyplot as plt
+import numpy as np
+
+from budget_core.pie_chart import PieChart, pie_layout
+
+# The charts the GUI cycles through while hovering: summary and drill-downs
+CHARTS = [
+    (['Taxes', 'Mortgage and Debt', 'Utilities', 'Free Money'], [2777.22, 2500, 548, 1367.28]),
+    (['Federal Tax', 'State Tax', 'Local Tax', 'FICA', 'Medicare'], [1191.22, 413.98, 267.47, 518.22, 121.17]),
+    (['Rent', 'Auto Payment', 'Credit Card Payment'], [1500, 350, 300]),
+    (['Car Gas/Electric', 'Electric and Gas (Home)', 'Cable', 'Internet', 'Cellphone', 'Sewer and Water'], [250, 75, 0, 75, 30, 75]),
+    (['Leftover', 'Retirement Funding'], [698.62, 668.67]),
+]
+ROUNDS = 40
+
+
+def make_canvas():
+    """Create an off-screen 6x6 inch figure like the GUI uses."""
+    figure = Figure(figsize=(6, 6), dpi=100)
+    ax = figure.add_subplot(111)
+    return ax, FigureCanvasAgg(figure)
+
+
+def bench_clear_and_pie(draw):
+    """Time the original redraw that clears the axes and calls ax.pie()."""
+    ax, canvas = make_canvas()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for labels, sizes in CHARTS:
+            ax.clear()
+            colors = plt.cm.tab20(np.linspace(0, 1, len(labels)))
+            ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=140, colors=colors)
+            ax.axis('equal')
+            if draw:
+                canvas.draw()
+    return (time.perf_counter() - start) / (ROUNDS * len(CHARTS))
+
+
+def bench_pie_chart(draw):
+    """Time PieChart updating its pooled artists in place."""
+    ax, canvas = make_canvas()
+    chart = PieChart(ax, canvas, cache_bytes=0)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for labels, sizes in CHARTS:
+            if draw:
+                chart.draw(labels, sizes)
+            else:
+                chart._update_artists(labels, pie_layout(sizes))
+    return (time.perf_counter() - start) / (ROUNDS * len(CHARTS))
+
+
+if __name__ == '__main__':
+    for draw in (False, True):
+        title = 'update + render' if draw else 'update only'
+        old = bench_clear_and_pie(draw)
+        new = bench_pie_chart(draw)
+        print(f"{title:>16}: ax.clear()+ax.pie() {old * 1e3:7.2f} ms   PieChart {new * 1e3:7.2f} ms   speedup {old / new:5.1f}x")
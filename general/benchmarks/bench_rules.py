@@ -0,0 +1,53 @@
+"""
+Benchmark categorization cost as the number of rules grows: the compiled
+RuleEngine against checking every rule one after another.
+
+Run with: python general/benchmarks/bench_rules.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from budget_core.rules import RuleEngine
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ *-#0123456789'
+DESCRIPTIONS = 5000
+
+
+def random_text(rng, length):
+    """Random upper-case text like a bank description."""
+    return ''.join(rng.choice(ALPHABET) for _ in range(length))
+
+
+def sequential_match(rules, description):
+    """The old approach: check each keyword rule in order."""
+    for pattern, target in rules:
+        if pattern in description:
+            return target
+    return None
+
+
+if __name__ == '__main__':
+    rng = random.Random(0)
+    descriptions = [random_text(rng, 32) for _ in range(DESCRIPTIONS)]
+    for rule_count in (10, 100, 1000, 5000):
+        rules = [(random_text(rng, rng.randint(4, 12)), index) for index in range(rule_count)]
+
+        start = time.perf_counter()
+        engine = RuleEngine(rules)
+        compile_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for description in descriptions:
+            engine.match(description)
+        compiled = (time.perf_counter() - start) / DESCRIPTIONS
+
+        start = time.perf_counter()
+        for description in descriptions:
+            sequential_match(rules, description)
+        sequential = (time.perf_counter() - start) / DESCRIPTIONS
+
+        print(f"{rule_count:>5} rules: compiled {compiled * 1e6:6.2f} us   sequential {sequential * 1e6:8.2f} us   (compile {compile_time * 1e3:.1f} ms)")
@@ -0,0 +1,111 @@
+"""
+Benchmark a workspace of variant budgets: memory held by ScenarioWorkspace
+(components shared copy-on-write) against a full copy of every component per
+scenario, and the time to refresh the side-by-side results after one scenario
+changes against recomputing every scenario.
+
+Run with: python general/benchmarks/bench_scenarios.py [scenarios]
+"""
+import copy
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from budget_core import MonthlyBudget, MonthlyNetIncome, MortgageAndDebt, ScenarioWorkspace, Utilities
+
+SCENARIOS = 48
+ROUNDS = 20
+# One input changed per scenario, in turn
+CHANGES = (
+    ('mortgage_and_debt', 'rent', lambda index: 1000 + 10 * index),
+    ('monthly_net_income', 'gross_annual_salary', lambda index: 80000 + 1000 * index),
+    ('utilities', 'internet', lambda index: 40 + index),
+    ('monthly_net_income', 'savings_rate', lambda index: 0.05 + 0.002 * index),
+)
+
+
+def base_components():
+    """The budget of the V4 demo."""
+    return (
+        MonthlyNetIncome(
+            100300, [(11000, 0.10), (44725, 0.12), (95375, 0.22), (182100, 0.24)],
+            [(1000, 0.02), (2000, 0.04), (3000, 0.0475), (float('inf'), 0.05)], 0.032, 0.062, 1454, 8024, 0.10, 330 * 12
+        ),
+        MortgageAndDebt(1500, 350, 350, 300),
+        Utilities(250, 75, 75, 75, 30, 43, 0, 0),
+    )
+
+
+def build_workspace(count):
+    """A workspace with one changed input per scenario."""
+    workspace = ScenarioWorkspace(*base_components())
+    for index in range(count):
+        name = f"Scenario {index + 1}"
+        component, attribute, value = CHANGES[index % len(CHANGES)]
+        workspace.add_scenario(name)
+        workspace.set(name, component, attribute, value(index))
+    return workspace
+
+
+def build_full_copies(count):
+    """The same scenarios with a full copy of every component each, as separate budgets would hold them."""
+    base = base_components()
+    scenarios = {"Base": base}
+    for index in range(count):
+        components = dict(zip(('monthly_net_income', 'mortgage_and_debt', 'utilities'), (copy.deepcopy(c) for c in base)))
+        component, attribute, value = CHANGES[index % len(CHANGES)]
+        setattr(components[component], attribute, value(index))
+        scenarios[f"Scenario {index + 1}"] = tuple(components.values())
+    return scenarios
+
+
+def allocated(build, count):
+    """Bytes still allocated by what build returns."""
+    tracemalloc.start()
+    result = build(count)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def best_of(function, rounds=ROUNDS):
+    """Best wall time of several runs of function, in seconds."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else SCENARIOS
+
+    workspace_bytes = allocated(build_workspace, count)
+    copies_bytes = allocated(build_full_copies, count)
+    print(f"memory for {count} scenarios: full copies {copies_bytes / 1024:8.1f} KiB   "
+          f"workspace {workspace_bytes / 1024:8.1f} KiB   ({copies_bytes / workspace_bytes:4.1f}x less)")
+
+    workspace = build_workspace(count)
+    workspace.results()
+    print(f"sharing: {workspace.stats()}")
+    full_copies = build_full_copies(count)
+    step = iter(range(10 ** 9))
+
+    def recompute_all():
+        workspace.set("Scenario 1", 'mortgage_and_debt', 'rent', 900 + next(step))
+        for components in full_copies.values():
+            MonthlyBudget(*components).summary_segments()
+
+    def refresh_changed():
+        workspace.set("Scenario 1", 'mortgage_and_debt', 'rent', 900 + next(step))
+        workspace.results()
+
+    everything = best_of(recompute_all)
+    changed = best_of(refresh_changed)
+    print(f"refresh after one change: recompute all {everything * 1e3:7.2f} ms   "
+          f"workspace {changed * 1e3:7.2f} ms   speedup {everything / changed:5.1f}x")
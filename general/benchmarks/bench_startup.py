@@ -0,0 +1,101 @@
+"""
+Benchmark the launch of the V4 PyQt5 front end: time to the first paint of the
+window and time until the pie chart is ready, for the blocking startup (form,
+matplotlib and chart built before the window shows), the progressive startup
+without a session snapshot (first launch) and with one (every later launch).
+
+Every launch is a fresh interpreter, so the imports are timed cold, on the
+offscreen Qt platform. Times are measured from interpreter start.
+
+Run with: python general/benchmarks/bench_startup.py [rounds]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+GENERAL = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+MODES = ('blocking', 'progressive', 'snapshot')
+ROUNDS = 5
+
+# Launch code run in each child interpreter: argv is mode, session directory
+LAUNCH = '''
+import time
+start = time.perf_counter()
+import json
+import runpy
+import sys
+
+from PyQt5 import QtCore
+from PyQt5.QtWidgets import QApplication, QMainWindow
+
+mode, session_directory = sys.argv[1:3]
+app = QApplication(sys.argv[:1])
+times = {}
+
+
+class FirstPaint(QtCore.QObject):
+    def eventFilter(self, watched, event):
+        if event.type() == QtCore.QEvent.Paint and 'first_paint' not in times:
+            times['first_paint'] = time.perf_counter() - start
+        return False
+
+
+paint_filter = FirstPaint()
+app.installEventFilter(paint_filter)
+
+v4 = runpy.run_path('monthly_budget_V4.py', run_name='budget_v4')
+from budget_core import MonthlyNetIncome, MortgageAndDebt, SessionCache, Utilities
+
+session = SessionCache(session_directory) if mode != 'blocking' else None
+if mode == 'progressive':
+    session.clear()
+monthly_net_income = MonthlyNetIncome(
+    100300, [(11000, 0.10), (44725, 0.12), (95375, 0.22), (182100, 0.24)],
+    [(1000, 0.02), (2000, 0.04), (3000, 0.0475), (float('inf'), 0.05)], 0.032, 0.062, 1454, 8024, 0.10, 330 * 12
+)
+budget_gui = v4['BudgetGUI'](
+    monthly_net_income, MortgageAndDebt(1500, 350, 350, 300), Utilities(250, 75, 75, 75, 30, 43, 0, 0),
+    session=session, progressive=mode != 'blocking'
+)
+main_window = QMainWindow()
+main_window.setCentralWidget(budget_gui)
+main_window.resize(1000, 700)
+main_window.show()
+app.aboutToQuit.connect(budget_gui.save_session)
+
+
+def poll():
+    if 'ready' not in times and 'first_paint' in times and hasattr(budget_gui, 'budget'):
+        times['ready'] = time.perf_counter() - start
+        app.quit()
+
+
+timer = QtCore.QTimer()
+timer.timeout.connect(poll)
+timer.start(1)
+v4['run_event_loop'](app, main_window)
+del main_window, budget_gui
+print(json.dumps(times))
+'''
+
+
+def launch(mode, session_directory):
+    """Start the front end in a new interpreter and return its first paint and ready times in seconds."""
+    environment = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+    output = subprocess.run(
+        [sys.executable, '-c', LAUNCH, mode, session_directory],
+        cwd=GENERAL, env=environment, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else ROUNDS
+    with tempfile.TemporaryDirectory() as session_directory:
+        for mode in MODES:
+            launches = [launch(mode, session_directory) for _ in range(rounds)]
+            first_paint = min(times['first_paint'] for times in launches)
+            ready = min(times['ready'] for times in launches)
+            print(f"{mode:>12}: first paint {first_paint * 1e3:7.1f} ms   chart ready {ready * 1e3:7.1f} ms")
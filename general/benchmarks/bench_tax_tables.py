@@ -0,0 +1,54 @@
+"""
+Benchmark the tax table registry on a nationwide population: every household
+is placed in a random one of the 50 states or DC and a random filing status,
+its brackets are looked up in the registry and the net income of each group
+of households sharing brackets is computed at once. Checks that each table file is read once
+and each table parsed once, however many households use it.
+
+Run with: python general/benchmarks/bench_tax_tables.py [households]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from budget_core import FILING_STATUSES, MonthlyNetIncome, TaxTableRegistry
+
+YEAR = 2024
+
+if __name__ == '__main__':
+    households = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    registry = TaxTableRegistry()
+    states = registry.jurisdictions(YEAR, 'state')
+    rng = np.random.default_rng(0)
+    salaries = np.round(rng.uniform(20000, 300000, households), 2)
+    state_index = rng.integers(len(states), size=households)
+    status_index = rng.integers(len(FILING_STATUSES), size=households)
+
+    start = time.perf_counter()
+    lookups = 0
+    net_income = np.empty(households)
+    for state_number, state in enumerate(states):
+        for status_number, filing_status in enumerate(FILING_STATUSES):
+            indexes = np.flatnonzero((state_index == state_number) & (status_index == status_number))
+            if len(indexes) == 0:
+                continue
+            # One lookup per household, as a service answering them one by one would do
+            for _ in range(len(indexes)):
+                federal_tax_brackets = registry.federal(YEAR, filing_status)
+                state_tax_brackets = registry.state(YEAR, state, filing_status)
+            lookups += 2 * len(indexes)
+            income = MonthlyNetIncome(salaries[indexes], federal_tax_brackets, state_tax_brackets, 0.0, 0.062, 1454, 8024, 0.10, 3960)
+            net_income[indexes] = income.calculate_net_monthly_income()
+    elapsed = time.perf_counter() - start
+
+    stats = registry.stats()
+    print(f"{households:,} households in {len(states)} states x {len(FILING_STATUSES)} filing statuses")
+    print(f"  {lookups:,} table lookups and net income in {elapsed:.2f} s")
+    print(f"  files loaded: {stats['files_loaded']}, tables parsed: {stats['tables_parsed']}")
+    print(f"  mean net monthly income: {net_income.mean():,.2f}")
+    assert stats['files_loaded'] == 2, "a table file was read more than once"
+    assert stats['tables_parsed'] <= len(FILING_STATUSES) * (len(states) + 1), "a table was parsed more than once"
@@ -0,0 +1,76 @@
+"""
+Benchmark the history chart: draw and pan through a long history with the
+level-of-detail lines against plain Matplotlib lines holding every point.
+
+Run with: python general/benchmarks/bench_timeseries.py [points]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import numpy as np
+
+from budget_core import SUMMARY_LABELS
+from budget_core.timeseries_chart import TimeSeriesChart
+
+PANS = 20
+
+
+def make_series(points):
+    """Noisy daily series for the four summary slices, starting in 2000."""
+    rng = np.random.default_rng(0)
+    x = np.arange(points, dtype=float) + 10957  # Days since 1970, so day 0 is 2000-01-01
+    base = (1300, 2500, 550, 2600)
+    return x, [level + np.cumsum(rng.normal(0, 5, points)) for level in base]
+
+
+def time_pans(figure, ax, x):
+    """Average seconds to redraw after panning across the first half of the data."""
+    canvas = figure.canvas
+    width = (x[-1] - x[0]) / 2
+    start = time.perf_counter()
+    for step in range(PANS):
+        offset = x[0] + step * width / PANS
+        ax.set_xlim(offset, offset + width)
+        canvas.draw()
+    return (time.perf_counter() - start) / PANS
+
+
+def run_detail(x, series):
+    figure = Figure(figsize=(6, 6), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+    chart = TimeSeriesChart(ax, canvas)
+    start = time.perf_counter()
+    chart.set_data(x, series)
+    canvas.draw()
+    first = time.perf_counter() - start
+    return first, time_pans(figure, ax, x), sum(chart.visible_points())
+
+
+def run_plain(x, series):
+    figure = Figure(figsize=(6, 6), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot(111)
+    start = time.perf_counter()
+    for label, values in zip(SUMMARY_LABELS, series):
+        ax.plot(x, values, label=label)
+    ax.xaxis_date()
+    ax.legend(loc='upper left')
+    canvas.draw()
+    first = time.perf_counter() - start
+    return first, time_pans(figure, ax, x), len(x) * len(series)
+
+
+if __name__ == '__main__':
+    points = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    x, series = make_series(points)
+    for name, run in (('level of detail', run_detail), ('all points', run_plain)):
+        first, pan, drawn = run(x, series)
+        print(f"{name:>16}: first draw {first * 1e3:8.1f} ms, pan redraw {pan * 1e3:8.1f} ms, {drawn} points drawn")
@@ -0,0 +1,44 @@
+"""
+Benchmark streaming transaction ingestion: read a synthetic CSV export,
+categorize every transaction and aggregate it per month.
+
+Run with: python general/benchmarks/bench_transactions.py [number of transactions]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from budget_core.transactions import MonthlyAggregator, read_csv_transactions
+
+MERCHANTS = [
+    'APARTMENT RENT PAYMENT', 'TOYOTA FINANCIAL SVCS', 'GEICO AUTO', 'CHASE CREDIT CARD PAYMENT',
+    'SHELL OIL 5734', 'EXXONMOBIL 9921', 'BGE ELECTRIC', 'CITY WATER DEPT', 'COMCAST CABLE COMM',
+    'T-MOBILE AUTOPAY', 'SPOTIFY USA', 'NETFLIX.COM', 'SAFEWAY #1234', 'AMAZON MKTPLACE', 'PAYROLL DEPOSIT',
+]
+
+
+def write_sample(path, count):
+    """Write a CSV export with count random transactions spread over ten years."""
+    rng = random.Random(0)
+    with open(path, 'w') as file:
+        file.write('Date,Description,Amount\n')
+        for _ in range(count):
+            merchant = rng.choice(MERCHANTS)
+            amount = rng.uniform(100, 3000) if merchant == 'PAYROLL DEPOSIT' else -rng.uniform(5, 500)
+            file.write(f"{rng.randint(2016, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d},{merchant},{amount:.2f}\n")
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'transactions.csv')
+        write_sample(path, count)
+        start = time.perf_counter()
+        aggregator = MonthlyAggregator().consume(read_csv_transactions(path))
+        elapsed = time.perf_counter() - start
+    print(f"{aggregator.count} transactions over {len(aggregator.months())} months in {elapsed:.2f} s")
+    print(f"{aggregator.count / elapsed * 60 / 1e6:.1f} million transactions per minute")
@@ -0,0 +1,96 @@
+"""
+Load test the budget HTTP service: several clients send budget requests over
+keep-alive connections, then latency percentiles and throughput are reported.
+
+Without --url an in-process server is started on a free port.
+
+Run with: python general/benchmarks/load_test_service.py [--clients 8] [--requests 2000] [--batch 1] [--distinct 500]
+"""
+import argparse
+import copy
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from budget_core.service import BudgetService
+from budget_service import EXAMPLE_PROFILE, make_server
+
+
+def make_bodies(count, batch, distinct):
+    """Request bodies cycling through a fixed number of distinct profiles."""
+    bodies = []
+    for index in range(count):
+        items = []
+        for offset in range(batch):
+            profile = copy.deepcopy(EXAMPLE_PROFILE)
+            profile['income']['gross_annual_salary'] = 60000 + ((index * batch + offset) % distinct) * 100
+            items.append(profile)
+        bodies.append(json.dumps(items[0] if batch == 1 else items).encode())
+    return bodies
+
+
+def client(host, port, path, bodies, latencies):
+    """Send every body over one connection, recording each latency."""
+    connection = http.client.HTTPConnection(host, port)
+    for body in bodies:
+        start = time.perf_counter()
+        connection.request('POST', path, body, {'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}")
+        latencies.append(time.perf_counter() - start)
+    connection.close()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url', default=None, help="service to test, e.g. http://127.0.0.1:8765")
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--batch', type=int, default=1, help="profiles per request")
+    parser.add_argument('--distinct', type=int, default=500, help="number of distinct profiles")
+    parser.add_argument('--workers', type=int, default=None, help="process pool size of the in-process server")
+    args = parser.parse_args()
+
+    server = service = None
+    if args.url is None:
+        service = BudgetService(workers=args.workers)
+        server = make_server('127.0.0.1', 0, service)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+    else:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+
+    bodies = make_bodies(args.requests, args.batch, args.distinct)
+    latencies = []
+    threads = [
+        threading.Thread(target=client, args=(host, port, '/budget', bodies[index::args.clients], latencies))
+        for index in range(args.clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(latencies)} requests of {args.batch} profiles from {args.clients} clients in {elapsed:.2f} s")
+    print(f"p50 {percentile(latencies, 0.50) * 1e3:.2f} ms, p99 {percentile(latencies, 0.99) * 1e3:.2f} ms, "
+          f"{len(latencies) / elapsed:.0f} requests/s, {len(latencies) * args.batch / elapsed:.0f} profiles/s")
+    if server is not None:
+        print(f"Cache: {service.stats()}")
+        server.shutdown()
+        service.close()
@@ -0,0 +1,34 @@
+"""
+Command-line batch runner: compute the budgets or loan schedules of a JSON Lines file of profiles.
+
+Each input line is one profile in the budget service layout (see budget_service.py), and each
+output line is its result, in the same order. Work is sharded across worker processes and
+checkpointed next to the output, so an interrupted run picks up where it stopped when rerun
+with the same arguments.
+
+Run with: python general/budget_cli.py budget households.jsonl budgets.jsonl [--workers N] [--chunk-size 1000]
+"""
+import argparse
+import sys
+
+from budget_core.runner import run_batch
+from budget_core.service import COMPUTATIONS
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compute budgets or loan schedules for a file of profiles")
+    parser.add_argument('kind', choices=sorted(COMPUTATIONS), help="what each input line describes")
+    parser.add_argument('input', help="JSON Lines file, one profile per line")
+    parser.add_argument('output', help="JSON Lines file to write, one result per line")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes (default is one per CPU)")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="profiles per work item and checkpoint")
+    parser.add_argument('--quiet', action='store_true', help="do not report progress")
+    args = parser.parse_args()
+
+    try:
+        computed = run_batch(args.input, args.output, args.kind, args.workers, args.chunk_size, not args.quiet)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not args.quiet:
+        print(f"Computed {computed:,} profiles into {args.output}", file=sys.stderr)
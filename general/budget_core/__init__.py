@@ -0,0 +1,53 @@
+"""
+Shared computation core for the monthly budget scripts.
+
+The V1 console script, the V2/V3 Tkinter front ends and the V4 PyQt5 front end
+all import their budget classes from here so the numbers only live in one place.
+
+Only the budget classes are imported with the package. Everything else (the
+history database, the HTTP service, the batch runners, the optimizers...) is
+imported the first time one of its names is used, so the front ends do not pay
+for sqlite3, asyncio or multiprocessing at startup.
+"""
+import importlib
+
+from .budget import MonthlyBudget, SUMMARY_LABELS
+from .expenses import ItemizedExpenses, MortgageAndDebt, Utilities
+from .form import FORM_LABELS, parse_form
+from .income import MonthlyNetIncome, calculate_bracket_tax, compile_brackets
+from .instrumentation import Instrumentation, enable_from_environment, instrument_classes, instrumentation
+from .ledger import FREQUENCIES, PERIODS, ExpenseLedger, payments_per_year
+
+# Submodule -> names imported from it on first use
+_LAZY_MODULES = {
+    'transactions': ('Categorizer', 'MonthlyAggregator', 'read_csv_transactions', 'read_ofx_transactions'),
+    'rules': ('RULE_KINDS', 'RuleEngine'),
+    'storage': ('BudgetHistory', 'default_history_path', 'snapshot_row'),
+    'downsample': ('LevelOfDetail', 'minmax_decimate'),
+    'amortization': ('LoanSchedule', 'amortize', 'loan_schedule', 'loan_schedule_columns', 'monthly_payment'),
+    'service': ('BudgetService', 'canonical_key', 'compute_budget', 'compute_loan'),
+    'batch': ('budget_batch',),
+    'async_batch': ('compute_budget_list', 'compute_budgets'),
+    'runner': ('run_batch',),
+    'cents': ('MonthlyNetIncomeCents', 'bracket_tax_cents', 'loan_schedule_cents', 'to_cents', 'to_dollars'),
+    'tax_registry': ('FILING_STATUSES', 'TaxTableRegistry', 'tax_tables'),
+    'optimizer': ('ALLOCATION_LABELS', 'debts_from_budget', 'optimize_allocations', 'optimize_household', 'project_fixed_split'),
+    'payoff': ('STRATEGIES', 'compare_strategies', 'simulate_payoff'),
+    'loan_report': ('REPORT_COLUMNS', 'LoanComparison'),
+    'session_cache': ('SessionCache', 'default_session_path', 'inputs_key'),
+    'scenarios': ('COMPARISON_ROWS', 'COMPONENTS', 'ScenarioWorkspace'),
+}
+_LAZY_EXPORTS = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+
+def __getattr__(name):
+    # Import the submodule of a lazy name and keep the name, so later lookups skip this function
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(f'.{module}', __name__), name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,303 @@
+"""
+Loan amortization schedules, shared by the vehicle loan script and the budget service.
+
+Schedules come as a LoanSchedule of NumPy columns. pandas is only imported when
+a caller asks for a DataFrame, so sweeps that only need the payoff month or the
+total interest never pay for it.
+"""
+import math
+
+import numpy as np
+
+SCHEDULE_COLUMNS = ('Month', 'Payment', 'Principal Payment', 'Interest Payment', 'Remaining Balance')
+
+
+class LoanSchedule:
+    def __init__(self, month, payment, principal_payment, interest_payment, remaining_balance):
+        """
+        Initialize the LoanSchedule, one NumPy array per column of SCHEDULE_COLUMNS.
+
+        :param month: Month numbers
+        :param payment: Total payment of each month
+        :param principal_payment: Part of each payment going to principal
+        :param interest_payment: Part of each payment going to interest
+        :param remaining_balance: Balance at the end of each month
+        """
+        self.month = month
+        self.payment = payment
+        self.principal_payment = principal_payment
+        self.interest_payment = interest_payment
+        self.remaining_balance = remaining_balance
+        self._dataframe = None
+
+    def __len__(self):
+        return len(self.month)
+
+    @property
+    def payoff_month(self):
+        """Last month of the schedule."""
+        return int(self.month[-1]) if len(self.month) else 0
+
+    @property
+    def total_interest(self):
+        """Interest paid over the whole schedule, in the units of the columns (dollars, or cents for int64 columns)."""
+        return self.interest_payment.sum().item()
+
+    @property
+    def total_paid(self):
+        """Everything paid over the whole schedule, in the units of the columns."""
+        return self.payment.sum().item()
+
+    def columns(self):
+        """
+        Columns of the schedule by name.
+
+        :return: Dictionary of SCHEDULE_COLUMNS name to NumPy array
+        """
+        return dict(zip(SCHEDULE_COLUMNS, (
+            self.month, self.payment, self.principal_payment, self.interest_payment, self.remaining_balance
+        )))
+
+    def to_records(self):
+        """
+        Rows of the schedule, as loan_schedule returns them.
+
+        :return: List of dictionaries keyed by SCHEDULE_COLUMNS
+        """
+        columns = self.columns()
+        return [dict(zip(SCHEDULE_COLUMNS, row)) for row in zip(*(columns[name].tolist() for name in SCHEDULE_COLUMNS))]
+
+    def to_dataframe(self):
+        """
+        Schedule as a pandas DataFrame, built (and pandas imported) on the first call only.
+
+        :return: DataFrame with the SCHEDULE_COLUMNS columns
+        """
+        if self._dataframe is None:
+            import pandas as pd
+            self._dataframe = pd.DataFrame(self.columns(), columns=list(SCHEDULE_COLUMNS))
+        return self._dataframe
+
+
+def monthly_payment(principal, annual_rate, n_payments):
+    """
+    Calculate the fixed monthly payment of a loan, like numpy_financial.pmt.
+
+    :param principal: Loan amount
+    :param annual_rate: Annual interest rate as a decimal
+    :param n_payments: Number of monthly payments
+    :return: Monthly payment
+    """
+    monthly_rate = annual_rate / 12
+    if monthly_rate == 0:
+        return principal / n_payments
+    return principal * monthly_rate / (1 - (1 + monthly_rate) ** -n_payments)
+
+
+def loan_schedule(principal, annual_rate, years, extra_payment=0):
+    """
+    Calculate the month-by-month schedule of a loan, optionally paying extra principal each month.
+
+    :param principal: Loan amount
+    :param annual_rate: Annual interest rate as a decimal
+    :param years: Loan term in years
+    :param extra_payment: Extra monthly payment towards principal
+    :return: List of dictionaries with the Month, Payment, Principal Payment, Interest Payment and Remaining Balance
+    """
+    monthly_rate = annual_rate / 12
+    n_payments = years * 12
+    payment = monthly_payment(principal, annual_rate, n_payments)
+
+    balance = principal
+    schedule = []
+
+    for i in range(1, n_payments + 1):
+        interest = balance * monthly_rate
+        principal_payment = payment - interest
+        if extra_payment > 0:
+            principal_payment += extra_payment
+        balance -= principal_payment
+
+        schedule.append({
+            'Month': i,
+            'Payment': payment + extra_payment,
+            'Principal Payment': principal_payment,
+            'Interest Payment': interest,
+            'Remaining Balance': balance
+        })
+
+        if balance <= 0:
+            break
+
+    return schedule
+
+
+def loan_schedule_columns(principal, annual_rate, years, extra_payment=0):
+    """
+    Calculate the same schedule as loan_schedule as NumPy columns, in closed form instead of month by month.
+
+    :param principal: Loan amount
+    :param annual_rate: Annual interest rate as a decimal
+    :param years: Loan term in years
+    :param extra_payment: Extra monthly payment towards principal
+    :return: Instance of LoanSchedule
+    """
+    monthly_rate = annual_rate / 12
+    n_payments = years * 12
+    payment = monthly_payment(principal, annual_rate, n_payments) + extra_payment
+
+    # Like loan_schedule, stop at the first month the balance reaches 0, even if it overshoots
+    months = min(n_payments, _payments_to_clear(principal, monthly_rate, payment))
+    balances = _balance_after(principal, monthly_rate, payment, np.arange(months + 1))
+    interest = balances[:-1] * monthly_rate
+    return LoanSchedule(
+        np.arange(1, months + 1),
+        np.full(months, float(payment)),
+        payment - interest,
+        interest,
+        balances[1:]
+    )
+
+
+def _monthly_rates(annual_rates, n_payments):
+    """Monthly rate of every month from one annual rate, one per month, or {month: annual rate} resets."""
+    if isinstance(annual_rates, dict):
+        if 1 not in annual_rates:
+            raise ValueError("The rate resets must include month 1")
+        rates = np.empty(n_payments)
+        for month in sorted(annual_rates):
+            rates[month - 1:] = annual_rates[month]
+    else:
+        rates = np.broadcast_to(np.asarray(annual_rates, dtype=float), (n_payments,))
+    return rates / 12
+
+
+def _payments_to_clear(balance, rate, payment):
+    """Number of payments of a fixed amount that clear a balance (closed form), or infinity if they never do."""
+    if balance <= 0:
+        return 0
+    if rate == 0:
+        return math.ceil(balance / payment - 1e-9) if payment > 0 else math.inf
+    if payment <= balance * rate:
+        return math.inf
+    return max(1, math.ceil(-math.log(1 - balance * rate / payment) / math.log1p(rate) - 1e-9))
+
+
+def _balance_after(balance, rate, payment, months):
+    """Balance after a number of fixed payments (closed form); months may be a NumPy array."""
+    if rate == 0:
+        return balance - payment * months
+    return (balance - payment / rate) * (1 + rate) ** months + payment / rate
+
+
+def amortize(principal, annual_rates, n_payments, extra_payments=None, skipped_months=(), include_schedule=True):
+    """
+    Amortize a loan whose rate changes over time, with irregular extra payments and skipped months.
+
+    The months are split into segments at every change point (rate reset, extra payment, skipped
+    month) and each segment is computed in closed form, so the cost grows with the number of changes
+    rather than the number of months; the month-by-month schedule, if requested, is built from the
+    same closed forms one segment of columns at a time. The payment is
+    recomputed over the remaining term at the start, at every rate reset and after a skipped month;
+    extra payments keep the payment and shorten the term. The last month of the term pays whatever is left.
+
+    :param principal: Loan amount
+    :param annual_rates: Annual interest rate as a decimal, one rate per month, or {month: rate} resets from month 1
+    :param n_payments: Number of monthly payments in the term
+    :param extra_payments: Dictionary of month to extra payment towards principal, e.g. lump sums
+    :param skipped_months: Months without a payment, whose interest is added to the balance
+    :param include_schedule: Also build the month-by-month schedule
+    :return: Dictionary with payment (the first regular payment), months, total_interest, total_paid,
+             remaining_balance, segments and schedule (LoanSchedule, or None)
+    """
+    rates = _monthly_rates(annual_rates, n_payments)
+    extra_payments = {month: amount for month, amount in (extra_payments or {}).items() if 1 <= month <= n_payments}
+    skipped_months = {month for month in skipped_months if 1 <= month <= n_payments}
+    resets = {1} | {int(month) + 2 for month in np.flatnonzero(rates[1:] != rates[:-1])}
+    change_points = sorted(
+        resets | set(extra_payments) | skipped_months | {month + 1 for month in skipped_months if month < n_payments}
+    )
+
+    # Pieces of the schedule columns (month, payment, interest, balance), one per segment or single month
+    pieces = [] if include_schedule else None
+    balance = float(principal)
+    payment = first_payment = None
+    total_interest = total_paid = 0.0
+    month = 0
+
+    def record(month, paid, interest, balance):
+        pieces.append(([month], [paid], [interest], [balance]))
+
+    for index, start in enumerate(change_points):
+        end = change_points[index + 1] - 1 if index + 1 < len(change_points) else n_payments
+        rate = rates[start - 1]
+        month = start
+
+        if start in skipped_months:
+            interest = balance * rate
+            balance += interest
+            total_interest += interest
+            if pieces is not None:
+                record(month, 0.0, interest, balance)
+            continue
+        if start in resets or start - 1 in skipped_months or payment is None:
+            payment = monthly_payment(balance, rate * 12, n_payments - start + 1)
+            if first_payment is None:
+                first_payment = payment
+
+        extra = extra_payments.get(start, 0)
+        if extra:
+            # The month of an extra payment is computed on its own
+            interest = balance * rate
+            paid = min(payment + extra, balance + interest)
+            balance += interest - paid
+            total_interest += interest
+            total_paid += paid
+            if pieces is not None:
+                record(month, paid, interest, balance)
+            if balance <= 0.005 or month == n_payments:
+                break
+            month += 1
+            if month > end:
+                continue
+
+        # Full payments before the one that clears the balance; the last month of the term always clears it
+        months = end - month + 1
+        regular = min(_payments_to_clear(balance, rate, payment) - 1, months - 1 if end == n_payments else months)
+        if regular > 0:
+            new_balance = _balance_after(balance, rate, payment, regular)
+            total_interest += regular * payment - (balance - new_balance)
+            total_paid += regular * payment
+            if pieces is not None:
+                balances = _balance_after(balance, rate, payment, np.arange(regular + 1))
+                pieces.append((
+                    np.arange(month, month + regular), np.full(regular, payment), balances[:-1] * rate, balances[1:]
+                ))
+            balance = new_balance
+            month += regular
+        if regular < months:
+            # Final payment clears what is left
+            interest = balance * rate
+            total_interest += interest
+            total_paid += balance + interest
+            if pieces is not None:
+                record(month, balance + interest, interest, 0.0)
+            balance = 0.0
+            break
+        month = end
+
+    schedule = None
+    if pieces is not None:
+        months, paid, interest, balances = (
+            np.concatenate([piece[column] for piece in pieces]) if pieces else np.empty(0) for column in range(4)
+        )
+        schedule = LoanSchedule(months.astype(int), paid, paid - interest, interest, balances)
+    return {
+        'payment': first_payment,
+        'months': month,
+        'total_interest': total_interest,
+        'total_paid': total_paid,
+        'remaining_balance': balance,
+        'segments': len(change_points),
+        'schedule': schedule,
+    }
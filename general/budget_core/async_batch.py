@@ -0,0 +1,121 @@
+"""
+Asyncio front end to the vectorized budget batch computation.
+
+Profiles arrive from an async iterator, typically fed by slow I/O. They are
+grouped into micro-batches, each batch is computed by budget_batch in an
+executor, and results come back in input order. A semaphore bounds the batches
+in flight and provides backpressure: a batch only starts computing once it
+holds a slot, and the source is not read while the reader waits for one, so
+memory stays bounded whatever the speeds of the source and the consumer.
+"""
+import asyncio
+from functools import partial
+
+from .batch import budget_batch
+
+_DONE = object()
+
+
+class _Batcher:
+    def __init__(self, queue, slots, loop, executor, batch_size, linger, period):
+        """
+        Group profiles into micro-batches and start computing each one as soon as it is formed.
+
+        :param queue: asyncio.Queue receiving the futures of the batches, in order
+        :param slots: asyncio.Semaphore with one slot per batch computing or waiting to be consumed
+        :param loop: Running event loop
+        :param executor: concurrent.futures executor for the computation, or None
+        :param batch_size: Largest number of profiles per micro-batch
+        :param linger: Seconds without a new profile after which a partial batch is sent
+        :param period: Name from ledger.PERIODS for the profiles without a "period"
+        """
+        self.queue = queue
+        self.slots = slots
+        self.loop = loop
+        self.executor = executor
+        self.batch_size = batch_size
+        self.linger = linger
+        self.period = period
+        self.batch = []
+        self.last_added = 0.0
+        self._put_lock = asyncio.Lock()  # Keeps the reader and the watchdog queueing in batch order
+
+    async def read(self, profiles):
+        """Read every profile; blocks while every slot is taken, which stops reading from the source."""
+        watchdog = asyncio.ensure_future(self._watch())
+        try:
+            async for profile in profiles:
+                self.batch.append(profile)
+                self.last_added = self.loop.time()
+                if len(self.batch) >= self.batch_size:
+                    await self.flush()
+            await self.flush()
+            await self._put(_DONE)
+        except Exception as e:
+            await self._put(e)
+        finally:
+            watchdog.cancel()
+
+    async def _watch(self):
+        """Send a partial batch once the source has been quiet for the linger time."""
+        while True:
+            await asyncio.sleep(self.linger)
+            if self.batch and self.loop.time() - self.last_added >= self.linger:
+                await self.flush()
+
+    async def flush(self):
+        """Wait for a slot, then start computing the current batch and queue its future."""
+        if not self.batch:
+            return
+        batch, self.batch = self.batch, []
+        async with self._put_lock:
+            await self.slots.acquire()
+            self.queue.put_nowait(self.loop.run_in_executor(self.executor, partial(budget_batch, batch, self.period)))
+
+    async def _put(self, item):
+        async with self._put_lock:
+            self.queue.put_nowait(item)
+
+
+async def compute_budgets(profiles, batch_size=256, max_pending=4, linger=0.01, executor=None, period='monthly'):
+    """
+    Compute the budget of every profile from an async iterator.
+
+    :param profiles: Async iterable of profile dictionaries (see batch.budget_batch)
+    :param batch_size: Largest number of profiles per micro-batch
+    :param max_pending: Largest number of batches computing or waiting to be consumed
+    :param linger: Seconds to wait for more profiles before sending a partial batch
+    :param executor: concurrent.futures executor for the computation (default is the loop's thread pool)
+    :param period: Name from ledger.PERIODS for the profiles without a "period" (default is monthly)
+    :return: Async generator of result dictionaries, in input order
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    slots = asyncio.Semaphore(max_pending)
+    batcher = _Batcher(queue, slots, loop, executor, batch_size, linger, period)
+    producer = asyncio.ensure_future(batcher.read(profiles))
+    try:
+        while True:
+            pending = await queue.get()
+            if pending is _DONE:
+                break
+            if isinstance(pending, Exception):
+                raise pending
+            for result in await pending:
+                yield result
+            slots.release()
+    finally:
+        producer.cancel()
+        # Let the producer finish cancelling so the source iterator is not left running
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+async def compute_budget_list(profiles, **options):
+    """
+    Compute the budgets of an async iterable of profiles into a list.
+
+    :param profiles: Async iterable of profile dictionaries
+    :param options: Keyword arguments of compute_budgets
+    :return: List of result dictionaries, in input order
+    """
+    return [result async for result in compute_budgets(profiles, **options)]
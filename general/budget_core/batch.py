@@ -0,0 +1,111 @@
+"""
+Vectorized budget summaries for many households at once.
+
+Profiles use the same JSON layout as the budget service. Households that
+share tax brackets are computed together by one MonthlyNetIncome holding NumPy
+arrays, so the cost per household is a few array operations instead of a full
+object graph.
+"""
+import numpy as np
+
+from .budget import SUMMARY_LABELS, TAX_LABELS, tax_figures
+from .expenses import MortgageAndDebt, Utilities
+from .income import MonthlyNetIncome
+from .ledger import payments_per_year
+from .service import INCOME_FIELDS, PAYROLL_FIELDS, PRE_TAX_FIELDS
+from .tax_registry import tax_tables
+
+# The fields of MonthlyNetIncome that are plain numbers
+NUMERIC_INCOME_FIELDS = tuple(field for field in INCOME_FIELDS if not field.endswith('_brackets'))
+# Line items that may be left out of a profile, as in the Utilities constructor
+OPTIONAL_ITEMS = ('cable', 'landline')
+
+
+def _line_items(items, extra_items, expense_class):
+    """Monthly amount of each line item of one expense group of a profile, labelled and ordered like its ledger breakdown."""
+    fields = {attribute for attribute, _ in expense_class.FIELDS}
+    unknown = set(items) - fields
+    if unknown:
+        raise TypeError(f"Unknown {expense_class.__name__} items: {sorted(unknown)}")
+    missing = fields - set(items) - set(OPTIONAL_ITEMS)
+    if missing:
+        raise KeyError(sorted(missing)[0])
+    amounts = {label: float(items.get(attribute, 0)) for attribute, label in expense_class.FIELDS}
+    for label, amount in extra_items:
+        amounts[label] = amounts.get(label, 0.0) + amount
+    return amounts
+
+
+def budget_batch(profiles, period='monthly'):
+    """
+    Compute the budgets of many households, with the same results as service.compute_budget.
+
+    :param profiles: List of profile dictionaries ("income", "mortgage_and_debt", "utilities", optional
+                     "extra_items" and optional "period")
+    :param period: Name from ledger.PERIODS for the profiles without a "period" (default is monthly)
+    :return: List of dictionaries with the period, net income, leftover and free money, summary and breakdowns
+    """
+    count = len(profiles)
+    if count == 0:
+        return []
+
+    periods = [profile.get('period', period) for profile in profiles]
+    expenses = []  # (debt line items, utility line items) of each profile
+    groups = {}  # (federal, state, Social Security, Medicare brackets) -> indexes of the profiles using them
+    incomes = [tax_tables.resolve_income(profile['income']) for profile in profiles]
+    for index, profile in enumerate(profiles):
+        extra_items = profile.get('extra_items', {})
+        expenses.append((
+            _line_items(profile['mortgage_and_debt'], extra_items.get('mortgage_and_debt', ()), MortgageAndDebt),
+            _line_items(profile['utilities'], extra_items.get('utilities', ()), Utilities)
+        ))
+        income = incomes[index]
+        key = tuple(
+            None if income.get(field) is None else tuple(tuple(bracket) for bracket in income[field])
+            for field in ('federal_tax_brackets', 'state_tax_brackets') + PAYROLL_FIELDS
+        )
+        groups.setdefault(key, []).append(index)
+    columns = {
+        field: np.array([income[field] for income in incomes], dtype=float)
+        for field in NUMERIC_INCOME_FIELDS
+    }
+    for field in PRE_TAX_FIELDS:
+        columns[field] = np.array([income.get(field, 0) for income in incomes], dtype=float)
+
+    taxes = np.empty((len(TAX_LABELS), count))
+    net_annual_income = np.empty(count)
+    for (federal_tax_brackets, state_tax_brackets, *payroll_brackets), indexes in groups.items():
+        indexes = np.array(indexes)
+        monthly_net_income = MonthlyNetIncome(
+            columns['gross_annual_salary'][indexes],
+            federal_tax_brackets,
+            state_tax_brackets,
+            *(columns[field][indexes] for field in NUMERIC_INCOME_FIELDS[1:]),
+            *payroll_brackets,
+            *(columns[field][indexes] for field in PRE_TAX_FIELDS)
+        )
+        tax_sizes, net_annual_income[indexes] = tax_figures(monthly_net_income)
+        taxes[:, indexes] = tax_sizes
+
+    retirement = columns['retirement_contribution_annual']
+    results = []
+    for index, ((debt, utilities), tax_sizes) in enumerate(zip(expenses, taxes.T.tolist())):
+        per_year = payments_per_year(periods[index])
+        annual_debt = 12 * sum(debt.values())
+        annual_utilities = 12 * sum(utilities.values())
+        leftover = float(net_annual_income[index]) - annual_debt - annual_utilities
+        free_money = leftover + float(retirement[index])
+        results.append({
+            'period': periods[index],
+            'net_income': float(net_annual_income[index]) / per_year,
+            'leftover_money': leftover / per_year,
+            'free_money': free_money / per_year,
+            'summary': dict(zip(SUMMARY_LABELS, (sum(tax_sizes) / per_year, annual_debt / per_year, annual_utilities / per_year, free_money / per_year))),
+            'breakdowns': {
+                'Taxes': {label: size / per_year for label, size in zip(TAX_LABELS, tax_sizes)},
+                'Mortgage and Debt': {label: 12 * amount / per_year for label, amount in debt.items()},
+                'Utilities': {label: 12 * amount / per_year for label, amount in utilities.items()},
+                'Free Money': {'Leftover': leftover / per_year, 'Retirement Funding': float(retirement[index]) / per_year},
+            },
+        })
+    return results
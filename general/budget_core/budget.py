@@ -0,0 +1,134 @@
+from .ledger import payments_per_year
+
+SUMMARY_LABELS = ['Taxes', 'Mortgage and Debt', 'Utilities', 'Free Money']
+TAX_LABELS = ['Federal Tax', 'State Tax', 'Local Tax', 'FICA', 'Medicare']
+
+
+def tax_figures(monthly_net_income):
+    """
+    Compute the annual amount of every tax and the net annual income.
+
+    Works on a MonthlyNetIncome holding numbers or NumPy arrays.
+
+    :param monthly_net_income: Instance of MonthlyNetIncome
+    :return: Tuple of (tax sizes in TAX_LABELS order, net annual income)
+    """
+    income = monthly_net_income
+    stages = income.calculate_deduction_stages()
+    tax_sizes = [
+        stages['federal_tax'],
+        stages['state_tax'],
+        stages['local_tax'],
+        stages['fica'],
+        stages['medicare_tax'] + income.medicare_annual_cost
+    ]
+    net_annual_income = income.gross_annual_salary - (
+        sum(tax_sizes) +
+        income.pre_tax_deductions_annual +
+        income.retirement_contribution_annual +
+        income.calculate_savings() +
+        income.car_insurance_annual_cost
+    )
+    return tax_sizes, net_annual_income
+
+
+class MonthlyBudget:
+    def __init__(self, monthly_net_income, mortgage_and_debt, utilities):
+        """
+        Initialize the MonthlyBudget with necessary parameters.
+
+        :param monthly_net_income: Instance of MonthlyNetIncome
+        :param mortgage_and_debt: Instance of MortgageAndDebt
+        :param utilities: Instance of Utilities
+        """
+        self.monthly_net_income = monthly_net_income
+        self.mortgage_and_debt = mortgage_and_debt
+        self.utilities = utilities
+        self._annual_figures = None
+
+    def calculate_leftover_money(self):
+        """
+        Calculate the leftover money after all monthly deductions.
+
+        :return: Leftover money after all deductions
+        """
+        total_monthly_debt = self.mortgage_and_debt.calculate_total_monthly_debt()
+        total_monthly_utilities = self.utilities.calculate_total_monthly_utilities()
+        net_monthly_income = self.monthly_net_income.calculate_net_monthly_income()
+        leftover_money = net_monthly_income - total_monthly_debt - total_monthly_utilities
+        return leftover_money
+
+    def calculate_free_money(self):
+        """
+        Calculate the free money: leftover money plus the monthly retirement contribution.
+
+        :return: Monthly free money
+        """
+        return self.calculate_leftover_money() + (self.monthly_net_income.retirement_contribution_annual / 12)
+
+    def annual_figures(self):
+        """
+        Compute the annual amount of every pie slice and breakdown item.
+
+        Taxes are calculated once, on first use, and every period view is derived
+        from the result, so switching period never recomputes them. Create a new
+        MonthlyBudget after changing the inputs.
+
+        :return: Tuple of (summary sizes, breakdowns); breakdowns maps each summary label to (labels, sizes)
+        """
+        if self._annual_figures is None:
+            income = self.monthly_net_income
+            tax_sizes, net_annual_income = tax_figures(income)
+            total_taxes = sum(tax_sizes)
+
+            debt_labels, debt_sizes = self.mortgage_and_debt.breakdown()
+            utility_labels, utility_sizes = self.utilities.breakdown()
+            annual_debt = self.mortgage_and_debt.calculate_total() * 12
+            annual_utilities = self.utilities.calculate_total() * 12
+            leftover = net_annual_income - annual_debt - annual_utilities
+
+            summary = [total_taxes, annual_debt, annual_utilities, leftover + income.retirement_contribution_annual]
+            breakdowns = {
+                'Taxes': (TAX_LABELS.copy(), tax_sizes),
+                'Mortgage and Debt': (debt_labels, [size * 12 for size in debt_sizes]),
+                'Utilities': (utility_labels, [size * 12 for size in utility_sizes]),
+                'Free Money': (['Leftover', 'Retirement Funding'], [leftover, income.retirement_contribution_annual]),
+            }
+            self._annual_figures = summary, breakdowns
+        return self._annual_figures
+
+    def summary_segments(self, period='monthly'):
+        """
+        Build the labels and sizes of the top-level pie chart.
+
+        :param period: Name from ledger.PERIODS, e.g. "weekly" or "annual" (default is monthly)
+        :return: Tuple of (labels, sizes) lists
+        """
+        per_year = payments_per_year(period)
+        summary, _ = self.annual_figures()
+        return SUMMARY_LABELS.copy(), [size / per_year for size in summary]
+
+    def breakdown_segments(self, label, period='monthly'):
+        """
+        Build the labels and sizes that a top-level pie slice expands into.
+
+        :param label: One of the summary labels
+        :param period: Name from ledger.PERIODS, e.g. "weekly" or "annual" (default is monthly)
+        :return: Tuple of (labels, sizes) lists, or None if the slice has no breakdown
+        """
+        _, breakdowns = self.annual_figures()
+        if label not in breakdowns:
+            return None
+        per_year = payments_per_year(period)
+        labels, sizes = breakdowns[label]
+        return labels.copy(), [size / per_year for size in sizes]
+
+    def print_budget_summary(self):
+        """
+        Print a summary of the budget calculations.
+        """
+        print("=" * 59)
+        print("=" * 21 + " Leftover Money " + "=" * 22)
+        print("=" * 59)
+        print(f"Leftover Money after all deductions: ${self.calculate_leftover_money():.2f}")
+        print("\n")
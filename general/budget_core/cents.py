@@ -0,0 +1,319 @@
+"""
+Exact integer-cents money for taxes and loan schedules.
+
+Amounts are whole cents (Python ints for one household, int64 NumPy arrays for
+many) and rates are whole millionths, so every sum is exact and every result
+is reproducible to the penny. Rounding only happens where money changes hands
+(one tax per bracket set, one interest charge per month), always half up.
+
+int64 arrays hold incomes up to about $92 billion a year before overflowing.
+"""
+from functools import lru_cache
+import math
+
+import numpy as np
+
+from .amortization import LoanSchedule, monthly_payment
+
+RATE_SCALE = 1000000  # Rates are stored in millionths: 0.0475 -> 47500
+UNLIMITED_CENTS = 2 ** 62  # Stands in for an infinite top bracket limit
+
+
+def to_cents(amount):
+    """
+    Convert dollars into whole cents, rounding half away from zero.
+
+    :param amount: Dollars as a number or NumPy array
+    :return: Cents as an int, or an int64 array
+    """
+    # The tiny nudge puts amounts like 1.005, stored as 1.00499999..., on the intended side of the half
+    if isinstance(amount, int):
+        return amount * 100
+    if isinstance(amount, float):
+        cents = math.floor(abs(amount) * 100 + 0.5 + 1e-9)
+        return -cents if amount < 0 else cents
+    amount = np.asarray(amount, dtype=float)
+    return (np.sign(amount) * np.floor(np.abs(amount) * 100 + 0.5 + 1e-9)).astype(np.int64)
+
+
+def to_dollars(cents):
+    """
+    Convert cents into dollars for display.
+
+    :param cents: Cents as an int or int64 array
+    :return: Dollars as a float, or a float array
+    """
+    return cents / 100
+
+
+def rate_units(rate):
+    """
+    Convert a decimal rate into whole millionths.
+
+    :param rate: Rate as a decimal, e.g. 0.0475
+    :return: Rate in millionths as an int
+    """
+    return int(round(rate * RATE_SCALE))
+
+
+def round_div(numerator, denominator):
+    """
+    Divide whole numbers, rounding half up; works on ints and int64 arrays.
+
+    :param numerator: Int or int64 array
+    :param denominator: Positive int
+    :return: Rounded quotient of the same kind
+    """
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+@lru_cache(maxsize=64)
+def _compile_brackets_cents(brackets):
+    """
+    Turn a tuple of (limit, rate) brackets into int64 arrays of lower limits, upper limits (cents), rates
+    (millionths) and the tax owed on the income below each bracket (millionths of a cent).
+    """
+    upper_limits = np.array([to_cents(limit) if math.isfinite(limit) else UNLIMITED_CENTS for limit, _ in brackets], dtype=np.int64)
+    rates = np.array([rate_units(rate) for _, rate in brackets], dtype=np.int64)
+    lower_limits = np.concatenate(([0], upper_limits[:-1])).astype(np.int64)
+    # The top bracket may be unlimited, so it is left out of the running total
+    base_taxes = np.concatenate(([0], np.cumsum((upper_limits[:-1] - lower_limits[:-1]) * rates[:-1]))).astype(np.int64)
+    return lower_limits, upper_limits, rates, base_taxes
+
+
+def compile_brackets_cents(brackets):
+    """
+    Compile tax brackets into integer arrays, reusing the result for brackets seen before.
+
+    :param brackets: List of tuples for tax brackets (limit in dollars, rate)
+    :return: Tuple of (lower_limits, upper_limits, rates, base_taxes) int64 arrays
+    """
+    return _compile_brackets_cents(tuple((float(limit), float(rate)) for limit, rate in brackets))
+
+
+def bracket_tax_cents(income, brackets):
+    """
+    Calculate the exact tax in cents on an income (or array of incomes) in cents.
+
+    The tax of every bracket is summed in millionths of a cent and rounded once.
+
+    :param income: Annual income in cents, as an int or int64 array
+    :param brackets: List of tuples for tax brackets (limit in dollars, rate)
+    :return: Tax in cents as an int, or an int64 array with the same shape as income
+    """
+    lower_limits, upper_limits, rates, base_taxes = compile_brackets_cents(brackets)
+    if isinstance(income, (int, np.integer)):
+        # Scalar fast path in Python ints, which cannot overflow
+        income = int(income)
+        tax = 0
+        for lower, upper, rate in zip(lower_limits.tolist(), upper_limits.tolist(), rates.tolist()):
+            if income <= lower:
+                break
+            tax += (min(income, upper) - lower) * rate
+        return round_div(tax, RATE_SCALE)
+
+    # Tax on the brackets below each income's bracket, plus its rate on the part inside it
+    income = np.asarray(income, dtype=np.int64)
+    index = np.maximum(np.searchsorted(lower_limits, income) - 1, 0)
+    lower = lower_limits[index]
+    tax = base_taxes[index] + (np.clip(income, lower, upper_limits[index]) - lower) * rates[index]
+    return round_div(tax, RATE_SCALE)
+
+
+class MonthlyNetIncomeCents:
+    def __init__(self, gross_annual_salary, federal_tax_brackets, state_tax_brackets, local_tax_rate, fica_rate, medicare_annual_cost, retirement_contribution_annual, savings_rate, car_insurance_annual_cost, social_security_brackets=None, medicare_tax_brackets=None, pre_tax_deductions_annual=0, retirement_pre_tax=False):
+        """
+        Initialize the MonthlyNetIncomeCents, the exact counterpart of MonthlyNetIncome.
+
+        Takes the same arguments, in dollars, and every calculation returns whole cents.
+        Every amount may also be a NumPy array, in which case each calculation returns
+        one result per household.
+
+        :param gross_annual_salary: Annual salary before deductions
+        :param federal_tax_brackets: List of tuples for federal tax brackets (limit, rate)
+        :param state_tax_brackets: List of tuples for state tax brackets (limit, rate)
+        :param local_tax_rate: Local tax rate as a decimal
+        :param fica_rate: FICA tax rate as a decimal
+        :param medicare_annual_cost: Annual cost of Medicare
+        :param retirement_contribution_annual: Annual retirement contribution
+        :param savings_rate: Savings rate as a decimal
+        :param car_insurance_annual_cost: Annual cost of car insurance
+        :param social_security_brackets: List of tuples for Social Security tax brackets (limit, rate),
+                                         replacing the flat fica_rate (default is None, the flat rate)
+        :param medicare_tax_brackets: List of tuples for Medicare tax brackets (limit, rate)
+                                      (default is None, no Medicare tax)
+        :param pre_tax_deductions_annual: Other annual deductions taken before income taxes, e.g. health premiums
+        :param retirement_pre_tax: Whether the retirement contribution is taken before income taxes, like a 401(k)
+                                   (may be a boolean array)
+        """
+        self.gross_annual_salary = to_cents(gross_annual_salary)
+        self.federal_tax_brackets = federal_tax_brackets
+        self.state_tax_brackets = state_tax_brackets
+        self.local_tax_rate = rate_units(local_tax_rate)
+        self.fica_rate = rate_units(fica_rate)
+        self.medicare_annual_cost = to_cents(medicare_annual_cost)
+        self.retirement_contribution_annual = to_cents(retirement_contribution_annual)
+        self.savings_rate = rate_units(savings_rate)
+        self.car_insurance_annual_cost = to_cents(car_insurance_annual_cost)
+        self.social_security_brackets = social_security_brackets
+        self.medicare_tax_brackets = medicare_tax_brackets
+        self.pre_tax_deductions_annual = to_cents(pre_tax_deductions_annual)
+        self.retirement_pre_tax = retirement_pre_tax
+
+    def calculate_pre_tax_deductions(self):
+        """
+        Calculate the deductions taken before income taxes.
+
+        :return: Total pre-tax deductions in cents
+        """
+        return self.pre_tax_deductions_annual + self.retirement_contribution_annual * self.retirement_pre_tax
+
+    def calculate_taxable_income(self):
+        """
+        Calculate the income the income taxes are charged on.
+
+        :return: Gross annual salary less the pre-tax deductions, never below 0, in cents
+        """
+        taxable_income = self.gross_annual_salary - self.calculate_pre_tax_deductions()
+        return np.maximum(taxable_income, 0) if isinstance(taxable_income, np.ndarray) else max(taxable_income, 0)
+
+    def calculate_federal_tax(self):
+        """
+        Calculate the federal tax based on the given tax brackets.
+
+        :return: Total federal tax in cents
+        """
+        return bracket_tax_cents(self.calculate_taxable_income(), self.federal_tax_brackets)
+
+    def calculate_state_tax(self):
+        """
+        Calculate the state tax based on the given tax brackets.
+
+        :return: Total state tax in cents
+        """
+        return bracket_tax_cents(self.calculate_taxable_income(), self.state_tax_brackets)
+
+    def calculate_local_tax(self):
+        """
+        Calculate the local tax.
+
+        :return: Total local tax in cents
+        """
+        return round_div(self.calculate_taxable_income() * self.local_tax_rate, RATE_SCALE)
+
+    def calculate_fica(self):
+        """
+        Calculate the FICA tax.
+
+        :return: Total FICA tax in cents
+        """
+        if self.social_security_brackets is None:
+            return round_div(self.gross_annual_salary * self.fica_rate, RATE_SCALE)
+        return bracket_tax_cents(self.gross_annual_salary, self.social_security_brackets)
+
+    def calculate_medicare_tax(self):
+        """
+        Calculate the Medicare tax withheld from wages, including the additional Medicare tax.
+
+        :return: Total Medicare tax in cents
+        """
+        if self.medicare_tax_brackets is None:
+            return 0
+        return bracket_tax_cents(self.gross_annual_salary, self.medicare_tax_brackets)
+
+    def calculate_savings(self):
+        """
+        Calculate the savings amount.
+
+        :return: Total savings amount in cents
+        """
+        return round_div(self.gross_annual_salary * self.savings_rate, RATE_SCALE)
+
+    def calculate_total_taxes(self):
+        """
+        Calculate all taxes plus Medicare.
+
+        :return: Total annual taxes in cents
+        """
+        return (
+            self.calculate_federal_tax() +
+            self.calculate_state_tax() +
+            self.calculate_local_tax() +
+            self.calculate_fica() +
+            self.calculate_medicare_tax() +
+            self.medicare_annual_cost
+        )
+
+    def calculate_total_deductions(self):
+        """
+        Calculate the total deductions from the gross annual salary.
+
+        :return: Total deductions in cents
+        """
+        return (
+            self.calculate_total_taxes() +
+            self.pre_tax_deductions_annual +
+            self.retirement_contribution_annual +
+            self.calculate_savings() +
+            self.car_insurance_annual_cost
+        )
+
+    def calculate_net_annual_income(self):
+        """
+        Calculate the net annual income after all deductions.
+
+        :return: Net annual income in cents
+        """
+        return self.gross_annual_salary - self.calculate_total_deductions()
+
+    def calculate_net_monthly_income(self):
+        """
+        Calculate the net monthly income after all deductions, rounded to the cent.
+
+        :return: Net monthly income in cents
+        """
+        return round_div(self.calculate_net_annual_income(), 12)
+
+
+def loan_schedule_cents(principal, annual_rate, years, extra_payment=0):
+    """
+    Calculate the month-by-month schedule of a loan in exact cents.
+
+    The payment is rounded to the cent and interest is charged to the cent each month.
+    The last payment only covers what is left, so the balance ends at exactly zero.
+
+    Rounding the interest every month makes each balance depend on the one before, so
+    only the balances are computed month by month, in Python ints; the other columns
+    are derived from them as int64 arrays.
+
+    :param principal: Loan amount in dollars
+    :param annual_rate: Annual interest rate as a decimal
+    :param years: Loan term in years
+    :param extra_payment: Extra monthly payment towards principal, in dollars
+    :return: Instance of LoanSchedule like loan_schedule_columns, with int64 columns in cents
+    """
+    n_payments = years * 12
+    payment = to_cents(monthly_payment(principal, annual_rate, n_payments)) + to_cents(extra_payment)
+    rate = rate_units(annual_rate)
+    divisor = 12 * RATE_SCALE
+
+    balance = to_cents(principal)
+    balances = [balance]
+    # Pay the full payment, less the interest rounded half up, until a payment would clear the balance
+    while len(balances) < n_payments and balance > 0:
+        balance -= payment - (2 * balance * rate + divisor) // (2 * divisor)
+        if balance <= 0:
+            break
+        balances.append(balance)
+
+    balances = np.array(balances, dtype=np.int64)
+    interest = round_div(balances * rate, divisor)
+    # The last month pays whatever is left
+    principal_payment = np.append(balances[:-1] - balances[1:], balances[-1])
+    return LoanSchedule(
+        np.arange(1, len(balances) + 1),
+        principal_payment + interest,
+        principal_payment,
+        interest,
+        np.append(balances[1:], 0)
+    )
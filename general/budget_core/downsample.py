@@ -0,0 +1,113 @@
+"""
+Level-of-detail downsampling of long time series for line charts.
+
+A line chart never needs more than about two points per horizontal pixel, so
+each series is decimated once into a pyramid of min/max levels. Every level
+halves the previous one and keeps the minimum and maximum of each bucket in
+their original order, so spikes survive. Drawing a view only slices the level
+that fits the pixel budget, which makes panning and zooming cheap.
+"""
+import numpy as np
+
+
+def minmax_decimate(x, y, bucket):
+    """
+    Keep the minimum and maximum point of every bucket of consecutive points.
+
+    :param x: Sorted x values
+    :param y: y values, same length as x
+    :param bucket: Number of points per bucket
+    :return: Tuple of (x, y) arrays with at most two points per bucket
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if bucket <= 1 or len(y) <= 2:
+        return x, y
+
+    buckets = -(-len(y) // bucket)
+    padded = np.full(buckets * bucket, np.nan)
+    padded[:len(y)] = y
+    padded = padded.reshape(buckets, bucket)
+
+    base = np.arange(buckets) * bucket
+    return _extremes(x, y, base + np.nanargmin(padded, axis=1), base + np.nanargmax(padded, axis=1))
+
+
+def _extremes(x, y, lowest, highest):
+    """Points at the bucket extremes, the earlier one of each bucket first so the line keeps its shape."""
+    indexes = np.column_stack((np.minimum(lowest, highest), np.maximum(lowest, highest))).ravel()
+    # Drop the duplicate when a bucket's minimum and maximum are the same point
+    keep = np.ones(len(indexes), dtype=bool)
+    keep[1::2] = indexes[1::2] != indexes[0::2]
+    indexes = indexes[keep]
+    return x[indexes], y[indexes]
+
+
+def _merge_pairs(indexes, y, better):
+    """Combine the extremes of neighboring buckets into the extremes of buckets twice as large."""
+    if len(indexes) % 2:
+        indexes = np.append(indexes, indexes[-1])
+    first = indexes[0::2]
+    second = indexes[1::2]
+    return np.where(better(y[second], y[first]), second, first)
+
+
+class LevelOfDetail:
+    def __init__(self, x, y, min_points=512):
+        """
+        Build the min/max pyramid of a series.
+
+        :param x: Sorted x values
+        :param y: y values, same length as x
+        :param min_points: Stop adding levels once a level has fewer points than this
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if len(x) != len(y):
+            raise ValueError("x and y must have the same length")
+        self.levels = [(x, y)]  # Level k keeps the extremes of buckets of 2**k raw points
+
+        # Each level's extremes come from pairs of the previous level's, so building is linear
+        lowest = highest = np.arange(len(y))
+        while len(lowest) >= min_points:
+            lowest = _merge_pairs(lowest, y, np.less)
+            highest = _merge_pairs(highest, y, np.greater)
+            # Pairs keep both of their points, so level 1 is the raw series itself
+            self.levels.append(self.levels[0] if len(self.levels) == 1 else _extremes(x, y, lowest, highest))
+
+    def __len__(self):
+        return len(self.levels[0][0])
+
+    def level_for(self, start, end, max_points):
+        """
+        Pick the most detailed level that shows a range in no more than max_points points.
+
+        :param start: First x value of the range
+        :param end: Last x value of the range
+        :param max_points: Point budget, typically twice the width in pixels
+        :return: Level number
+        """
+        raw_x = self.levels[0][0]
+        visible = np.searchsorted(raw_x, end, side='right') - np.searchsorted(raw_x, start, side='left')
+        level = 0
+        # Each level has about 2 * raw / 2**level points
+        while level + 1 < len(self.levels) and 2 * visible >> level > max_points:
+            level += 1
+        return level
+
+    def view(self, start, end, max_points):
+        """
+        Points to draw for an x range.
+
+        One point beyond each end of the range is included so the line runs off the edge of the axes.
+
+        :param start: First x value of the range
+        :param end: Last x value of the range
+        :param max_points: Point budget, typically twice the width in pixels
+        :return: Tuple of (level, first index, stop index); slice levels[level] with the indexes
+        """
+        level = self.level_for(start, end, max_points)
+        x = self.levels[level][0]
+        first = max(np.searchsorted(x, start, side='left') - 1, 0)
+        stop = min(np.searchsorted(x, end, side='right') + 1, len(x))
+        return level, int(first), int(stop)
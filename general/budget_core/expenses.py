@@ -0,0 +1,237 @@
+from .ledger import ExpenseLedger, payments_per_year
+
+
+def _line_item(attribute):
+    """Property exposing one fixed line item of an ItemizedExpenses group as an attribute."""
+    def getter(self):
+        amount = self.ledger.amounts[self._items[attribute]]
+        return float(amount) if amount.ndim == 0 else amount.copy()
+
+    def setter(self, amount):
+        self.ledger.set_amount(self._items[attribute], amount)
+
+    return property(getter, setter)
+
+
+class ItemizedExpenses:
+    # Name of the ledger group and its fixed line items as (attribute, chart label) pairs
+    GROUP = None
+    FIELDS = ()
+
+    def __init__(self, ledger=None, **amounts):
+        """
+        Initialize the ItemizedExpenses with the fixed line items of the group.
+
+        :param ledger: ExpenseLedger to store the items in (default is a new one)
+        :param amounts: Monthly amount of each fixed line item, by attribute name
+        """
+        self.ledger = ledger if ledger is not None else ExpenseLedger()
+        self._items = {
+            attribute: self.ledger.add_item((self.GROUP, label), amounts[attribute])
+            for attribute, label in self.FIELDS
+        }
+
+    def __copy__(self):
+        """
+        Copy the group with its own copy of the ledger, so copy.copy never shares line items.
+
+        :return: New instance of the same class
+        """
+        duplicate = type(self).__new__(type(self))
+        duplicate.__dict__.update(self.__dict__)
+        duplicate.ledger = self.ledger.copy()
+        duplicate._items = dict(self._items)
+        return duplicate
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for attribute, _ in cls.FIELDS:
+            setattr(cls, attribute, _line_item(attribute))
+
+    def add_item(self, label, amount, frequency='monthly'):
+        """
+        Add an extra line item to the group, e.g. a second credit card or a gym membership.
+
+        :param label: Name of the line item (items with the same name are summed)
+        :param amount: Amount of each payment
+        :param frequency: Name from ledger.FREQUENCIES or payments per year (default is monthly)
+        :return: Index of the item in the ledger
+        """
+        return self.ledger.add_item((self.GROUP, label), amount, frequency)
+
+    def calculate_total(self):
+        """
+        Calculate the monthly total of every line item in the group.
+
+        :return: Monthly total
+        """
+        return self.ledger.total(self.GROUP)
+
+    def calculate_period_total(self, period='monthly'):
+        """
+        Calculate the total of every line item in the group per period.
+
+        :param period: Name from ledger.PERIODS, e.g. "weekly" or "annual" (default is monthly)
+        :return: Total per period
+        """
+        return self.calculate_total() * 12 / payments_per_year(period)
+
+    def breakdown(self):
+        """
+        Labels and monthly totals of the line items in the group.
+
+        :return: Tuple of (labels, sizes) lists
+        """
+        return self.ledger.breakdown(self.GROUP)
+
+    def extra_items(self):
+        """
+        Labels and monthly totals of the line items added with add_item, for the printed summaries.
+
+        :return: List of (label, monthly total) tuples
+        """
+        fixed_labels = {label for _, label in self.FIELDS}
+        labels, sizes = self.breakdown()
+        return [(label, size) for label, size in zip(labels, sizes) if label not in fixed_labels]
+
+
+class MortgageAndDebt(ItemizedExpenses):
+    GROUP = 'Mortgage and Debt'
+    FIELDS = (
+        ('rent', 'Rent'),
+        ('auto_payment', 'Auto Payment'),
+        ('car_insurance', 'Car Insurance'),
+        ('credit_card_payment', 'Credit Card Payment'),
+    )
+
+    def __init__(self, rent, auto_payment, car_insurance, credit_card_payment, ledger=None):
+        """
+        Initialize the MortgageAndDebt with necessary parameters.
+
+        :param rent: Monthly rent cost
+        :param auto_payment: Monthly auto payment
+        :param car_insurance: Monthly car insurance cost
+        :param credit_card_payment: Monthly credit card payment
+        :param ledger: ExpenseLedger to store the items in (default is a new one)
+        """
+        super().__init__(
+            ledger,
+            rent=rent,
+            auto_payment=auto_payment,
+            car_insurance=car_insurance,
+            credit_card_payment=credit_card_payment
+        )
+
+    def calculate_total_monthly_debt(self):
+        """
+        Calculate the total monthly debt payments.
+
+        :return: Total monthly debt payments
+        """
+        return self.calculate_total()
+
+    def print_debt_summary(self):
+        """
+        Print a summary of the monthly debt payments.
+        """
+        print("=" * 59)
+        print("=" * 26 + " Rent " + "=" * 27)
+        print("=" * 59)
+        print(f"Rent: ${self.rent:.2f}")
+        print("\n")
+
+        print("=" * 59)
+        print("=" * 24 + " Car Bills " + "=" * 24)
+        print("=" * 59)
+        print(f"Auto Payment: ${self.auto_payment:.2f}")
+        print(f"Car Insurance: ${self.car_insurance:.2f}")
+        print("\n")
+
+        print("=" * 59)
+        print("=" * 23 + " Credit Card " + "=" * 23)
+        print("=" * 59)
+        print(f"Credit Card Payment: ${self.credit_card_payment:.2f}")
+        print("\n")
+
+        extra_items = self.extra_items()
+        if extra_items:
+            print("=" * 59)
+            print("=" * 24 + " Other Debt " + "=" * 23)
+            print("=" * 59)
+            for label, size in extra_items:
+                print(f"{label}: ${size:.2f}")
+            print("\n")
+
+        print("=" * 59)
+        print("=" * 19 + " Total Monthly Bills " + "=" * 19)
+        print("=" * 59)
+        print(f"Total Monthly Debt Payments: ${self.calculate_total_monthly_debt():.2f}")
+        print("\n")
+
+
+class Utilities(ItemizedExpenses):
+    GROUP = 'Utilities'
+    FIELDS = (
+        ('gas_electric_car', 'Car Gas/Electric'),
+        ('electric_gas_house', 'Electric and Gas (Home)'),
+        ('sewer_water', 'Sewer and Water'),
+        ('internet', 'Internet'),
+        ('cellphone', 'Cellphone'),
+        ('entertainment', 'Entertainment'),
+        ('cable', 'Cable'),
+        ('landline', 'Landline'),
+    )
+
+    def __init__(self, gas_electric_car, electric_gas_house, sewer_water, internet, cellphone, entertainment, cable=0, landline=0, ledger=None):
+        """
+        Initialize the Utilities with necessary parameters.
+
+        :param gas_electric_car: Monthly cost for gas/electric for car
+        :param electric_gas_house: Monthly cost for electric and gas for house/apartment
+        :param sewer_water: Monthly cost for sewer and water
+        :param internet: Monthly cost for internet
+        :param cellphone: Monthly cost for cellphone
+        :param entertainment: Monthly cost for entertainment
+        :param cable: Monthly cost for cable (default is 0)
+        :param landline: Monthly cost for landline (default is 0)
+        :param ledger: ExpenseLedger to store the items in (default is a new one)
+        """
+        super().__init__(
+            ledger,
+            gas_electric_car=gas_electric_car,
+            electric_gas_house=electric_gas_house,
+            sewer_water=sewer_water,
+            internet=internet,
+            cellphone=cellphone,
+            entertainment=entertainment,
+            cable=cable,
+            landline=landline
+        )
+
+    def calculate_total_monthly_utilities(self):
+        """
+        Calculate the total monthly utility costs.
+
+        :return: Total monthly utility costs
+        """
+        return self.calculate_total()
+
+    def print_utilities_summary(self):
+        """
+        Print a summary of the monthly utility costs.
+        """
+        print("=" * 59)
+        print("=" * 21 + " Utilities Bills " + "=" * 21)
+        print("=" * 59)
+        print(f"Gas/Electric for Car: ${self.gas_electric_car:.2f}")
+        print(f"Electric/Gas for House: ${self.electric_gas_house:.2f}")
+        print(f"Sewer and Water: ${self.sewer_water:.2f}")
+        print(f"Internet: ${self.internet:.2f}")
+        print(f"Cellphone: ${self.cellphone:.2f}")
+        print(f"Entertainment: ${self.entertainment:.2f}")
+        print(f"Cable: ${self.cable:.2f}")
+        print(f"Landline: ${self.landline:.2f}")
+        for label, size in self.extra_items():
+            print(f"{label}: ${size:.2f}")
+        print(f"Total Monthly Utility and Entertainment Costs: ${self.calculate_total_monthly_utilities():.2f}")
+        print("\n")
@@ -0,0 +1,49 @@
+import ast
+
+from .expenses import MortgageAndDebt, Utilities
+from .income import MonthlyNetIncome
+
+# Labels of the input form fields, in display order
+FORM_LABELS = [
+    "Gross Annual Salary", "Federal Tax Brackets", "State Tax Brackets", "Local Tax Rate", "FICA Rate",
+    "Medicare Annual Cost", "Retirement Contribution Annual", "Savings Rate", "Car Insurance Annual Cost",
+    "Rent", "Auto Payment", "Car Insurance", "Credit Card Payment",
+    "Gas/Electric Car", "Electric/Gas House", "Sewer Water", "Internet", "Cellphone", "Entertainment", "Cable", "Landline"
+]
+
+
+def parse_form(values):
+    """
+    Build the budget components from the text typed into the input form.
+
+    :param values: Dictionary mapping each form label to its text
+    :return: Tuple of (MonthlyNetIncome, MortgageAndDebt, Utilities)
+    """
+    monthly_net_income = MonthlyNetIncome(
+        float(values["Gross Annual Salary"]),
+        ast.literal_eval(values["Federal Tax Brackets"]),
+        ast.literal_eval(values["State Tax Brackets"]),
+        float(values["Local Tax Rate"]),
+        float(values["FICA Rate"]),
+        float(values["Medicare Annual Cost"]),
+        float(values["Retirement Contribution Annual"]),
+        float(values["Savings Rate"]),
+        float(values["Car Insurance Annual Cost"])
+    )
+    mortgage_and_debt = MortgageAndDebt(
+        float(values["Rent"]),
+        float(values["Auto Payment"]),
+        float(values["Car Insurance"]),
+        float(values["Credit Card Payment"])
+    )
+    utilities = Utilities(
+        float(values["Gas/Electric Car"]),
+        float(values["Electric/Gas House"]),
+        float(values["Sewer Water"]),
+        float(values["Internet"]),
+        float(values["Cellphone"]),
+        float(values["Entertainment"]),
+        float(values["Cable"]),
+        float(values["Landline"])
+    )
+    return monthly_net_income, mortgage_and_debt, utilities
@@ -0,0 +1,346 @@
+from functools import lru_cache
+
+import numpy as np
+
+from .ledger import payments_per_year
+
+
+@lru_cache(maxsize=64)
+def _compile_brackets(brackets):
+    """
+    Turn a tuple of (limit, rate) brackets into NumPy arrays of lower limits, upper limits, rates
+    and the tax owed on the income below each bracket.
+
+    :param brackets: Tuple of (limit, rate) tuples in ascending limit order
+    :return: Tuple of (lower_limits, upper_limits, rates, base_taxes) arrays
+    """
+    upper_limits = np.array([limit for limit, _ in brackets], dtype=float)
+    rates = np.array([rate for _, rate in brackets], dtype=float)
+    lower_limits = np.concatenate(([0.0], upper_limits[:-1]))
+    # The top bracket may be infinitely wide, so it is left out of the running total
+    base_taxes = np.concatenate(([0.0], np.cumsum((upper_limits[:-1] - lower_limits[:-1]) * rates[:-1])))
+    return lower_limits, upper_limits, rates, base_taxes
+
+
+def compile_brackets(brackets):
+    """
+    Compile tax brackets into arrays, reusing the result for brackets seen before.
+
+    :param brackets: List of tuples for tax brackets (limit, rate)
+    :return: Tuple of (lower_limits, upper_limits, rates, base_taxes) arrays
+    """
+    return _compile_brackets(tuple((float(limit), float(rate)) for limit, rate in brackets))
+
+
+def calculate_bracket_tax(income, brackets):
+    """
+    Calculate the tax owed on an income (or array of incomes) for the given tax brackets.
+
+    Income above the last bracket limit is not taxed, matching the original loop.
+
+    :param income: Annual income as a number or NumPy array
+    :param brackets: List of tuples for tax brackets (limit, rate)
+    :return: Total tax as a float, or an array with the same shape as income
+    """
+    if isinstance(income, (int, float)):
+        # Scalar fast path: a short Python loop beats NumPy call overhead for one household
+        tax = 0.0
+        previous_bracket_limit = 0.0
+        for bracket_limit, rate in brackets:
+            if income <= previous_bracket_limit:
+                break
+            tax += (min(income, bracket_limit) - previous_bracket_limit) * rate
+            previous_bracket_limit = bracket_limit
+        return tax
+
+    lower_limits, upper_limits, rates, base_taxes = compile_brackets(brackets)
+    income = np.asarray(income, dtype=float)
+
+    # Tax on the brackets below each income's bracket, plus its rate on the part inside it
+    index = np.maximum(np.searchsorted(lower_limits, income) - 1, 0)
+    tax = base_taxes[index] + (np.clip(income, 0.0, upper_limits[index]) - lower_limits[index]) * rates[index]
+    return float(tax) if tax.ndim == 0 else tax
+
+
+class MonthlyNetIncome:
+    def __init__(self, gross_annual_salary, federal_tax_brackets, state_tax_brackets, local_tax_rate, fica_rate, medicare_annual_cost, retirement_contribution_annual, savings_rate, car_insurance_annual_cost, social_security_brackets=None, medicare_tax_brackets=None, pre_tax_deductions_annual=0, retirement_pre_tax=False):
+        """
+        Initialize the MonthlyNetIncome with necessary parameters.
+
+        Every numeric parameter may also be a NumPy array, in which case each
+        calculation returns one result per household.
+
+        Payroll taxes are brackets like the income taxes, so the Social Security
+        wage base is a bracket with a 0 rate above it and the additional Medicare
+        tax is a higher top bracket; both are computed without branching per household.
+
+        Deductions come in stages: pre-tax deductions (and the retirement contribution,
+        when it is pre-tax) lower the taxable income the income taxes are charged on,
+        payroll taxes are charged on the gross salary, and the post-tax deductions come
+        out of what is left.
+
+        :param gross_annual_salary: Annual salary before deductions
+        :param federal_tax_brackets: List of tuples for federal tax brackets (limit, rate)
+        :param state_tax_brackets: List of tuples for state tax brackets (limit, rate)
+        :param local_tax_rate: Local tax rate as a decimal
+        :param fica_rate: FICA tax rate as a decimal
+        :param medicare_annual_cost: Annual cost of Medicare
+        :param retirement_contribution_annual: Annual retirement contribution
+        :param savings_rate: Savings rate as a decimal
+        :param car_insurance_annual_cost: Annual cost of car insurance
+        :param social_security_brackets: List of tuples for Social Security tax brackets (limit, rate),
+                                         replacing the flat fica_rate (default is None, the flat rate)
+        :param medicare_tax_brackets: List of tuples for Medicare tax brackets (limit, rate)
+                                      (default is None, no Medicare tax)
+        :param pre_tax_deductions_annual: Other annual deductions taken before income taxes, e.g. health premiums
+        :param retirement_pre_tax: Whether the retirement contribution is taken before income taxes, like a 401(k)
+                                   (may be a boolean array)
+        """
+        self.gross_annual_salary = gross_annual_salary
+        self.federal_tax_brackets = federal_tax_brackets
+        self.state_tax_brackets = state_tax_brackets
+        self.local_tax_rate = local_tax_rate
+        self.fica_rate = fica_rate
+        self.medicare_annual_cost = medicare_annual_cost
+        self.retirement_contribution_annual = retirement_contribution_annual
+        self.savings_rate = savings_rate
+        self.car_insurance_annual_cost = car_insurance_annual_cost
+        self.social_security_brackets = social_security_brackets
+        self.medicare_tax_brackets = medicare_tax_brackets
+        self.pre_tax_deductions_annual = pre_tax_deductions_annual
+        self.retirement_pre_tax = retirement_pre_tax
+
+    def calculate_pre_tax_deductions(self):
+        """
+        Calculate the deductions taken before income taxes.
+
+        :return: Total pre-tax deductions
+        """
+        return self.pre_tax_deductions_annual + self.retirement_contribution_annual * self.retirement_pre_tax
+
+    def calculate_taxable_income(self, pre_tax_deductions=None):
+        """
+        Calculate the income the income taxes are charged on.
+
+        :param pre_tax_deductions: Result of calculate_pre_tax_deductions, if already known
+        :return: Gross annual salary less the pre-tax deductions, never below 0
+        """
+        if pre_tax_deductions is None:
+            pre_tax_deductions = self.calculate_pre_tax_deductions()
+        taxable_income = self.gross_annual_salary - pre_tax_deductions
+        return np.maximum(taxable_income, 0.0) if isinstance(taxable_income, np.ndarray) else max(taxable_income, 0)
+
+    def calculate_federal_tax(self, taxable_income=None):
+        """
+        Calculate the federal tax based on the given tax brackets.
+
+        :param taxable_income: Result of calculate_taxable_income, if already known
+        :return: Total federal tax
+        """
+        if taxable_income is None:
+            taxable_income = self.calculate_taxable_income()
+        return calculate_bracket_tax(taxable_income, self.federal_tax_brackets)
+
+    def calculate_state_tax(self, taxable_income=None):
+        """
+        Calculate the state tax based on the given tax brackets.
+
+        :param taxable_income: Result of calculate_taxable_income, if already known
+        :return: Total state tax
+        """
+        if taxable_income is None:
+            taxable_income = self.calculate_taxable_income()
+        return calculate_bracket_tax(taxable_income, self.state_tax_brackets)
+
+    def calculate_local_tax(self, taxable_income=None):
+        """
+        Calculate the local tax.
+
+        :param taxable_income: Result of calculate_taxable_income, if already known
+        :return: Total local tax
+        """
+        if taxable_income is None:
+            taxable_income = self.calculate_taxable_income()
+        return taxable_income * self.local_tax_rate
+
+    def calculate_fica(self):
+        """
+        Calculate the FICA tax.
+
+        :return: Total FICA tax
+        """
+        if self.social_security_brackets is None:
+            return self.gross_annual_salary * self.fica_rate
+        return calculate_bracket_tax(self.gross_annual_salary, self.social_security_brackets)
+
+    def calculate_medicare_tax(self):
+        """
+        Calculate the Medicare tax withheld from wages, including the additional Medicare tax.
+
+        :return: Total Medicare tax
+        """
+        if self.medicare_tax_brackets is None:
+            return 0.0
+        return calculate_bracket_tax(self.gross_annual_salary, self.medicare_tax_brackets)
+
+    def calculate_savings(self):
+        """
+        Calculate the savings amount.
+
+        :return: Total savings amount
+        """
+        return self.gross_annual_salary * self.savings_rate
+
+    def calculate_total_taxes(self):
+        """
+        Calculate all taxes plus Medicare, the "Taxes" slice of the budget.
+
+        :return: Total annual taxes
+        """
+        return (
+            self.calculate_federal_tax() +
+            self.calculate_state_tax() +
+            self.calculate_local_tax() +
+            self.calculate_fica() +
+            self.calculate_medicare_tax() +
+            self.medicare_annual_cost
+        )
+
+    def calculate_total_deductions(self):
+        """
+        Calculate the total deductions from the gross annual salary.
+
+        :return: Total deductions
+        """
+        # Sum all the individual deductions
+        return (
+            self.calculate_total_taxes() +
+            self.pre_tax_deductions_annual +
+            self.retirement_contribution_annual +
+            self.calculate_savings() +
+            self.car_insurance_annual_cost
+        )
+
+    def calculate_deduction_stages(self):
+        """
+        Run the whole deduction pipeline in one pass: pre-tax deductions, the taxable income
+        they leave, the taxes, then the post-tax deductions.
+
+        Every stage is computed once and reused by the later ones, so for arrays of
+        households this costs a handful of array operations in total.
+
+        :return: Dictionary with pre_tax_deductions, taxable_income, federal_tax, state_tax, local_tax,
+                 fica, medicare_tax, total_taxes, post_tax_deductions, total_deductions and net_annual_income
+        """
+        pre_tax_deductions = self.calculate_pre_tax_deductions()
+        taxable_income = self.calculate_taxable_income(pre_tax_deductions)
+        stages = {
+            'pre_tax_deductions': pre_tax_deductions,
+            'taxable_income': taxable_income,
+            'federal_tax': self.calculate_federal_tax(taxable_income),
+            'state_tax': self.calculate_state_tax(taxable_income),
+            'local_tax': self.calculate_local_tax(taxable_income),
+            'fica': self.calculate_fica(),
+            'medicare_tax': self.calculate_medicare_tax(),
+        }
+        stages['total_taxes'] = (
+            stages['federal_tax'] +
+            stages['state_tax'] +
+            stages['local_tax'] +
+            stages['fica'] +
+            stages['medicare_tax'] +
+            self.medicare_annual_cost
+        )
+        savings = self.calculate_savings()
+        stages['post_tax_deductions'] = (
+            self.retirement_contribution_annual - self.retirement_contribution_annual * self.retirement_pre_tax +
+            savings +
+            self.car_insurance_annual_cost
+        )
+        stages['total_deductions'] = (
+            stages['total_taxes'] +
+            self.pre_tax_deductions_annual +
+            self.retirement_contribution_annual +
+            savings +
+            self.car_insurance_annual_cost
+        )
+        stages['net_annual_income'] = self.gross_annual_salary - stages['total_deductions']
+        return stages
+
+    def calculate_net_annual_income(self):
+        """
+        Calculate the net annual income after all deductions.
+
+        :return: Net annual income
+        """
+        # Subtract total deductions from gross annual salary
+        return self.gross_annual_salary - self.calculate_total_deductions()
+
+    def calculate_net_monthly_income(self):
+        """
+        Calculate the net monthly income after all deductions.
+
+        :return: Net monthly income
+        """
+        # Divide net annual income by 12 to get monthly income
+        return self.calculate_net_annual_income() / 12
+
+    def calculate_net_income(self, period='monthly'):
+        """
+        Calculate the net income per period after all deductions.
+
+        :param period: Name from ledger.PERIODS, e.g. "weekly" or "annual" (default is monthly)
+        :return: Net income per period
+        """
+        return self.calculate_net_annual_income() / payments_per_year(period)
+
+    def print_summary(self):
+        """
+        Print a summary of the income calculations.
+        """
+        print("=" * 59)
+        print("=" * 22 + " Gross Income " + "=" * 23)
+        print("=" * 59)
+        print(f"Gross Annual Salary: ${self.gross_annual_salary:.2f}")
+        if self.pre_tax_deductions_annual or self.retirement_pre_tax:
+            print(f"Pre-Tax Deductions: ${self.calculate_pre_tax_deductions():.2f}")
+            print(f"Taxable Income: ${self.calculate_taxable_income():.2f}")
+        print("\n")
+
+        print("=" * 59)
+        print("=" * 26 + " Taxes " + "=" * 26)
+        print("=" * 59)
+        print(f"Federal Tax: ${self.calculate_federal_tax():.2f}")
+        print(f"State Tax: ${self.calculate_state_tax():.2f}")
+        print(f"Local Tax: ${self.calculate_local_tax():.2f}")
+        print(f"FICA: ${self.calculate_fica():.2f}")
+        if self.medicare_tax_brackets is not None:
+            print(f"Medicare Tax: ${self.calculate_medicare_tax():.2f}")
+        print("\n")
+
+        print("=" * 59)
+        print("=" * 20 + " Health Insurance " + "=" * 21)
+        print("=" * 59)
+        print(f"Medicare: ${self.medicare_annual_cost:.2f}")
+        print("\n")
+
+        print("=" * 59)
+        print("=" * 23 + " Retirement " + "=" * 24)
+        print("=" * 59)
+        print(f"Company Retirement Contribution: ${self.retirement_contribution_annual:.2f}")
+        print(f"Savings: ${self.calculate_savings():.2f}")
+        print("\n")
+
+        print("=" * 59)
+        print("=" * 22 + " Car Insurance " + "=" * 22)
+        print("=" * 59)
+        print(f"Car Insurance: ${self.car_insurance_annual_cost:.2f}")
+        print("\n")
+
+        print("=" * 59)
+        print("=" * 25 + " Summary " + "=" * 25)
+        print("=" * 59)
+        print(f"Total Deductions: ${self.calculate_total_deductions():.2f}")
+        print(f"Net Annual Income: ${self.calculate_net_annual_income():.2f}")
+        print(f"Net Monthly Income: ${self.calculate_net_monthly_income():.2f}")
+        print("\n")
@@ -0,0 +1,202 @@
+"""
+Opt-in timing instrumentation for the budget computation and the GUI redraw.
+
+Nothing is timed until methods are wrapped, and wrapping only happens when
+instrumentation is enabled, so a normal run pays no overhead at all.
+
+Set the environment variable BUDGET_INSTRUMENT to an output path to turn it on
+for the GUI scripts. BUDGET_INSTRUMENT_FORMAT chooses "json" (the default) or
+"chrome" (a trace that chrome://tracing and Perfetto can open).
+"""
+import atexit
+from collections import deque
+import functools
+import json
+import os
+import threading
+import time
+
+# Methods of the budget classes and front ends that are timed when enabled
+COMPUTATION_METHODS = ('calculate_federal_tax', 'calculate_state_tax')
+FRONT_END_METHODS = ('create_pie_chart', 'update_pie_chart', 'on_hover', 'update_budget', 'build_form', 'build_charts')
+
+
+class Instrumentation:
+    def __init__(self, max_events=100000):
+        """
+        Initialize the Instrumentation with empty counters.
+
+        :param max_events: Number of individual calls kept for the Chrome trace (oldest are dropped)
+        """
+        self.enabled = False
+        self.stats = {}
+        self.events = deque(maxlen=max_events)
+        self._patched = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """Turn instrumentation on so that wrap() starts patching methods."""
+        self.enabled = True
+
+    def wrap(self, owner, attribute, name=None):
+        """
+        Replace a method on a class or an instance with a version that records its timing.
+
+        Does nothing while instrumentation is disabled.
+
+        :param owner: Class or instance holding the method
+        :param attribute: Name of the method
+        :param name: Name to record the timings under (default is "Owner.attribute")
+        """
+        if not self.enabled:
+            return
+        original = getattr(owner, attribute)
+        owner_name = owner.__name__ if isinstance(owner, type) else type(owner).__name__
+        name = name or f"{owner_name}.{attribute}"
+        record = self.record
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                record(name, start, time.perf_counter())
+
+        # Remember what the owner itself defined so unwrap_all() can put it back
+        own_attribute = vars(owner).get(attribute)
+        self._patched.append((owner, attribute, own_attribute, attribute in vars(owner)))
+        setattr(owner, attribute, timed)
+
+    def unwrap_all(self):
+        """Restore every method patched by wrap()."""
+        while self._patched:
+            owner, attribute, own_attribute, was_own_attribute = self._patched.pop()
+            if was_own_attribute:
+                setattr(owner, attribute, own_attribute)
+            else:
+                delattr(owner, attribute)
+
+    def record(self, name, start, end):
+        """
+        Add one timed call to the counters.
+
+        :param name: Name of the timed operation
+        :param start: perf_counter() value when the call started
+        :param end: perf_counter() value when the call ended
+        """
+        with self._lock:
+            entry = self.stats.get(name)
+            if entry is None:
+                entry = self.stats[name] = [0, 0.0]
+            entry[0] += 1
+            entry[1] += end - start
+            self.events.append((name, start, end, threading.get_ident()))
+
+    def reset(self):
+        """Clear all counters and recorded calls."""
+        with self._lock:
+            self.stats.clear()
+            self.events.clear()
+
+    def snapshot(self):
+        """
+        Summarize the counters.
+
+        :return: Dictionary mapping each name to its calls, total and mean time in milliseconds
+        """
+        with self._lock:
+            return {
+                name: {
+                    'calls': calls,
+                    'total_ms': total * 1000,
+                    'mean_ms': total * 1000 / calls,
+                }
+                for name, (calls, total) in sorted(self.stats.items())
+            }
+
+    def format_stats(self):
+        """
+        Format the counters as a fixed-width table for the debug panel.
+
+        :return: Table text
+        """
+        lines = [f"{'Operation':<40}{'Calls':>8}{'Total ms':>12}{'Mean ms':>10}"]
+        for name, entry in self.snapshot().items():
+            lines.append(f"{name:<40}{entry['calls']:>8}{entry['total_ms']:>12.2f}{entry['mean_ms']:>10.3f}")
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """
+        Build a Chrome trace of the recorded calls.
+
+        :return: Dictionary in the Trace Event Format
+        """
+        pid = os.getpid()
+        with self._lock:
+            trace_events = [
+                {
+                    'name': name,
+                    'ph': 'X',
+                    'ts': (start - self._origin) * 1e6,
+                    'dur': (end - start) * 1e6,
+                    'pid': pid,
+                    'tid': thread_id,
+                }
+                for name, start, end, thread_id in self.events
+            ]
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def dump(self, path, output_format='json'):
+        """
+        Write the counters to a file.
+
+        :param path: Output file path
+        :param output_format: "json" for the counters or "chrome" for a trace of every call
+        """
+        if output_format == 'chrome':
+            data = self.chrome_trace()
+        elif output_format == 'json':
+            data = self.snapshot()
+        else:
+            raise ValueError(f"Unknown instrumentation format: {output_format}")
+        with open(path, 'w') as file:
+            json.dump(data, file, indent=2)
+
+
+# Shared instance used by the GUI scripts
+instrumentation = Instrumentation()
+
+
+def enable_from_environment():
+    """
+    Enable the shared instrumentation if BUDGET_INSTRUMENT is set, and dump it on exit.
+
+    :return: True if instrumentation is enabled
+    """
+    path = os.environ.get('BUDGET_INSTRUMENT')
+    if not path:
+        return False
+    instrumentation.enable()
+    atexit.register(instrumentation.dump, path, os.environ.get('BUDGET_INSTRUMENT_FORMAT', 'json'))
+    return True
+
+
+def instrument_classes(*front_end_classes):
+    """
+    Wrap the tax calculations and the hot front-end methods with the shared instrumentation.
+
+    Must be called before the GUI objects are created, because event handlers
+    bind their methods when they are connected.
+
+    :param front_end_classes: GUI and input form classes of a front end
+    """
+    from .income import MonthlyNetIncome
+
+    for method in COMPUTATION_METHODS:
+        instrumentation.wrap(MonthlyNetIncome, method)
+    for cls in front_end_classes:
+        for method in FRONT_END_METHODS:
+            if hasattr(cls, method):
+                instrumentation.wrap(cls, method)
@@ -0,0 +1,278 @@
+import numpy as np
+
+# Number of payments per year for each supported frequency
+FREQUENCIES = {
+    'weekly': 52,
+    'biweekly': 26,
+    'semi-monthly': 24,
+    'monthly': 12,
+    'quarterly': 4,
+    'annual': 1,
+}
+# Periods a budget can be viewed in
+PERIODS = ('weekly', 'biweekly', 'semi-monthly', 'monthly', 'annual')
+
+
+def payments_per_year(frequency):
+    """
+    Convert a frequency name or number into payments per year.
+
+    :param frequency: Name from FREQUENCIES (in any case, e.g. "Monthly") or a number of payments per year
+    :return: Payments per year as a float
+    """
+    if isinstance(frequency, str):
+        try:
+            return float(FREQUENCIES[frequency.lower()])
+        except KeyError:
+            raise ValueError(f"Unknown frequency: {frequency}") from None
+    return float(frequency)
+
+
+class ExpenseLedger:
+    def __init__(self, capacity=64):
+        """
+        Initialize an empty ExpenseLedger.
+
+        Line items live in contiguous NumPy arrays (category id, amount, payments per year).
+        Categories form a tree addressed by paths such as ("Utilities", "Internet"), and
+        every node keeps a running monthly total, so totals never need a scan.
+
+        Amounts may also be NumPy arrays with one amount per household, like the other
+        budget inputs. The first one turns the amounts into a 2-D array (item, household),
+        every other amount applying to all the households, and the totals into arrays.
+
+        :param capacity: Number of line items to allocate room for up front
+        """
+        self.category_ids = np.full(capacity, -1, dtype=np.int32)
+        self.amounts = np.zeros(capacity, dtype=np.float64)
+        self.frequencies = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+
+        # Category tree, indexed by category id
+        self._paths = []
+        self._ancestors = []  # Ids of the node and all its parents
+        self._children = []
+        self._totals = []  # Running monthly total of each node
+        self._ids = {(): self._new_node(())}
+
+    def __len__(self):
+        return self.count
+
+    def copy(self):
+        """
+        Copy the ledger, so the items of the copy can change without touching this one.
+
+        The item arrays are trimmed to the items in use; they grow again on the next add.
+
+        :return: New ExpenseLedger
+        """
+        duplicate = ExpenseLedger.__new__(ExpenseLedger)
+        size = max(self.count, 1)
+        duplicate.category_ids = self.category_ids[:size].copy()
+        duplicate.amounts = self.amounts[:size].copy()
+        duplicate.frequencies = self.frequencies[:size].copy()
+        duplicate.count = self.count
+        # Paths and ancestors are tuples, so only the containers need copying
+        duplicate._paths = list(self._paths)
+        duplicate._ancestors = list(self._ancestors)
+        duplicate._children = [list(children) for children in self._children]
+        duplicate._totals = list(self._totals)
+        duplicate._ids = dict(self._ids)
+        return duplicate
+
+    @property
+    def households(self):
+        """Number of households the amounts hold, or None for plain amounts."""
+        return self.amounts.shape[1] if self.amounts.ndim == 2 else None
+
+    def _fit_amount(self, amount):
+        """Check an amount against the households, widening the amounts to the first per-household array."""
+        if not isinstance(amount, np.ndarray) or amount.ndim == 0:
+            return float(amount)
+        if amount.ndim != 1:
+            raise ValueError("An amount must be a number or a 1-D array with one amount per household")
+        if self.amounts.ndim == 1:
+            self.amounts = np.repeat(self.amounts[:, None], len(amount), axis=1)
+        elif len(amount) != self.amounts.shape[1]:
+            raise ValueError(f"Expected {self.amounts.shape[1]} amounts, one per household, got {len(amount)}")
+        return amount.astype(np.float64)
+
+    def _new_node(self, path):
+        """Add a category node and link it to its parent."""
+        parent_ancestors = () if not path else self._ancestors[self.category(*path[:-1])]
+        node = len(self._paths)
+        self._paths.append(path)
+        self._ancestors.append(parent_ancestors + (node,))
+        self._children.append([])
+        self._totals.append(0.0)
+        if path:
+            self._children[parent_ancestors[-1]].append(node)
+        return node
+
+    def category(self, *path):
+        """
+        Get the id of a category, creating it and its parents if needed.
+
+        :param path: Category names from the top-level group down
+        :return: Category id
+        """
+        node = self._ids.get(path)
+        if node is None:
+            node = self._ids[path] = self._new_node(path)
+        return node
+
+    def _grow(self, needed):
+        """Double the item arrays until they can hold the needed number of items."""
+        capacity = len(self.amounts)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name, fill in (('category_ids', -1), ('amounts', 0.0), ('frequencies', 0.0)):
+            old = getattr(self, name)
+            new = np.full((capacity,) + old.shape[1:], fill, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def _adjust_totals(self, category_id, delta):
+        """Add a monthly amount (or per-household amounts) to a category and all of its parents."""
+        delta = delta if isinstance(delta, np.ndarray) and delta.ndim else float(delta)
+        for node in self._ancestors[category_id]:
+            # Not +=, which would change in place a total array that a copy of the ledger still shares
+            self._totals[node] = self._totals[node] + delta
+
+    def add_item(self, path, amount, frequency='monthly'):
+        """
+        Add a line item.
+
+        :param path: Tuple of category names, e.g. ("Utilities", "Internet")
+        :param amount: Amount of each payment, or a NumPy array of them, one per household
+        :param frequency: Name from FREQUENCIES or payments per year (default is monthly)
+        :return: Index of the new item
+        """
+        amount = self._fit_amount(amount)
+        category_id = self.category(*path)
+        per_year = payments_per_year(frequency)
+        self._grow(self.count + 1)
+        index = self.count
+        self.category_ids[index] = category_id
+        self.amounts[index] = amount
+        self.frequencies[index] = per_year
+        self.count += 1
+        self._adjust_totals(category_id, amount * per_year / 12)
+        return index
+
+    def add_items(self, paths, amounts, frequency='monthly'):
+        """
+        Add many line items at once.
+
+        :param paths: Sequence of category paths, one per item
+        :param amounts: Sequence of amounts, or a 2-D array of them (item, household)
+        :param frequency: Frequency shared by all the items
+        :return: Array of the new item indexes
+        """
+        category_ids = np.array([self.category(*path) for path in paths], dtype=np.int32)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        if amounts.ndim == 2 and len(amounts):
+            self._fit_amount(amounts[0])
+        per_year = payments_per_year(frequency)
+        start = self.count
+        end = start + len(category_ids)
+        self._grow(end)
+        self.category_ids[start:end] = category_ids
+        self.amounts[start:end] = amounts if amounts.ndim == self.amounts.ndim else amounts[:, None]
+        self.frequencies[start:end] = per_year
+        self.count = end
+
+        for category_id, monthly in self._category_sums(category_ids, amounts * per_year / 12):
+            self._adjust_totals(category_id, monthly)
+        return np.arange(start, end)
+
+    def _category_sums(self, category_ids, monthly):
+        """Sum the monthly amounts of items by category, with one bincount per household."""
+        if monthly.ndim == 1:
+            sums = np.bincount(category_ids, weights=monthly, minlength=len(self._paths))
+            return [(category_id, sums[category_id]) for category_id in np.flatnonzero(sums)]
+        sums = np.stack(
+            [np.bincount(category_ids, weights=column, minlength=len(self._paths)) for column in monthly.T], axis=1
+        )
+        return [(category_id, sums[category_id]) for category_id in np.flatnonzero(np.any(sums != 0, axis=1))]
+
+    def set_amount(self, index, amount):
+        """
+        Change the amount of a line item.
+
+        :param index: Index returned by add_item
+        :param amount: New amount of each payment, or a NumPy array of them, one per household
+        """
+        category_id = self.category_ids[index]
+        if category_id < 0:
+            raise IndexError(f"Line item {index} was removed")
+        amount = self._fit_amount(amount)
+        per_year = self.frequencies[index]
+        self._adjust_totals(category_id, (amount - self.amounts[index]) * per_year / 12)
+        self.amounts[index] = amount
+
+    def remove_item(self, index):
+        """
+        Remove a line item; the indexes of the other items do not change.
+
+        :param index: Index returned by add_item
+        """
+        category_id = self.category_ids[index]
+        if category_id < 0:
+            return
+        self._adjust_totals(category_id, -self.amounts[index] * self.frequencies[index] / 12)
+        self.category_ids[index] = -1
+        self.amounts[index] = 0.0
+
+    def monthly_amounts(self):
+        """
+        Monthly equivalent of every line item.
+
+        :return: Array of monthly amounts, zero for removed items, with one column per household if any
+        """
+        frequencies = self.frequencies[:self.count]
+        return self.amounts[:self.count] * (frequencies if self.amounts.ndim == 1 else frequencies[:, None]) / 12
+
+    def recompute_totals(self):
+        """Rebuild every running total from the item arrays, dropping accumulated rounding error."""
+        live = self.category_ids[:self.count] >= 0
+        self._totals = [0.0] * len(self._paths)
+        for category_id, monthly in self._category_sums(self.category_ids[:self.count][live], self.monthly_amounts()[live]):
+            self._adjust_totals(category_id, monthly)
+
+    def total(self, *path):
+        """
+        Monthly total of a category and everything below it.
+
+        :param path: Category names; no names means the whole ledger
+        :return: Monthly total, or an array of them, one per household
+        """
+        node = self._ids.get(path)
+        return 0.0 if node is None else self._totals[node]
+
+    def children(self, *path):
+        """
+        Names of the direct subcategories of a category, in the order they were created.
+
+        :param path: Category names; no names means the top-level groups
+        :return: List of names
+        """
+        node = self._ids.get(path)
+        if node is None:
+            return []
+        return [self._paths[child][-1] for child in self._children[node]]
+
+    def breakdown(self, *path):
+        """
+        Labels and monthly totals of the direct subcategories of a category, for pie drill-downs.
+
+        :param path: Category names; no names means the top-level groups
+        :return: Tuple of (labels, sizes) lists
+        """
+        node = self._ids.get(path)
+        if node is None:
+            return [], []
+        children = self._children[node]
+        return [self._paths[child][-1] for child in children], [self._totals[child] for child in children]
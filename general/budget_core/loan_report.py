@@ -0,0 +1,182 @@
+"""
+Side-by-side comparison of loan offers, computed from closed-form summaries.
+
+Each scenario is a loan with an optional constant extra payment and upfront fees
+(points, closing costs). The payment, payoff month and total interest of every
+scenario, and the cumulative interest at any month, have closed forms, so the
+whole report is a few NumPy operations over the scenarios and no month-by-month
+schedule is built. The report is computed once and rendered to text or CSV here,
+or to a bar chart with loan_chart.plot_loan_report.
+"""
+import csv
+import io
+
+import numpy as np
+
+REPORT_COLUMNS = (
+    'Scenario', 'Monthly Payment', 'Payoff Month', 'Total Interest', 'Fees', 'Total Cost',
+    'Interest Saved', 'Break-Even Month',
+)
+REPORT_FORMATS = ('text', 'csv')
+
+
+def _balance_after(principal, rate, payment, months):
+    """Balance after a number of fixed payments, element-wise over scenarios (rate may be 0)."""
+    growth = (1 + rate) ** months
+    with np.errstate(divide='ignore', invalid='ignore'):
+        compounded = (principal - payment / rate) * growth + payment / rate
+    return np.where(rate == 0, principal - payment * months, compounded)
+
+
+class LoanComparison:
+    def __init__(self, scenarios, baseline=0):
+        """
+        Initialize the LoanComparison and compute the summary of every scenario.
+
+        :param scenarios: List of dictionaries with name, principal, annual_rate, years,
+                          optional extra_payment (monthly) and optional fees (upfront)
+        :param baseline: Index of the scenario the savings and break-even are measured against
+        """
+        self.names = [scenario['name'] for scenario in scenarios]
+        self.baseline = baseline
+        principal = np.array([scenario['principal'] for scenario in scenarios], dtype=float)
+        rate = np.array([scenario['annual_rate'] for scenario in scenarios], dtype=float) / 12
+        n_payments = np.array([scenario['years'] for scenario in scenarios], dtype=float) * 12
+        extra_payment = np.array([scenario.get('extra_payment', 0) for scenario in scenarios], dtype=float)
+        self.fees = np.array([scenario.get('fees', 0) for scenario in scenarios], dtype=float)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scheduled = np.where(rate == 0, principal / n_payments, principal * rate / (1 - (1 + rate) ** -n_payments))
+            # Number of payments that clear the balance
+            months = np.where(
+                rate == 0,
+                np.ceil(principal / (scheduled + extra_payment) - 1e-9),
+                np.ceil(-np.log1p(-principal * rate / (scheduled + extra_payment)) / np.log1p(rate) - 1e-9)
+            )
+        self.principal = principal
+        self.rate = rate
+        self.payment = scheduled + extra_payment
+        self.payoff_month = np.clip(months, 1, n_payments).astype(int)
+
+        # The last payment only covers what is left
+        last_balance = _balance_after(principal, rate, self.payment, self.payoff_month - 1)
+        self.total_paid = (self.payoff_month - 1) * self.payment + last_balance * (1 + rate)
+        self.total_interest = self.total_paid - principal
+        self.total_cost = self.total_interest + self.fees
+        self.interest_saved = self.total_interest[baseline] - self.total_interest
+        self.break_even_month = self._break_even()
+
+    def interest_through(self, month, scenario=None):
+        """
+        Cumulative interest at the end of a month, in closed form.
+
+        :param month: Month number, or an array with one month per scenario
+        :param scenario: Index of a single scenario to evaluate at every month (default is each scenario at its month)
+        :return: Array of cumulative interest
+        """
+        select = slice(None) if scenario is None else scenario
+        principal, rate, payment = self.principal[select], self.rate[select], self.payment[select]
+        payoff_month, total_interest = self.payoff_month[select], self.total_interest[select]
+        month = np.minimum(np.broadcast_to(month, np.broadcast(month, principal).shape), payoff_month)
+        paid_down = principal - _balance_after(principal, rate, payment, month)
+        return np.where(month >= payoff_month, total_interest, month * payment - paid_down)
+
+    def _break_even(self):
+        """
+        Month at which each scenario's higher fees are paid back by lower interest, compared with the baseline.
+
+        0 when a scenario costs no more upfront and no more in total, -1 when its total cost is higher
+        (it never breaks even). Otherwise it is the first month the fees plus interest so far are no more
+        than the baseline's, found by bisection on the closed-form cumulative interest; this assumes the
+        gap only narrows, as it does for a lower rate or a prepaid loan.
+        """
+        baseline = self.baseline
+
+        def gap(month):
+            base = self.fees[baseline] + self.interest_through(month, baseline)
+            return self.fees + self.interest_through(month) - base
+
+        horizon = int(max(self.payoff_month.max(), 1))
+        low = np.zeros(len(self.names), dtype=int)
+        high = np.full(len(self.names), horizon)
+        while (high - low > 1).any():
+            middle = (low + high) // 2
+            reached = gap(middle) <= 1e-9
+            high = np.where(reached, middle, high)
+            low = np.where(reached, low, middle)
+        never = self.total_cost > self.total_cost[baseline] + 1e-9
+        upfront = self.fees <= self.fees[baseline]
+        return np.where(never, -1, np.where(upfront, 0, high))
+
+    def rows(self):
+        """
+        Report rows, one per scenario.
+
+        :return: List of dictionaries keyed by REPORT_COLUMNS; Break-Even Month is None when never reached
+        """
+        return [
+            dict(zip(REPORT_COLUMNS, (
+                name, payment, months, interest, fees, cost, saved, None if break_even < 0 else break_even,
+            )))
+            for name, payment, months, interest, fees, cost, saved, break_even in zip(
+                self.names, self.payment.tolist(), self.payoff_month.tolist(), self.total_interest.tolist(),
+                self.fees.tolist(), self.total_cost.tolist(), self.interest_saved.tolist(),
+                self.break_even_month.tolist(),
+            )
+        ]
+
+    def to_text(self):
+        """
+        Render the report as a fixed-width text table.
+
+        :return: Table as a string
+        """
+        rows = self.rows()
+        name_width = max([len(REPORT_COLUMNS[0])] + [len(name) for name in self.names])
+        widths = [name_width] + [max(len(column), 12) for column in REPORT_COLUMNS[1:]]
+        lines = [
+            "  ".join(column.ljust(width) if index == 0 else column.rjust(width)
+                      for index, (column, width) in enumerate(zip(REPORT_COLUMNS, widths))),
+            "  ".join("-" * width for width in widths),
+        ]
+        for row in rows:
+            cells = [row['Scenario'].ljust(name_width)]
+            for column, width in zip(REPORT_COLUMNS[1:], widths[1:]):
+                value = row[column]
+                if value is None:
+                    text = "never"
+                elif isinstance(value, int):
+                    text = str(value)
+                else:
+                    text = f"-${-value:,.2f}" if value < 0 else f"${value:,.2f}"
+                cells.append(text.rjust(width))
+            lines.append("  ".join(cells))
+        return "\n".join(lines)
+
+    def to_csv(self, file=None):
+        """
+        Render the report as CSV.
+
+        :param file: Open text file to write to (default is to return a string)
+        :return: CSV text when no file is given
+        """
+        output = io.StringIO() if file is None else file
+        writer = csv.writer(output)
+        writer.writerow(REPORT_COLUMNS)
+        for row in self.rows():
+            writer.writerow(['' if row[column] is None else row[column] for column in REPORT_COLUMNS])
+        if file is None:
+            return output.getvalue()
+
+    def render(self, output_format='text'):
+        """
+        Render the report in one of REPORT_FORMATS.
+
+        :param output_format: "text" or "csv"
+        :return: Rendered report as a string
+        """
+        if output_format == 'text':
+            return self.to_text()
+        if output_format == 'csv':
+            return self.to_csv()
+        raise ValueError(f"Unknown report format: {output_format}")
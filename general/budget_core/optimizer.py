@@ -0,0 +1,240 @@
+"""
+Allocation of leftover money across debt prepayment, savings and retirement.
+
+Every month, each household's leftover money (plus the payments of debts it has
+paid off) goes to the use that adds the most net worth at the horizon per
+dollar: a debt saves its interest rate, savings earn their yield and retirement
+earns its return, boosted by the employer match up to the matched amount. Each
+use is filled up to its cap (the debt balance, the yearly contribution limits)
+before the next. Returns are linear, so this greedy split is the optimum as long
+as the yearly retirement limit is not what holds a household back; room left
+unused in a year is lost, which the greedy does not look ahead for. The
+projection runs over NumPy arrays, one row per household, so a batch costs
+about as many array operations as one household.
+
+Retirement contributions here come out of leftover money, on top of the
+contribution already taken from the paycheck, and are treated as post-tax.
+"""
+import numpy as np
+
+# MortgageAndDebt line items that pay down a balance
+DEBT_PAYMENTS = ('credit_card_payment', 'auto_payment')
+ALLOCATION_LABELS = ('Debt Prepayment', 'Savings', 'Retirement')
+
+
+def debts_from_budget(mortgage_and_debt, balances, annual_rates):
+    """
+    Describe the debts behind the payments of a MortgageAndDebt.
+
+    :param mortgage_and_debt: Instance of MortgageAndDebt
+    :param balances: Dictionary of remaining balance by line item name from DEBT_PAYMENTS
+    :param annual_rates: Dictionary of annual interest rate by line item name
+    :return: List of debt dictionaries with name, balance, annual_rate and payment
+    """
+    return [
+        {
+            'name': name,
+            'balance': balances[name],
+            'annual_rate': annual_rates[name],
+            'payment': getattr(mortgage_and_debt, name),
+        }
+        for name in DEBT_PAYMENTS if name in balances
+    ]
+
+
+def _as_columns(values, count, width):
+    """Broadcast a scalar, one value per debt or a full array to a (households, debts) float array."""
+    return np.broadcast_to(np.asarray(values, dtype=float), (count, width)).astype(float)
+
+
+def _project(leftover, debt_balances, debt_rates, debt_payments, horizon_months, savings_yield,
+             retirement_return, match_rate, match_limit, retirement_limit, allocate):
+    """
+    Project the balances of many households month by month.
+
+    :param allocate: Function (month, cash, capacities, log_values) -> allocations, where capacities and
+                     log_values have one column per use: each debt, then matched retirement, retirement, savings
+    :return: Dictionary of result arrays, see optimize_allocations
+    """
+    leftover = np.atleast_1d(np.asarray(leftover, dtype=float))
+    count = len(leftover)
+    debt_balances = np.atleast_2d(np.asarray(debt_balances, dtype=float)).reshape(count, -1).copy()
+    debts = debt_balances.shape[1]
+    debt_rates = _as_columns(debt_rates, count, debts)
+    debt_payments = _as_columns(debt_payments, count, debts)
+    savings_yield, retirement_return, match_rate, match_limit, retirement_limit = (
+        np.broadcast_to(np.asarray(value, dtype=float), (count,))
+        for value in (savings_yield, retirement_return, match_rate, match_limit, retirement_limit)
+    )
+
+    # Growth per month of each use, in logs, and the one-off boost of the match
+    log_growth = np.column_stack((
+        np.log1p(debt_rates / 12),
+        np.log1p(retirement_return / 12),
+        np.log1p(retirement_return / 12),
+        np.log1p(savings_yield / 12),
+    ))
+    log_boost = np.zeros((count, debts + 3))
+    log_boost[:, debts] = np.log1p(match_rate)
+
+    savings = np.zeros(count)
+    retirement = np.zeros(count)
+    contributed_this_year = np.zeros(count)
+    totals = np.zeros((count, 3))
+    first_month = None
+    debt_free_month = np.where(debt_balances > 0, -1, 0)
+    capacities = np.empty((count, debts + 3))
+
+    for month in range(1, horizon_months + 1):
+        if month % 12 == 1:
+            contributed_this_year[:] = 0.0
+        savings *= 1 + savings_yield / 12
+        retirement *= 1 + retirement_return / 12
+        debt_balances *= 1 + debt_rates / 12
+        scheduled = np.minimum(debt_payments, debt_balances)
+        debt_balances -= scheduled
+        # Payments of debts already paid off are free to allocate
+        cash = leftover + (debt_payments - scheduled).sum(axis=1)
+        # A shortfall is drawn from savings
+        savings += np.minimum(cash, 0.0)
+        cash = np.maximum(cash, 0.0)
+
+        retirement_room = np.maximum(retirement_limit - contributed_this_year, 0.0)
+        matched_room = np.minimum(np.maximum(match_limit - contributed_this_year, 0.0), retirement_room)
+        capacities[:, :debts] = debt_balances
+        capacities[:, debts] = matched_room
+        capacities[:, debts + 1] = retirement_room - matched_room
+        capacities[:, debts + 2] = np.inf
+        # Value at the horizon of a dollar put to each use this month
+        log_values = log_boost + (horizon_months - month) * log_growth
+
+        allocations = allocate(month, cash, capacities, log_values)
+        debt_balances -= allocations[:, :debts]
+        matched = allocations[:, debts]
+        unmatched = allocations[:, debts + 1]
+        retirement += matched * (1 + match_rate) + unmatched
+        savings += allocations[:, debts + 2]
+        contributed_this_year += matched + unmatched
+
+        split = np.column_stack((allocations[:, :debts].sum(axis=1), allocations[:, debts + 2], matched + unmatched))
+        totals += split
+        if first_month is None:
+            first_month = split
+        newly_free = (debt_free_month < 0) & (debt_balances <= 0.005)
+        debt_free_month[newly_free] = month
+
+    return {
+        'net_worth': savings + retirement - debt_balances.sum(axis=1),
+        'savings': savings,
+        'retirement': retirement,
+        'debt_balances': debt_balances,
+        'debt_free_month': debt_free_month,
+        'first_month': first_month,
+        'totals': totals,
+    }
+
+
+def _greedy(month, cash, capacities, log_values):
+    """Fill the uses in order of value at the horizon until the cash runs out."""
+    rows = np.arange(len(cash))
+    order = np.argsort(-log_values, axis=1)
+    allocations = np.zeros_like(capacities)
+    for rank in range(capacities.shape[1]):
+        use = order[:, rank]
+        amount = np.minimum(cash, capacities[rows, use])
+        allocations[rows, use] = amount
+        cash = cash - amount
+    return allocations
+
+
+def optimize_allocations(leftover, debt_balances, debt_rates, debt_payments, horizon_months=120, savings_yield=0.04,
+                         retirement_return=0.07, match_rate=0.0, match_limit=0.0, retirement_limit=23000.0):
+    """
+    Find the monthly split of leftover money that maximizes net worth at the horizon, for many households.
+
+    :param leftover: Monthly leftover money per household (MonthlyBudget.calculate_leftover_money)
+    :param debt_balances: Remaining balance of each debt, shape (households, debts)
+    :param debt_rates: Annual interest rate of each debt, as debt_balances or one value per debt
+    :param debt_payments: Scheduled monthly payment of each debt, already part of the budget
+    :param horizon_months: Number of months to project
+    :param savings_yield: Annual yield of savings as a decimal
+    :param retirement_return: Expected annual return of retirement investments as a decimal
+    :param match_rate: Employer match per dollar contributed, e.g. 0.5
+    :param match_limit: Yearly contribution the employer still matches
+    :param retirement_limit: Yearly limit of retirement contributions
+    :return: Dictionary of arrays: net_worth, savings, retirement, debt_balances and debt_free_month (0 when
+             there was no balance, -1 when not paid off by the horizon) per household and debt, first_month and
+             totals (columns as ALLOCATION_LABELS)
+    """
+    return _project(leftover, debt_balances, debt_rates, debt_payments, horizon_months, savings_yield,
+                    retirement_return, match_rate, match_limit, retirement_limit, _greedy)
+
+
+def project_fixed_split(leftover, debt_balances, debt_rates, debt_payments, split, horizon_months=120, savings_yield=0.04,
+                        retirement_return=0.07, match_rate=0.0, match_limit=0.0, retirement_limit=23000.0):
+    """
+    Project net worth when leftover money is split in fixed shares, for comparison with optimize_allocations.
+
+    The debt share prepays the highest-rate debt first, and any share that cannot be used (debts paid off,
+    retirement limit reached) goes to savings.
+
+    :param split: Shares of leftover money for (debt prepayment, savings, retirement), summing to 1
+    :return: Dictionary of arrays like optimize_allocations
+    """
+    debt_share, _, retirement_share = split
+
+    def allocate(month, cash, capacities, log_values):
+        debts = capacities.shape[1] - 3
+        rows = np.arange(len(cash))
+        allocations = np.zeros_like(capacities)
+        # Highest rate first; every debt's value is its growth alone, so its log value ranks it
+        order = np.argsort(-log_values[:, :debts], axis=1)
+        remaining = cash * debt_share
+        for rank in range(debts):
+            use = order[:, rank]
+            amount = np.minimum(remaining, capacities[rows, use])
+            allocations[rows, use] = amount
+            remaining = remaining - amount
+        remaining = cash * retirement_share
+        for use in (debts, debts + 1):
+            allocations[:, use] = np.minimum(remaining, capacities[:, use])
+            remaining = remaining - allocations[:, use]
+        allocations[:, debts + 2] = cash - allocations[:, :debts + 2].sum(axis=1)
+        return allocations
+
+    return _project(leftover, debt_balances, debt_rates, debt_payments, horizon_months, savings_yield,
+                    retirement_return, match_rate, match_limit, retirement_limit, allocate)
+
+
+def optimize_household(budget, debts, horizon_months=120, savings_yield=0.04, retirement_return=0.07,
+                       match_rate=0.0, match_limit=0.0, retirement_limit=23000.0):
+    """
+    Find the best monthly split of one household's leftover money.
+
+    :param budget: Instance of MonthlyBudget
+    :param debts: List of debt dictionaries with name, balance, annual_rate and payment (see debts_from_budget)
+    :param horizon_months: Number of months to project
+    :param savings_yield: Annual yield of savings as a decimal
+    :param retirement_return: Expected annual return of retirement investments as a decimal
+    :param match_rate: Employer match per dollar contributed, e.g. 0.5
+    :param match_limit: Yearly contribution the employer still matches
+    :param retirement_limit: Yearly limit of retirement contributions
+    :return: Dictionary with net_worth, first_month and totals ({label: amount} over ALLOCATION_LABELS)
+             and debt_free_month ({debt name: month, or None when not paid off by the horizon})
+    """
+    result = optimize_allocations(
+        [budget.calculate_leftover_money()],
+        [[debt['balance'] for debt in debts]],
+        [debt['annual_rate'] for debt in debts],
+        [debt['payment'] for debt in debts],
+        horizon_months, savings_yield, retirement_return, match_rate, match_limit, retirement_limit
+    )
+    return {
+        'net_worth': float(result['net_worth'][0]),
+        'first_month': dict(zip(ALLOCATION_LABELS, result['first_month'][0].tolist())),
+        'totals': dict(zip(ALLOCATION_LABELS, result['totals'][0].tolist())),
+        'debt_free_month': {
+            debt['name']: None if month < 0 else int(month)
+            for debt, month in zip(debts, result['debt_free_month'][0].tolist())
+        },
+    }
@@ -0,0 +1,115 @@
+"""
+Month-by-month payoff of several debts at once: avalanche, snowball or a custom order.
+
+Debts use the same dictionaries as the optimizer (name, balance, annual_rate and
+payment, the minimum monthly payment). Every month interest accrues on every
+debt, each minimum is paid, and the extra payment goes to the debts in priority
+order. With roll-over, the minimum of a debt that is paid off joins the extra
+payment, which is what makes a snowball grow. Each month is a handful of array
+operations over all debts, whatever their number.
+"""
+import numpy as np
+
+STRATEGIES = ('avalanche', 'snowball', 'custom')
+PAID_OFF = 0.005  # Balances below half a cent count as paid off
+
+
+def payoff_order(debts, strategy='avalanche', order=None):
+    """
+    Priority of the debts for the extra payment.
+
+    :param debts: List of debt dictionaries with name, balance, annual_rate and payment
+    :param strategy: "avalanche" (highest rate first), "snowball" (smallest balance first) or "custom"
+    :param order: Debt names in priority order, for the custom strategy
+    :return: List of debt indexes, first to be paid off first
+    """
+    indexes = range(len(debts))
+    if strategy == 'avalanche':
+        return sorted(indexes, key=lambda i: (-debts[i]['annual_rate'], debts[i]['balance']))
+    if strategy == 'snowball':
+        return sorted(indexes, key=lambda i: (debts[i]['balance'], -debts[i]['annual_rate']))
+    if strategy == 'custom':
+        if order is None:
+            raise ValueError("The custom strategy needs an order of debt names")
+        positions = {name: position for position, name in enumerate(order)}
+        unknown = set(positions) - {debt['name'] for debt in debts}
+        if unknown:
+            raise KeyError(f"Unknown debts: {sorted(unknown)}")
+        # Debts left out of the order come last, in their original order
+        return sorted(indexes, key=lambda i: positions.get(debts[i]['name'], len(positions)))
+    raise ValueError(f"Unknown payoff strategy: {strategy}")
+
+
+def simulate_payoff(debts, extra_payment=0, strategy='avalanche', order=None, roll_over=True, max_months=360):
+    """
+    Simulate paying off several debts month by month.
+
+    :param debts: List of debt dictionaries with name, balance, annual_rate and payment (the minimum)
+    :param extra_payment: Monthly amount paid on top of the minimums
+    :param strategy: Name from STRATEGIES
+    :param order: Debt names in priority order, for the custom strategy
+    :param roll_over: Add the minimum of each paid off debt to the extra payment
+    :param max_months: Number of months to simulate at most
+    :return: Dictionary with months (until every debt is paid off, or max_months), total_interest,
+             total_paid, debts (list of dictionaries with name, payoff_month, or None when not paid off,
+             and interest) and balances (array of the balance of every debt at the end of each month)
+    """
+    priority = np.array(payoff_order(debts, strategy, order), dtype=int)
+    balances = np.array([debt['balance'] for debt in debts], dtype=float)
+    monthly_rates = np.array([debt['annual_rate'] for debt in debts], dtype=float) / 12
+    minimums = np.array([debt['payment'] for debt in debts], dtype=float)
+
+    interest = np.zeros(len(debts))
+    payoff_month = np.where(balances > PAID_OFF, -1, 0)
+    history = []
+    month = 0
+    while month < max_months and (payoff_month < 0).any():
+        month += 1
+        charged = balances * monthly_rates
+        interest += charged
+        balances += charged
+
+        minimum_paid = np.minimum(minimums, balances)
+        balances -= minimum_paid
+        available = extra_payment + (minimums - minimum_paid).sum() if roll_over else extra_payment
+
+        # The extra payment covers the debts in priority order, each up to its balance
+        remaining = balances[priority]
+        before = np.cumsum(remaining) - remaining
+        balances[priority] -= np.clip(available - before, 0.0, remaining)
+
+        balances[balances < PAID_OFF] = 0.0
+        payoff_month[(payoff_month < 0) & (balances == 0.0)] = month
+        history.append(balances.copy())
+
+    total_interest = float(interest.sum())
+    return {
+        'months': month,
+        'total_interest': total_interest,
+        'total_paid': float(sum(debt['balance'] for debt in debts)) + total_interest - float(balances.sum()),
+        'debts': [
+            {'name': debt['name'], 'payoff_month': None if paid < 0 else int(paid), 'interest': float(charged)}
+            for debt, paid, charged in zip(debts, payoff_month.tolist(), interest.tolist())
+        ],
+        'balances': np.array(history).reshape(month, len(debts)),
+    }
+
+
+def compare_strategies(debts, extra_payment=0, orders=None, roll_over=True, max_months=360):
+    """
+    Simulate the avalanche and snowball strategies, and any custom orders, on the same debts.
+
+    :param debts: List of debt dictionaries with name, balance, annual_rate and payment
+    :param extra_payment: Monthly amount paid on top of the minimums
+    :param orders: Dictionary of custom strategy name to an order of debt names
+    :param roll_over: Add the minimum of each paid off debt to the extra payment
+    :param max_months: Number of months to simulate at most
+    :return: Dictionary of strategy name to the result of simulate_payoff
+    """
+    results = {
+        strategy: simulate_payoff(debts, extra_payment, strategy, roll_over=roll_over, max_months=max_months)
+        for strategy in ('avalanche', 'snowball')
+    }
+    for name, order in (orders or {}).items():
+        results[name] = simulate_payoff(debts, extra_payment, 'custom', order, roll_over, max_months)
+    return results
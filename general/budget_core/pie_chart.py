@@ -0,0 +1,199 @@
+"""
+Matplotlib pie chart shared by the Tkinter and PyQt5 front ends.
+
+This module imports matplotlib, so it is not re-exported from budget_core and
+must be imported explicitly by the GUI scripts.
+"""
+from functools import lru_cache
+
+import matplotlib as mpl
+from matplotlib.patches import Wedge
+import matplotlib.pyplot as plt
+import numpy as np
+
+from .render_cache import RenderCache, budget_hash
+
+START_ANGLE = 140
+LABEL_DISTANCE = 1.1
+PCT_DISTANCE = 0.6
+
+
+@lru_cache(maxsize=32)
+def palette(count):
+    """
+    Colors for a pie with the given number of slices, computed once per slice count.
+
+    :param count: Number of slices
+    :return: Tuple of RGBA tuples spread evenly over the tab20 colormap
+    """
+    return tuple(tuple(color) for color in plt.cm.tab20(np.linspace(0, 1, count)))
+
+
+def pie_layout(sizes, start_angle=START_ANGLE):
+    """
+    Compute the slice fractions and angles the same way Axes.pie does.
+
+    :param sizes: Slice sizes
+    :param start_angle: Angle in degrees where the first slice starts
+    :return: Tuple of (fractions, theta1, theta2) arrays, angles in degrees
+    """
+    sizes = np.asarray(sizes, dtype=float)
+    if np.any(sizes < 0):
+        raise ValueError("Wedge sizes must be non negative values")
+    total = sizes.sum()
+    if total == 0:
+        raise ValueError("All wedge sizes are zero")
+    fractions = sizes / total
+    boundaries = start_angle + 360 * np.concatenate(([0.0], np.cumsum(fractions)))
+    return fractions, boundaries[:-1], boundaries[1:]
+
+
+def drawable_segments(labels, sizes):
+    """
+    Make a budget drawable as a pie: a negative slice (a deficit, e.g. negative free money) becomes an
+    empty slice whose label shows the amount.
+
+    :param labels: Slice labels
+    :param sizes: Slice sizes, possibly negative
+    :return: Tuple of (labels, sizes) lists with no negative size
+    """
+    labels = [
+        f"{label} (deficit ${-size:,.2f})" if size < 0 else label
+        for label, size in zip(labels, sizes)
+    ]
+    return labels, [max(float(size), 0.0) for size in sizes]
+
+
+class PieChart:
+    def __init__(self, ax, canvas, render_cache=None, cache_bytes=32 * 1024 * 1024):
+        """
+        Initialize the PieChart on an existing axes and Agg-based canvas.
+
+        The wedge and text artists are created once and reused: each draw only
+        moves their angles and changes their text, instead of clearing the axes.
+
+        :param ax: Matplotlib axes to draw the pie on
+        :param canvas: FigureCanvasTkAgg or FigureCanvasQTAgg holding the axes
+        :param render_cache: RenderCache to share between charts (default is a new one)
+        :param cache_bytes: Memory cap of the new RenderCache when none is given
+        """
+        self.ax = ax
+        self.canvas = canvas
+        self.render_cache = render_cache if render_cache is not None else RenderCache(cache_bytes)
+        self.wedges = []
+        self._boundaries = np.empty(0)  # Cumulative end angle of each slice, measured from START_ANGLE
+        self._wedge_pool = []
+        self._text_pool = []
+        self._autotext_pool = []
+
+        self.ax.clear()
+        self.ax.set(frame_on=False, xticks=[], yticks=[])
+        self.ax.update_datalim([(-1, -1), (1, 1)])  # A full circle, whatever the slices are
+        self.ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
+
+    def draw(self, labels, sizes):
+        """
+        Show a pie chart of the given slices, reusing a cached rendering when possible.
+
+        Negative slices are drawn empty with their deficit in the label (see drawable_segments),
+        and a budget with nothing to show clears the chart.
+
+        :param labels: Slice labels
+        :param sizes: Slice sizes
+        """
+        labels, sizes = drawable_segments(labels, sizes)
+        if sum(sizes) == 0:
+            self._hide_artists(0)
+            self.wedges = []
+            self._boundaries = np.empty(0)
+            self.canvas.draw()
+            return
+
+        figure = self.ax.figure
+        key = budget_hash(labels, sizes, self.canvas.get_width_height(), figure.dpi)
+        entry = self.render_cache.get(key)
+        if entry is not None:
+            bitmap, layout = entry
+            self._update_artists(labels, layout)
+            self.canvas.restore_region(bitmap)
+            self.canvas.blit(figure.bbox)
+            return
+
+        layout = pie_layout(sizes)
+        self._update_artists(labels, layout)
+        self.canvas.draw()
+
+        bitmap = self.canvas.copy_from_bbox(figure.bbox)
+        width, height = self.canvas.get_width_height()
+        self.render_cache.put(key, (bitmap, layout), width * height * 4)
+
+    def wedge_index_at(self, x, y):
+        """
+        Find the slice under a point in display coordinates.
+
+        The point is converted to polar coordinates around the pie centre and its
+        angle is looked up in the cumulative slice angles with a binary search,
+        so the cost does not grow with the number of slices.
+
+        :param x: Display x coordinate of the mouse
+        :param y: Display y coordinate of the mouse
+        :return: Index of the slice, or None if the point is outside the pie
+        """
+        if not len(self._boundaries):
+            return None
+        data_x, data_y = self.ax.transData.inverted().transform((x, y))
+        if data_x * data_x + data_y * data_y > 1.0:
+            return None
+        angle = (np.degrees(np.arctan2(data_y, data_x)) - START_ANGLE) % 360
+        index = int(np.searchsorted(self._boundaries, angle, side='right'))
+        return min(index, len(self._boundaries) - 1)
+
+    def _grow_pools(self, count):
+        """Create artists until there are enough for count slices."""
+        while len(self._wedge_pool) < count:
+            wedge = Wedge((0, 0), 1, 0, 0, clip_on=False)
+            self.ax.add_patch(wedge)
+            self._wedge_pool.append(wedge)
+            self._text_pool.append(self.ax.text(0, 0, '', clip_on=False, verticalalignment='center', size=mpl.rcParams['xtick.labelsize']))
+            self._autotext_pool.append(self.ax.text(0, 0, '', clip_on=False, horizontalalignment='center', verticalalignment='center'))
+
+    def _hide_artists(self, count):
+        """Hide the pooled artists from index count on."""
+        for pool in (self._wedge_pool, self._text_pool, self._autotext_pool):
+            for artist in pool[count:]:
+                artist.set_visible(False)
+
+    def _update_artists(self, labels, layout):
+        """Move the pooled artists to the given slice layout and hide the unused ones."""
+        fractions, theta1, theta2 = layout
+        count = len(labels)
+        self._grow_pools(count)
+        colors = palette(count)
+
+        middle = np.deg2rad((theta1 + theta2) / 2)
+        cos_middle = np.cos(middle)
+        sin_middle = np.sin(middle)
+
+        for i in range(count):
+            wedge = self._wedge_pool[i]
+            wedge.set_theta1(theta1[i])
+            wedge.set_theta2(theta2[i])
+            wedge.set_facecolor(colors[i])
+            wedge.set_label(labels[i])
+            wedge.set_visible(True)
+
+            text = self._text_pool[i]
+            text.set_text(labels[i])
+            text.set_position((LABEL_DISTANCE * cos_middle[i], LABEL_DISTANCE * sin_middle[i]))
+            text.set_horizontalalignment('left' if cos_middle[i] > 0 else 'right')
+            text.set_visible(True)
+
+            autotext = self._autotext_pool[i]
+            autotext.set_text('%1.1f%%' % (100 * fractions[i]))
+            autotext.set_position((PCT_DISTANCE * cos_middle[i], PCT_DISTANCE * sin_middle[i]))
+            autotext.set_visible(True)
+
+        self._hide_artists(count)
+
+        self.wedges = self._wedge_pool[:count]
+        self._boundaries = theta2 - theta1[0]
@@ -0,0 +1,92 @@
+from collections import OrderedDict
+import hashlib
+
+
+def budget_hash(labels, sizes, *extra):
+    """
+    Hash the content of a chart so identical budgets map to the same cache key.
+
+    Sizes are rounded to the nearest hundredth of a cent so that float noise from
+    recomputing the same budget does not produce a new key.
+
+    :param labels: Slice labels
+    :param sizes: Slice sizes
+    :param extra: Any other values the rendering depends on (canvas size, dpi, ...)
+    :return: Hex digest string
+    """
+    content = (tuple(labels), tuple(round(float(size), 4) for size in sizes), extra)
+    return hashlib.blake2b(repr(content).encode(), digest_size=16).hexdigest()
+
+
+class RenderCache:
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        """
+        Initialize the RenderCache, a least-recently-used cache with a memory cap.
+
+        :param max_bytes: Maximum total size of the cached entries in bytes
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """
+        Look up an entry and mark it as most recently used.
+
+        :param key: Cache key, usually from budget_hash
+        :return: The cached value, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, size_bytes):
+        """
+        Store an entry, evicting the least recently used entries to stay under the memory cap.
+
+        Entries larger than the whole cap are not stored.
+
+        :param key: Cache key, usually from budget_hash
+        :param value: Value to cache
+        :param size_bytes: Approximate memory used by the value
+        """
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+        if size_bytes > self.max_bytes:
+            return
+        self._entries[key] = (value, size_bytes)
+        self.current_bytes += size_bytes
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_bytes
+
+    def clear(self):
+        """Remove every entry but keep the hit and miss counters."""
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self):
+        """
+        Summarize the cache usage.
+
+        :return: Dictionary with hits, misses, entries and bytes used
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+        }
@@ -0,0 +1,187 @@
+"""
+Compiled matching of transaction descriptions against categorization rules.
+
+Rules come in three kinds:
+
+- "exact": the whole (upper-cased, trimmed) description equals the pattern,
+  looked up in a hash index.
+- "contains": the pattern appears anywhere in the description. Beyond
+  AUTOMATON_THRESHOLD rules they are compiled into one Aho-Corasick automaton,
+  so a description is scanned once no matter how many rules there are; fewer
+  are faster checked one by one.
+- "regex": a regular expression. These are combined into one alternation and
+  matched in a single pass, each pattern in its own group. Patterns that would
+  not survive the combination (backreferences, named groups, inline global
+  flags) are matched on their own.
+
+Exact rules are tried first, then contains rules, then regex rules. Among
+contains rules the one listed first wins; among regex rules the leftmost match
+in the description wins.
+"""
+from collections import deque
+import re
+
+RULE_KINDS = ('exact', 'contains', 'regex')
+# Largest number of contains rules checked one by one instead of with the automaton
+AUTOMATON_THRESHOLD = 48
+# Regex features that change meaning or fail once a pattern is part of a larger alternation: numbered
+# backreferences and conditionals (the groups are renumbered), named groups (the names may clash) and
+# inline global flags (only allowed at the start of the whole expression)
+UNCOMBINABLE = re.compile(r'\\[1-9]|\(\?P[<=]|\(\?\(|\(\?[aiLmsux]+\)')
+
+
+class RuleEngine:
+    def __init__(self, rules=()):
+        """
+        Initialize the RuleEngine and compile the rules.
+
+        :param rules: Iterable of (pattern, target) or (pattern, target, kind) tuples; kind defaults to "contains"
+        """
+        self.exact = {}
+        self._targets = []  # Target of each contains rule, by priority
+        self._patterns = None  # Contains patterns, by priority, when they are checked one by one
+        self._regex_rules = []
+        self._regex = None  # Alternation of the combinable regex rules
+        self._separate = []  # (rule index, compiled pattern) of the regex rules matched on their own
+
+        # Aho-Corasick automaton: transitions that differ from the root's, and the best rule ending at each state
+        self._transitions = [{}]
+        self._best = [None]
+
+        contains_patterns = []
+        for rule in rules:
+            pattern, target = rule[0], rule[1]
+            kind = rule[2] if len(rule) > 2 else 'contains'
+            if kind == 'exact':
+                self.exact.setdefault(pattern.strip().upper(), target)
+            elif kind == 'contains':
+                contains_patterns.append(pattern.upper())
+                self._targets.append(target)
+            elif kind == 'regex':
+                self._regex_rules.append((pattern, target))
+            else:
+                raise ValueError(f"Unknown rule kind: {kind}")
+
+        if len(contains_patterns) > AUTOMATON_THRESHOLD:
+            self._build_automaton(contains_patterns)
+        else:
+            self._patterns = contains_patterns
+        self._compile_regex_rules()
+
+    def __len__(self):
+        return len(self.exact) + len(self._targets) + len(self._regex_rules)
+
+    def _compile_regex_rules(self):
+        """Combine the regex rules into one alternation, keeping the ones that cannot be combined separate."""
+        combined = []
+        for index, (pattern, _) in enumerate(self._regex_rules):
+            compiled = re.compile(pattern, re.IGNORECASE)  # Report an invalid pattern as itself
+            if UNCOMBINABLE.search(pattern):
+                self._separate.append((index, compiled))
+            else:
+                combined.append(f'(?P<r{index}>{pattern})')
+        if combined:
+            self._regex = re.compile('|'.join(combined), re.IGNORECASE)
+
+    def _match_regex(self, text):
+        """Index of the regex rule with the leftmost match, the first listed one among matches at the same place."""
+        best = None
+        if self._regex is not None:
+            result = self._regex.search(text)
+            if result is not None:
+                best = (result.start(), int(result.lastgroup[1:]))
+        for index, compiled in self._separate:
+            result = compiled.search(text)
+            if result is not None and (best is None or (result.start(), index) < best):
+                best = (result.start(), index)
+        return None if best is None else best[1]
+
+    def _build_automaton(self, patterns):
+        """Build the Aho-Corasick goto/fail structure and flatten it into a DFA."""
+        goto = [{}]
+        best = [None]
+        for priority, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = goto[state][char] = len(goto)
+                    goto.append({})
+                    best.append(None)
+                state = next_state
+            if best[state] is None or priority < best[state]:
+                best[state] = priority
+
+        # Breadth-first pass: fail links, merged outputs and full transitions
+        transitions = [dict(goto[0])]
+        transitions.extend({} for _ in range(len(goto) - 1))
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            fail_best = best[fail[state]]
+            if fail_best is not None and (best[state] is None or fail_best < best[state]):
+                best[state] = fail_best
+
+            # Inherit the fail state's transitions, then add this state's own
+            full = dict(transitions[fail[state]]) if fail[state] else {}
+            for char, child in goto[state].items():
+                fail[child] = self._step(transitions, fail[state], char)
+                full[char] = child
+                queue.append(child)
+            transitions[state] = full
+
+        # Keep only the transitions the root would not take anyway
+        root = transitions[0]
+        self._transitions = [root] + [
+            {char: target for char, target in table.items() if root.get(char, 0) != target}
+            for table in transitions[1:]
+        ]
+        self._best = best
+
+    @staticmethod
+    def _step(transitions, state, char):
+        """Follow one character from a state whose full transitions are already built."""
+        next_state = transitions[state].get(char)
+        if next_state is None:
+            next_state = transitions[0].get(char, 0) if state else 0
+        return next_state
+
+    def match(self, description):
+        """
+        Find the target of the best rule matching a description.
+
+        :param description: Transaction description
+        :return: Target of the matching rule, or None
+        """
+        text = description.strip().upper()
+        target = self.exact.get(text)
+        if target is not None:
+            return target
+
+        if self._patterns is not None:
+            for priority, pattern in enumerate(self._patterns):
+                if pattern in text:
+                    return self._targets[priority]
+        elif self._targets:
+            transitions = self._transitions
+            root = transitions[0]
+            best = self._best
+            state = 0
+            found = None
+            for char in text:
+                next_state = transitions[state].get(char)
+                state = root.get(char, 0) if next_state is None else next_state
+                priority = best[state]
+                if priority is not None and (found is None or priority < found):
+                    found = priority
+                    if found == 0:
+                        break
+            if found is not None:
+                return self._targets[found]
+
+        if self._regex_rules:
+            index = self._match_regex(text)
+            if index is not None:
+                return self._regex_rules[index][1]
+        return None
@@ -0,0 +1,200 @@
+"""
+Resumable multiprocess batch runs over files of household or loan profiles.
+
+The input is JSON Lines, one profile per line. It is cut into chunks of
+consecutive lines, each chunk is computed in a worker process and written to
+its own part file in a checkpoint directory next to the output, and once every
+part exists they are merged in order into the output file. Part files are
+written under a temporary name and renamed when complete, so after an
+interruption a rerun only computes the chunks that have no part file yet.
+"""
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import json
+import os
+import shutil
+import sys
+import time
+
+from .service import COMPUTATIONS
+
+
+def chunk_lines(path, chunk_size):
+    """
+    Read the non-empty lines of a file in chunks.
+
+    :param path: Input file path
+    :param chunk_size: Number of lines per chunk
+    :return: Generator of (chunk index, list of lines)
+    """
+    chunk = []
+    index = 0
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                chunk.append(line)
+                if len(chunk) == chunk_size:
+                    yield index, chunk
+                    index += 1
+                    chunk = []
+    if chunk:
+        yield index, chunk
+
+
+def count_lines(path):
+    """
+    Count the non-empty lines of a file.
+
+    :param path: Input file path
+    :return: Number of lines
+    """
+    with open(path) as file:
+        return sum(1 for line in file if line.strip())
+
+
+def run_chunk(kind, lines, part_path):
+    """
+    Compute one chunk and write its results to a part file; runs in the worker processes.
+
+    Items that cannot be computed, or whose result is not finite, produce an {"error": ...} line,
+    so output lines stay aligned with input lines.
+
+    :param kind: Computation name from service.COMPUTATIONS
+    :param lines: JSON lines of the chunk
+    :param part_path: Part file to write
+    :return: Number of items computed
+    """
+    compute = COMPUTATIONS[kind]
+    results = []
+    for line in lines:
+        try:
+            # NaN and infinity are not JSON, so a result holding them is an error too
+            results.append(json.dumps(compute(json.loads(line)), separators=(',', ':'), allow_nan=False))
+        except Exception as e:
+            results.append(json.dumps({"error": f"{type(e).__name__}: {e}"}, separators=(',', ':')))
+    temporary_path = part_path + '.tmp'
+    with open(temporary_path, 'w') as file:
+        file.write('\n'.join(results) + '\n')
+    os.replace(temporary_path, part_path)
+    return len(lines)
+
+
+class Progress:
+    def __init__(self, total, stream=sys.stderr, interval=0.5):
+        """
+        Initialize the Progress report.
+
+        :param total: Number of items to compute
+        :param stream: Stream to write the report to
+        :param interval: Least number of seconds between two reports
+        """
+        self.total = total
+        self.done = 0
+        self.skipped = 0  # Items done in an earlier run, left out of the throughput
+        self.stream = stream
+        self.interval = interval
+        self.start = time.perf_counter()
+        self._last_report = 0.0
+
+    def skip(self, count):
+        """
+        Count items that were already done in an earlier run.
+
+        :param count: Number of items skipped
+        """
+        self.done += count
+        self.skipped += count
+
+    def advance(self, count, force=False):
+        """
+        Count finished items and report throughput and ETA when the interval has passed.
+
+        :param count: Number of items just finished
+        :param force: Report even if the interval has not passed
+        """
+        self.done += count
+        now = time.perf_counter()
+        if not force and now - self._last_report < self.interval:
+            return
+        self._last_report = now
+        rate = (self.done - self.skipped) / max(now - self.start, 1e-9)
+        eta = (self.total - self.done) / rate if rate else float('inf')
+        self.stream.write(f"\r{self.done:,}/{self.total:,} items, {rate:,.0f} items/s, ETA {eta:,.0f} s   ")
+        self.stream.flush()
+
+    def finish(self):
+        """Write the final report line."""
+        self.advance(0, force=True)
+        self.stream.write("\n")
+
+
+def run_batch(input_path, output_path, kind, workers=None, chunk_size=1000, progress=True):
+    """
+    Compute every profile of a JSON Lines file into a JSON Lines output, resuming an interrupted run.
+
+    :param input_path: Input file, one profile per line
+    :param output_path: Output file, one result per line in input order
+    :param kind: Computation name from service.COMPUTATIONS, e.g. "budget" or "loan"
+    :param workers: Number of worker processes (default is one per CPU)
+    :param chunk_size: Number of lines per chunk and part file
+    :param progress: Report throughput and ETA on stderr
+    :return: Number of items computed in this run (chunks done in an earlier run are not counted)
+    """
+    if kind not in COMPUTATIONS:
+        raise ValueError(f"Unknown computation: {kind}")
+
+    # The checkpoint only applies to the same input, computation and chunking
+    checkpoint_dir = output_path + '.parts'
+    stat = os.stat(input_path)
+    manifest = {
+        'input': os.path.abspath(input_path), 'size': stat.st_size, 'mtime': stat.st_mtime,
+        'kind': kind, 'chunk_size': chunk_size,
+    }
+    manifest_path = os.path.join(checkpoint_dir, 'manifest.json')
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as file:
+            if json.load(file) != manifest:
+                raise ValueError(f"{checkpoint_dir} belongs to a different run; delete it to start over")
+    else:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        with open(manifest_path, 'w') as file:
+            json.dump(manifest, file)
+
+    def part_path(index):
+        return os.path.join(checkpoint_dir, f'part-{index:06d}.jsonl')
+
+    total = count_lines(input_path)
+    report = Progress(total, interval=0.5 if progress else float('inf'))
+    chunks = 0
+    computed = 0
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        max_in_flight = 2 * workers
+        in_flight = set()
+        for index, lines in chunk_lines(input_path, chunk_size):
+            chunks += 1
+            if os.path.exists(part_path(index)):
+                # Done in an earlier run
+                report.skip(len(lines))
+                continue
+            # Bound the chunks held in memory while the workers catch up
+            while len(in_flight) >= max_in_flight:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    computed += future.result()
+                    report.advance(future.result())
+            in_flight.add(pool.submit(run_chunk, kind, lines, part_path(index)))
+        for future in in_flight:
+            computed += future.result()
+            report.advance(future.result())
+    if progress:
+        report.finish()
+
+    # Merge the parts in input order, then drop the checkpoint
+    temporary_path = output_path + '.tmp'
+    with open(temporary_path, 'w') as output:
+        for index in range(chunks):
+            with open(part_path(index)) as part:
+                shutil.copyfileobj(part, output)
+    os.replace(temporary_path, output_path)
+    shutil.rmtree(checkpoint_dir)
+    return computed
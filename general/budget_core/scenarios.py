@@ -0,0 +1,246 @@
+"""
+Workspace of variant budgets that share their unchanged inputs copy-on-write.
+
+Every scenario holds the three budget components (MonthlyNetIncome,
+MortgageAndDebt, Utilities). A new scenario starts out sharing the component
+objects of the scenario it is based on, and a component is only copied the first
+time one of the scenarios sharing it changes it, so dozens of variants take
+little more memory than their differences. Each scenario keeps its computed
+MonthlyBudget until one of its inputs changes, so refreshing the results only
+recomputes the scenarios changed since.
+
+Change scenarios through set, add_item and update: changing a component in
+place would change every scenario sharing it, and recompute none of them.
+"""
+import copy
+
+import numpy as np
+
+from .budget import MonthlyBudget, SUMMARY_LABELS
+from .expenses import ItemizedExpenses
+
+COMPONENTS = ('monthly_net_income', 'mortgage_and_debt', 'utilities')
+# Rows of the side-by-side comparison: the pie summary, then the leftover part of the free money
+COMPARISON_ROWS = tuple(SUMMARY_LABELS) + ('Leftover',)
+
+
+def _equal(current, value):
+    """Whether two inputs are the same, comparing NumPy arrays (also inside lists and tuples) by content."""
+    if current is value:
+        return True
+    if isinstance(current, np.ndarray) or isinstance(value, np.ndarray):
+        return np.shape(current) == np.shape(value) and bool(np.array_equal(current, value))
+    if isinstance(current, (list, tuple)) and isinstance(value, (list, tuple)):
+        return len(current) == len(value) and all(_equal(a, b) for a, b in zip(current, value))
+    return bool(current == value)
+
+
+def _state(component):
+    """Comparable content of a budget component: its attributes, or the monthly totals of its line items."""
+    if isinstance(component, ItemizedExpenses):
+        return component.breakdown()
+    return sorted(vars(component).items())
+
+
+class ScenarioWorkspace:
+    def __init__(self, monthly_net_income, mortgage_and_debt, utilities, base_name="Base"):
+        """
+        Initialize the ScenarioWorkspace with a base scenario.
+
+        :param monthly_net_income: Instance of MonthlyNetIncome
+        :param mortgage_and_debt: Instance of MortgageAndDebt
+        :param utilities: Instance of Utilities
+        :param base_name: Name of the base scenario
+        """
+        self.base_name = base_name
+        self.recomputed = 0  # Number of budgets computed so far
+        self._components = {}  # Scenario name -> {component name: object}
+        self._owned = {}  # Scenario name -> component names no other scenario shares
+        self._budgets = {}  # Scenario name -> MonthlyBudget, until its inputs change
+        self._components[base_name] = dict(zip(COMPONENTS, (monthly_net_income, mortgage_and_debt, utilities)))
+        self._owned[base_name] = set()
+
+    def __len__(self):
+        return len(self._components)
+
+    def __contains__(self, name):
+        return name in self._components
+
+    def names(self):
+        """
+        Names of the scenarios, in the order they were added.
+
+        :return: List of names
+        """
+        return list(self._components)
+
+    def add_scenario(self, name, based_on=None):
+        """
+        Add a scenario sharing every component of another one until either of them changes it.
+
+        :param name: Name of the new scenario
+        :param based_on: Name of the scenario to start from (default is the base scenario)
+        """
+        if name in self._components:
+            raise ValueError(f"Scenario already exists: {name}")
+        based_on = self.base_name if based_on is None else based_on
+        self._components[name] = dict(self._components[based_on])
+        # Both scenarios share the components now, so either copies before changing them
+        self._owned[based_on] = set()
+        self._owned[name] = set()
+        if based_on in self._budgets:
+            self._budgets[name] = self._budgets[based_on]
+
+    def remove_scenario(self, name):
+        """
+        Remove a scenario; the base scenario cannot be removed.
+
+        :param name: Name of the scenario
+        """
+        if name == self.base_name:
+            raise ValueError("The base scenario cannot be removed")
+        del self._components[name]
+        del self._owned[name]
+        self._budgets.pop(name, None)
+
+    def components(self, name):
+        """
+        Budget components of a scenario, to read but not to change in place.
+
+        :param name: Name of the scenario
+        :return: Tuple of (MonthlyNetIncome, MortgageAndDebt, Utilities)
+        """
+        components = self._components[name]
+        return tuple(components[component] for component in COMPONENTS)
+
+    def _writable(self, name, component):
+        """The component of a scenario, copied first if other scenarios may share it."""
+        if component not in COMPONENTS:
+            raise KeyError(f"Unknown component: {component}")
+        if component not in self._owned[name]:
+            # A deep copy, so the scenarios do not share the bracket lists or the ledger arrays either
+            self._components[name][component] = copy.deepcopy(self._components[name][component])
+            self._owned[name].add(component)
+        self._budgets.pop(name, None)
+        return self._components[name][component]
+
+    def set(self, name, component, attribute, value):
+        """
+        Change one input of a scenario, e.g. set("Cheaper Rent", "mortgage_and_debt", "rent", 1200).
+
+        :param name: Name of the scenario
+        :param component: Name from COMPONENTS
+        :param attribute: Attribute of the component, e.g. "gross_annual_salary" or "internet"
+        :param value: New value
+        """
+        current = self._components[name][component]
+        if not hasattr(current, attribute):
+            raise AttributeError(f"{type(current).__name__} has no attribute {attribute!r}")
+        if _equal(getattr(current, attribute), value):
+            return
+        setattr(self._writable(name, component), attribute, value)
+
+    def add_item(self, name, component, label, amount, frequency='monthly'):
+        """
+        Add an extra line item to the mortgage and debt or utilities of a scenario.
+
+        :param name: Name of the scenario
+        :param component: "mortgage_and_debt" or "utilities"
+        :param label: Name of the line item
+        :param amount: Amount of each payment
+        :param frequency: Name from ledger.FREQUENCIES or payments per year (default is monthly)
+        """
+        if component == 'monthly_net_income':
+            raise KeyError("Line items can only be added to mortgage_and_debt or utilities")
+        self._writable(name, component).add_item(label, amount, frequency)
+
+    def update(self, name, monthly_net_income, mortgage_and_debt, utilities):
+        """
+        Replace the inputs of a scenario, keeping the components whose content did not change shared.
+
+        :param name: Name of the scenario
+        :param monthly_net_income: Instance of MonthlyNetIncome
+        :param mortgage_and_debt: Instance of MortgageAndDebt
+        :param utilities: Instance of Utilities
+        :return: Names of the components that changed
+        """
+        changed = []
+        components = self._components[name]
+        for component, new in zip(COMPONENTS, (monthly_net_income, mortgage_and_debt, utilities)):
+            if _equal(_state(new), _state(components[component])):
+                continue
+            # The new object belongs to the caller, so the next change through the workspace copies it
+            components[component] = new
+            self._owned[name].discard(component)
+            changed.append(component)
+        if changed:
+            self._budgets.pop(name, None)
+        return changed
+
+    def budget(self, name):
+        """
+        MonthlyBudget of a scenario, computed again only if its inputs changed since the last call.
+
+        :param name: Name of the scenario
+        :return: Instance of MonthlyBudget
+        """
+        budget = self._budgets.get(name)
+        if budget is None:
+            budget = self._budgets[name] = MonthlyBudget(*self.components(name))
+            budget.annual_figures()
+            self.recomputed += 1
+        return budget
+
+    def results(self, period='monthly', names=None):
+        """
+        Side-by-side results of the scenarios.
+
+        :param period: Name from ledger.PERIODS, e.g. "weekly" or "annual" (default is monthly)
+        :param names: Scenario names to include (default is every scenario)
+        :return: Dictionary of scenario name to {row label: amount} over COMPARISON_ROWS
+        """
+        results = {}
+        for name in self.names() if names is None else names:
+            budget = self.budget(name)
+            _, sizes = budget.summary_segments(period)
+            _, free_money = budget.breakdown_segments('Free Money', period)
+            results[name] = dict(zip(COMPARISON_ROWS, sizes + free_money[:1]))
+        return results
+
+    def to_text(self, period='monthly', names=None):
+        """
+        Render the side-by-side results as a fixed-width text table, one column per scenario.
+
+        :param period: Name from ledger.PERIODS (default is monthly)
+        :param names: Scenario names to include (default is every scenario)
+        :return: Table as a string
+        """
+        results = self.results(period, names)
+        label_width = max(len(row) for row in COMPARISON_ROWS)
+        widths = [max(len(name), 12) for name in results]
+        lines = [
+            "  ".join([" " * label_width] + [name.rjust(width) for name, width in zip(results, widths)]),
+            "  ".join("-" * width for width in [label_width] + widths),
+        ]
+        for row in COMPARISON_ROWS:
+            cells = [row.ljust(label_width)]
+            for result, width in zip(results.values(), widths):
+                value = result[row]
+                cells.append((f"-${-value:,.2f}" if value < 0 else f"${value:,.2f}").rjust(width))
+            lines.append("  ".join(cells))
+        return "\n".join(lines)
+
+    def stats(self):
+        """
+        Sharing and recomputation counters.
+
+        :return: Dictionary with scenarios, components (distinct component objects held), copies (components held
+                 beyond one set of three) and recomputed (budgets computed so far)
+        """
+        distinct = {id(component) for components in self._components.values() for component in components.values()}
+        return {
+            'scenarios': len(self._components),
+            'components': len(distinct),
+            'copies': len(distinct) - len(COMPONENTS),
+            'recomputed': self.recomputed,
+        }
@@ -0,0 +1,222 @@
+"""
+Headless JSON computation of budgets and loan schedules, served by budget_service.py.
+
+Requests hold one item or a batch of items. Each item is canonicalized and
+hashed, and its encoded JSON result is kept in a least-recently-used cache, so
+repeated inputs are answered without computing or encoding anything. Large
+batches of cache misses are split into chunks and computed in a process pool.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import json
+import threading
+
+from .amortization import loan_schedule_columns, monthly_payment
+from .budget import MonthlyBudget
+from .expenses import MortgageAndDebt, Utilities
+from .income import MonthlyNetIncome
+from .render_cache import RenderCache
+from .tax_registry import tax_tables
+
+INCOME_FIELDS = (
+    'gross_annual_salary', 'federal_tax_brackets', 'state_tax_brackets', 'local_tax_rate', 'fica_rate',
+    'medicare_annual_cost', 'retirement_contribution_annual', 'savings_rate', 'car_insurance_annual_cost',
+)
+# Optional MonthlyNetIncome arguments, left at their defaults when a profile omits them
+PAYROLL_FIELDS = ('social_security_brackets', 'medicare_tax_brackets')
+PRE_TAX_FIELDS = ('pre_tax_deductions_annual', 'retirement_pre_tax')
+
+
+def _brackets(value):
+    """Brackets from JSON as a list of tuples, or None."""
+    return None if value is None else [tuple(bracket) for bracket in value]
+
+
+def _object(container, field, default=None):
+    """A field that must hold a JSON object, e.g. the utilities of a profile."""
+    value = container[field] if default is None else container.get(field, default)
+    if not isinstance(value, dict):
+        raise TypeError(f"{field} must be a JSON object")
+    return value
+
+
+def _canonical(value):
+    """Normalize a JSON value so equal inputs encode the same way (e.g. 1500 and 1500.0)."""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    raise TypeError(f"Unsupported value in request: {value!r}")
+
+
+def canonical_key(kind, item):
+    """
+    Hash a request item so equal inputs share a cache entry whatever their key order or number formatting.
+
+    :param kind: Computation name, e.g. "budget"
+    :param item: Decoded JSON item
+    :return: Hex digest string
+    """
+    content = json.dumps([kind, _canonical(item)], sort_keys=True, separators=(',', ':'))
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def compute_budget(profile):
+    """
+    Compute the budget of one household.
+
+    :param profile: Dictionary with "income" (MonthlyNetIncome arguments, or a location for the tax
+                    tables, see TaxTableRegistry.resolve_income), "mortgage_and_debt" and
+                    "utilities" (monthly line items), optional "extra_items" ({"mortgage_and_debt" or
+                    "utilities": [[label, amount], ...]}) and optional "period" (default is monthly)
+    :return: Dictionary with the period, net income, leftover and free money, summary and breakdowns
+    """
+    income = tax_tables.resolve_income(_object(profile, 'income'))
+    monthly_net_income = MonthlyNetIncome(
+        *(_brackets(income[field]) if field.endswith('_brackets') else income[field] for field in INCOME_FIELDS),
+        **{field: _brackets(income.get(field)) for field in PAYROLL_FIELDS},
+        **{field: income.get(field, 0) for field in PRE_TAX_FIELDS}
+    )
+    mortgage_and_debt = MortgageAndDebt(**_object(profile, 'mortgage_and_debt'))
+    utilities = Utilities(**_object(profile, 'utilities'))
+    extra_items = _object(profile, 'extra_items', {})
+    for label, amount in extra_items.get('mortgage_and_debt', ()):
+        mortgage_and_debt.add_item(label, amount)
+    for label, amount in extra_items.get('utilities', ()):
+        utilities.add_item(label, amount)
+
+    period = profile.get('period', 'monthly')
+    budget = MonthlyBudget(monthly_net_income, mortgage_and_debt, utilities)
+    labels, sizes = budget.summary_segments(period)
+    summary = dict(zip(labels, sizes))
+    breakdowns = {label: dict(zip(*budget.breakdown_segments(label, period))) for label in labels}
+    return {
+        'period': period,
+        'net_income': monthly_net_income.calculate_net_income(period),
+        'leftover_money': breakdowns['Free Money']['Leftover'],
+        'free_money': summary['Free Money'],
+        'summary': summary,
+        'breakdowns': breakdowns,
+    }
+
+
+def compute_loan(request):
+    """
+    Compute the schedule of one loan.
+
+    :param request: Dictionary with "principal", "annual_rate", "years", optional "extra_payment"
+                    and optional "include_schedule" (default is true)
+    :return: Dictionary with the monthly payment, number of months, total interest and the schedule
+    """
+    years = request['years']
+    if int(years) != years or years <= 0:
+        raise ValueError("years must be a positive whole number")
+    schedule = loan_schedule_columns(request['principal'], request['annual_rate'], int(years), request.get('extra_payment', 0))
+    result = {
+        'monthly_payment': monthly_payment(request['principal'], request['annual_rate'], int(years) * 12),
+        'months': len(schedule),
+        'total_interest': schedule.total_interest,
+    }
+    if request.get('include_schedule', True):
+        result['schedule'] = schedule.to_records()
+    return result
+
+
+COMPUTATIONS = {
+    'budget': compute_budget,
+    'loan': compute_loan,
+}
+
+
+def compute_encoded(kind, items):
+    """
+    Compute a batch of items and encode each result as JSON; runs in the worker processes.
+
+    :param kind: Computation name from COMPUTATIONS
+    :param items: List of decoded JSON items
+    :return: List of encoded results
+    """
+    compute = COMPUTATIONS[kind]
+    return [json.dumps(compute(item), separators=(',', ':')).encode() for item in items]
+
+
+class BudgetService:
+    def __init__(self, workers=None, pool_threshold=32, chunk_size=64, cache_bytes=16 * 1024 * 1024):
+        """
+        Initialize the BudgetService.
+
+        :param workers: Size of the process pool, 0 to compute everything in the calling thread (default is one per CPU)
+        :param pool_threshold: Smallest number of cache misses in one request that goes to the pool
+        :param chunk_size: Number of items per pool task
+        :param cache_bytes: Memory cap of the response cache
+        """
+        self.pool = ProcessPoolExecutor(workers) if workers != 0 else None
+        self.pool_threshold = pool_threshold
+        self.chunk_size = chunk_size
+        self.cache = RenderCache(cache_bytes)
+        self._cache_lock = threading.Lock()  # Request handler threads share the cache
+
+    def close(self):
+        """Shut down the process pool."""
+        if self.pool is not None:
+            self.pool.shutdown()
+
+    def handle(self, kind, payload):
+        """
+        Answer a request for one item or a batch.
+
+        :param kind: Computation name from COMPUTATIONS
+        :param payload: Decoded JSON body: one item, a list of items, or {"items": [...]}
+        :return: Encoded JSON response, a single result or a list of results like the payload
+        """
+        if kind not in COMPUTATIONS:
+            raise KeyError(kind)
+        batch = isinstance(payload, list) or (isinstance(payload, dict) and 'items' in payload)
+        items = payload if isinstance(payload, list) else payload['items'] if batch else [payload]
+        if not all(isinstance(item, dict) for item in items):
+            raise ValueError("Every item must be a JSON object")
+
+        keys = [canonical_key(kind, item) for item in items]
+        results = [None] * len(items)
+        with self._cache_lock:
+            for index, key in enumerate(keys):
+                results[index] = self.cache.get(key)
+
+        # Compute each distinct missing item once
+        missing = {}
+        for index, key in enumerate(keys):
+            if results[index] is None:
+                missing.setdefault(key, index)
+        if missing:
+            pending = list(missing.items())
+            encoded = self._compute(kind, [items[index] for _, index in pending])
+            computed = dict(zip((key for key, _ in pending), encoded))
+            with self._cache_lock:
+                for key, value in computed.items():
+                    self.cache.put(key, value, len(value))
+            results = [computed[key] if value is None else value for key, value in zip(keys, results)]
+
+        return b'[' + b','.join(results) + b']' if batch else results[0]
+
+    def _compute(self, kind, items):
+        """Compute items inline, or in chunks on the process pool when there are enough of them."""
+        if self.pool is None or len(items) < self.pool_threshold:
+            return compute_encoded(kind, items)
+        chunks = [items[start:start + self.chunk_size] for start in range(0, len(items), self.chunk_size)]
+        encoded = []
+        for chunk_results in self.pool.map(compute_encoded, [kind] * len(chunks), chunks):
+            encoded.extend(chunk_results)
+        return encoded
+
+    def stats(self):
+        """
+        Summarize the response cache usage.
+
+        :return: Dictionary from RenderCache.stats
+        """
+        with self._cache_lock:
+            return self.cache.stats()
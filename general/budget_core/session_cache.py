@@ -0,0 +1,117 @@
+"""
+On-disk snapshot of the last GUI session, so the next launch can paint at once.
+
+The V4 front end saves the summary it last showed (period, slice labels and
+sizes) and a PNG of its pie chart when it quits. On the next launch its window
+shell shows that image and those values while matplotlib is imported and the
+real chart is built. A snapshot is only used for the same household and the
+same inputs, checked with inputs_key, which needs no tax calculation.
+Only the standard library is used here, so loading a snapshot is cheap.
+"""
+import hashlib
+import json
+import os
+import time
+
+SESSION_VERSION = 1
+
+
+def default_session_path():
+    """
+    Location of the session snapshot used by the GUI scripts, next to the history database.
+
+    :return: Directory inside ~/.budget_calculator
+    """
+    return os.path.join(os.path.expanduser('~'), '.budget_calculator', 'session')
+
+
+def inputs_key(monthly_net_income, mortgage_and_debt, utilities):
+    """
+    Hash the inputs of a budget, so a snapshot is only reused for the budget it was computed from.
+
+    :param monthly_net_income: Instance of MonthlyNetIncome
+    :param mortgage_and_debt: Instance of MortgageAndDebt
+    :param utilities: Instance of Utilities
+    :return: Hex digest string
+    """
+    content = (
+        sorted(vars(monthly_net_income).items()),
+        mortgage_and_debt.breakdown(),
+        utilities.breakdown(),
+    )
+    return hashlib.blake2b(repr(content).encode(), digest_size=16).hexdigest()
+
+
+class SessionCache:
+    def __init__(self, directory):
+        """
+        Initialize the SessionCache, stored as session.json and chart.png in a directory.
+
+        :param directory: Directory of the snapshot files (created on the first save)
+        """
+        self.directory = directory
+        self.state_path = os.path.join(directory, 'session.json')
+        self.image_path = os.path.join(directory, 'chart.png')
+
+    def load(self, household, key=None):
+        """
+        Read the snapshot of the last session.
+
+        :param household: Household identifier the snapshot must belong to
+        :param key: inputs_key the snapshot must match (default is to accept any inputs)
+        :return: Dictionary with key, household, period, labels, sizes, saved_at and image (path of
+                 the chart PNG, or None), or None when there is no usable snapshot
+        """
+        try:
+            with open(self.state_path, encoding='utf-8') as file:
+                state = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get('version') != SESSION_VERSION:
+            return None
+        if state.get('household') != household or (key is not None and state.get('key') != key):
+            return None
+        state['image'] = self.image_path if os.path.exists(self.image_path) else None
+        return state
+
+    def save(self, household, key, period, labels, sizes, image=None):
+        """
+        Write the snapshot of the current session, replacing the previous one.
+
+        :param household: Household identifier
+        :param key: inputs_key of the budget shown
+        :param period: Period of the summary, e.g. "Monthly"
+        :param labels: Summary slice labels
+        :param sizes: Summary slice sizes
+        :param image: PNG bytes of the chart (default is to drop the previous image)
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        state = {
+            'version': SESSION_VERSION,
+            'household': household,
+            'key': key,
+            'period': period,
+            'labels': list(labels),
+            'sizes': [float(size) for size in sizes],
+            'saved_at': time.time(),
+        }
+        # Write to temporary files and rename, so a crash never leaves half a snapshot
+        if image is not None:
+            self._replace(self.image_path, image)
+        elif os.path.exists(self.image_path):
+            os.remove(self.image_path)
+        self._replace(self.state_path, json.dumps(state).encode('utf-8'))
+
+    def clear(self):
+        """Delete the snapshot files."""
+        for path in (self.state_path, self.image_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    @staticmethod
+    def _replace(path, content):
+        """Atomically replace a file with new content."""
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(content)
+        os.replace(temporary, path)
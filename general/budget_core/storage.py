@@ -0,0 +1,331 @@
+"""
+SQLite-backed history of budget snapshots.
+
+Each snapshot stores the MonthlyNetIncome, MortgageAndDebt and Utilities inputs
+of a household for one period ("YYYY-MM", or "YYYY-MM-DD" for daily data)
+together with the computed results, so history queries never recompute taxes.
+"""
+import json
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+from .expenses import MortgageAndDebt, Utilities
+from .income import MonthlyNetIncome
+
+INCOME_COLUMNS = (
+    'gross_annual_salary', 'local_tax_rate', 'fica_rate', 'medicare_annual_cost',
+    'retirement_contribution_annual', 'savings_rate', 'car_insurance_annual_cost',
+    'pre_tax_deductions_annual', 'retirement_pre_tax',
+)
+# Bracket lists of MonthlyNetIncome, stored as JSON; the payroll ones are NULL when not set
+BRACKET_COLUMNS = ('federal_tax_brackets', 'state_tax_brackets', 'social_security_brackets', 'medicare_tax_brackets')
+DEBT_COLUMNS = tuple(attribute for attribute, _ in MortgageAndDebt.FIELDS)
+UTILITY_COLUMNS = tuple(attribute for attribute, _ in Utilities.FIELDS)
+RESULT_COLUMNS = (
+    'federal_tax', 'state_tax', 'total_taxes', 'net_monthly_income',
+    'total_monthly_debt', 'total_monthly_utilities', 'leftover_money', 'free_money',
+)
+TEXT_COLUMNS = ('household', 'period') + BRACKET_COLUMNS + ('extra_items',)
+# Columns added after the first release, with the value older snapshots get: the defaults of MonthlyNetIncome
+ADDED_COLUMNS = {
+    'social_security_brackets': None,
+    'medicare_tax_brackets': None,
+    'pre_tax_deductions_annual': 0.0,
+    'retirement_pre_tax': 0.0,
+}
+SNAPSHOT_COLUMNS = (
+    ('household', 'period', 'created_at') + BRACKET_COLUMNS
+    + INCOME_COLUMNS + DEBT_COLUMNS + UTILITY_COLUMNS + ('extra_items',) + RESULT_COLUMNS
+)
+
+
+def default_history_path():
+    """
+    Location of the history database used by the GUI scripts.
+
+    :return: Path inside ~/.budget_calculator
+    """
+    return os.path.join(os.path.expanduser('~'), '.budget_calculator', 'history.sqlite3')
+
+
+def _dump_brackets(brackets):
+    """Brackets as JSON, or None when they are not set."""
+    return None if brackets is None else json.dumps(brackets)
+
+
+def _load_brackets(text):
+    """Brackets back from JSON, as a list of (limit, rate) tuples, or None."""
+    return None if text is None else [tuple(bracket) for bracket in json.loads(text)]
+
+
+def _brackets_key(brackets):
+    """Brackets as a tuple of (limit, rate) tuples, or None, to group snapshots by."""
+    return None if brackets is None else tuple(tuple(bracket) for bracket in brackets)
+
+
+def _snapshot_inputs(monthly_net_income, mortgage_and_debt, utilities):
+    """Values of the income, debt and utility columns and the extra items of a snapshot."""
+    extra_items = {
+        'mortgage_and_debt': mortgage_and_debt.extra_items(),
+        'utilities': utilities.extra_items(),
+    }
+    return (
+        tuple(float(getattr(monthly_net_income, column)) for column in INCOME_COLUMNS)
+        + tuple(getattr(mortgage_and_debt, column) for column in DEBT_COLUMNS)
+        + tuple(getattr(utilities, column) for column in UTILITY_COLUMNS)
+        + (json.dumps(extra_items),)
+    )
+
+
+def _results(stages, total_monthly_debt, total_monthly_utilities, retirement_contribution_annual):
+    """Values of the RESULT_COLUMNS from the deduction stages; works on numbers and on NumPy arrays."""
+    net_monthly_income = stages['net_annual_income'] / 12
+    leftover_money = net_monthly_income - total_monthly_debt - total_monthly_utilities
+    return (
+        stages['federal_tax'], stages['state_tax'], stages['total_taxes'], net_monthly_income,
+        total_monthly_debt, total_monthly_utilities, leftover_money, leftover_money + retirement_contribution_annual / 12,
+    )
+
+
+def snapshot_row(household, period, monthly_net_income, mortgage_and_debt, utilities, created_at=None):
+    """
+    Build the database row of a snapshot, computing its results once.
+
+    Use snapshot_rows to build many rows at once.
+
+    :param household: Household identifier
+    :param period: Period as "YYYY-MM" or "YYYY-MM-DD"
+    :param monthly_net_income: Instance of MonthlyNetIncome
+    :param mortgage_and_debt: Instance of MortgageAndDebt
+    :param utilities: Instance of Utilities
+    :param created_at: Unix time of the snapshot (default is now)
+    :return: Tuple of values in SNAPSHOT_COLUMNS order
+    """
+    results = _results(
+        monthly_net_income.calculate_deduction_stages(),
+        mortgage_and_debt.calculate_total_monthly_debt(),
+        utilities.calculate_total_monthly_utilities(),
+        monthly_net_income.retirement_contribution_annual
+    )
+    return (
+        (household, period, time.time() if created_at is None else created_at)
+        + tuple(_dump_brackets(getattr(monthly_net_income, column)) for column in BRACKET_COLUMNS)
+        + _snapshot_inputs(monthly_net_income, mortgage_and_debt, utilities)
+        + tuple(float(value) for value in results)
+    )
+
+
+def snapshot_rows(snapshots, created_at=None):
+    """
+    Build the database rows of many snapshots, computing their results together.
+
+    The inputs of each snapshot are read as it comes, but the taxes of all the snapshots
+    that share tax brackets are computed at the end in one pass over NumPy arrays, like
+    budget_batch, instead of one snapshot at a time.
+
+    :param snapshots: Iterable of (household, period, monthly_net_income, mortgage_and_debt, utilities) tuples
+    :param created_at: Unix time of the snapshots (default is now)
+    :return: List of tuples in SNAPSHOT_COLUMNS order, as snapshot_row builds them
+    """
+    created_at = time.time() if created_at is None else created_at
+    rows = []  # Every column up to the results
+    expenses = []  # Monthly debt and utilities of each row
+    groups = {}  # Bracket keys -> indexes of the rows using them
+    bracket_texts = {}  # Bracket key -> JSON, dumped once per distinct bracket list
+    for index, (household, period, monthly_net_income, mortgage_and_debt, utilities) in enumerate(snapshots):
+        keys = tuple(_brackets_key(getattr(monthly_net_income, column)) for column in BRACKET_COLUMNS)
+        groups.setdefault(keys, []).append(index)
+        for key in keys:
+            if key not in bracket_texts:
+                bracket_texts[key] = _dump_brackets(key)
+        rows.append(
+            (household, period, created_at) + tuple(bracket_texts[key] for key in keys)
+            + _snapshot_inputs(monthly_net_income, mortgage_and_debt, utilities)
+        )
+        expenses.append((mortgage_and_debt.calculate_total_monthly_debt(), utilities.calculate_total_monthly_utilities()))
+    if not rows:
+        return []
+
+    first_income = 3 + len(BRACKET_COLUMNS)
+    income_columns = dict(zip(INCOME_COLUMNS, np.array([row[first_income:first_income + len(INCOME_COLUMNS)] for row in rows]).T))
+    stages = {name: np.empty(len(rows)) for name in ('federal_tax', 'state_tax', 'total_taxes', 'net_annual_income')}
+    for keys, indexes in groups.items():
+        arguments = {column: values[indexes] for column, values in income_columns.items()}
+        arguments['retirement_pre_tax'] = arguments['retirement_pre_tax'] != 0
+        arguments.update((column, None if key is None else list(key)) for column, key in zip(BRACKET_COLUMNS, keys))
+        group_stages = MonthlyNetIncome(**arguments).calculate_deduction_stages()
+        for name, values in stages.items():
+            values[indexes] = group_stages[name]
+
+    debt, utilities = np.array(expenses, dtype=float).T
+    results = np.column_stack(_results(stages, debt, utilities, income_columns['retirement_contribution_annual']))
+    return [row + tuple(result) for row, result in zip(rows, results.tolist())]
+
+
+class BudgetHistory:
+    def __init__(self, path):
+        """
+        Open (and create if needed) a budget history database in WAL mode.
+
+        :param path: Database file path, or ":memory:"
+        """
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create the snapshots table and its indexes, adding the columns an older database lacks."""
+        columns = ',\n'.join(
+            f'{column} {"TEXT" if column in TEXT_COLUMNS else "REAL"}' for column in SNAPSHOT_COLUMNS
+        )
+        with self.connection:
+            self.connection.execute(f'CREATE TABLE IF NOT EXISTS snapshots (id INTEGER PRIMARY KEY, {columns})')
+            existing = {row[1] for row in self.connection.execute('PRAGMA table_info(snapshots)')}
+            for column, default in ADDED_COLUMNS.items():
+                if column not in existing:
+                    self.connection.execute(
+                        f'ALTER TABLE snapshots ADD COLUMN {column} {"TEXT" if column in TEXT_COLUMNS else "REAL"} '
+                        f'DEFAULT {"NULL" if default is None else default}'
+                    )
+            # Covers the range queries: filter by household and period, latest snapshot per period
+            self.connection.execute('CREATE INDEX IF NOT EXISTS snapshots_household_period ON snapshots (household, period, id)')
+            self.connection.execute('CREATE INDEX IF NOT EXISTS snapshots_period ON snapshots (period)')
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def save(self, household, period, monthly_net_income, mortgage_and_debt, utilities):
+        """
+        Save one snapshot.
+
+        :param household: Household identifier
+        :param period: Period as "YYYY-MM" or "YYYY-MM-DD"
+        :param monthly_net_income: Instance of MonthlyNetIncome
+        :param mortgage_and_debt: Instance of MortgageAndDebt
+        :param utilities: Instance of Utilities
+        :return: Id of the new snapshot
+        """
+        row = snapshot_row(household, period, monthly_net_income, mortgage_and_debt, utilities)
+        with self.connection:
+            cursor = self.connection.execute(self._insert_sql(), row)
+        return cursor.lastrowid
+
+    def save_rows(self, rows):
+        """
+        Save many snapshot rows in one transaction with executemany.
+
+        :param rows: Iterable of tuples from snapshot_row or snapshot_rows
+        """
+        with self.connection:
+            self.connection.executemany(self._insert_sql(), rows)
+
+    @staticmethod
+    def _insert_sql():
+        return f'INSERT INTO snapshots ({", ".join(SNAPSHOT_COLUMNS)}) VALUES ({", ".join("?" * len(SNAPSHOT_COLUMNS))})'
+
+    def series(self, household, start_period, end_period, columns=RESULT_COLUMNS):
+        """
+        Computed results of a household for every period in a range, using the latest snapshot of each period.
+
+        :param household: Household identifier
+        :param start_period: First period, inclusive
+        :param end_period: Last period, inclusive (e.g. "2026-12" or "2026-12-31")
+        :param columns: Result columns to return
+        :return: Tuple of (periods, rows) where each row holds the requested columns
+        """
+        unknown = set(columns) - set(RESULT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown result columns: {sorted(unknown)}")
+        # SQLite returns the bare columns of the row that holds MAX(id) in each group
+        cursor = self.connection.execute(
+            f'SELECT period, {", ".join(columns)}, MAX(id) FROM snapshots '
+            'WHERE household = ? AND period BETWEEN ? AND ? GROUP BY period ORDER BY period',
+            (household, start_period, end_period)
+        )
+        periods = []
+        rows = []
+        for row in cursor:
+            periods.append(row[0])
+            rows.append(row[1:-1])
+        return periods, rows
+
+    def leftover_by_period(self, household, start_period, end_period):
+        """
+        Leftover money of a household for every period in a range.
+
+        :param household: Household identifier
+        :param start_period: First period, inclusive
+        :param end_period: Last period, inclusive
+        :return: List of (period, leftover money) tuples
+        """
+        periods, rows = self.series(household, start_period, end_period, ('leftover_money',))
+        return [(period, row[0]) for period, row in zip(periods, rows)]
+
+    def summary_series(self, household, start_period, end_period):
+        """
+        Monthly amounts of the summary pie slices of a household for every period in a range.
+
+        :param household: Household identifier
+        :param start_period: First period, inclusive
+        :param end_period: Last period, inclusive
+        :return: Tuple of (periods, series) with one list of values per label in SUMMARY_LABELS
+        """
+        periods, rows = self.series(
+            household, start_period, end_period,
+            ('total_taxes', 'total_monthly_debt', 'total_monthly_utilities', 'free_money')
+        )
+        taxes, debt, utilities, free_money = (list(column) for column in zip(*rows)) if rows else ([], [], [], [])
+        return periods, [[value / 12 for value in taxes], debt, utilities, free_money]
+
+    def latest(self, household):
+        """
+        Rebuild the budget components of the most recent snapshot of a household.
+
+        :param household: Household identifier
+        :return: Tuple of (MonthlyNetIncome, MortgageAndDebt, Utilities), or None if there is no snapshot
+        """
+        cursor = self.connection.execute(
+            f'SELECT {", ".join(SNAPSHOT_COLUMNS)} FROM snapshots WHERE household = ? ORDER BY id DESC LIMIT 1',
+            (household,)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        values = dict(zip(SNAPSHOT_COLUMNS, row))
+        monthly_net_income = MonthlyNetIncome(
+            values['gross_annual_salary'],
+            _load_brackets(values['federal_tax_brackets']),
+            _load_brackets(values['state_tax_brackets']),
+            values['local_tax_rate'],
+            values['fica_rate'],
+            values['medicare_annual_cost'],
+            values['retirement_contribution_annual'],
+            values['savings_rate'],
+            values['car_insurance_annual_cost'],
+            social_security_brackets=_load_brackets(values['social_security_brackets']),
+            medicare_tax_brackets=_load_brackets(values['medicare_tax_brackets']),
+            pre_tax_deductions_annual=values['pre_tax_deductions_annual'],
+            retirement_pre_tax=bool(values['retirement_pre_tax'])
+        )
+        mortgage_and_debt = MortgageAndDebt(**{column: values[column] for column in DEBT_COLUMNS})
+        utilities = Utilities(**{column: values[column] for column in UTILITY_COLUMNS})
+        extra_items = json.loads(values['extra_items'])
+        for label, amount in extra_items['mortgage_and_debt']:
+            mortgage_and_debt.add_item(label, amount)
+        for label, amount in extra_items['utilities']:
+            utilities.add_item(label, amount)
+        return monthly_net_income, mortgage_and_debt, utilities
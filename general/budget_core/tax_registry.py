@@ -0,0 +1,232 @@
+"""
+Registry of federal, state and local tax bracket tables by year and filing status.
+
+Tables live in compact CSV files, one per year and level:
+
+    tax_tables/<year>/<level>.csv    level is "federal", "state", "local" or "payroll"
+
+with one table per line: jurisdiction, filing status ("*" for every status)
+and the brackets as space-separated limit:rate pairs, the last limit being
+"inf". A file is only read the first time one of its tables is needed, a
+table is only parsed the first time it is looked up, and both stay cached,
+so computing a large population across many states reads and parses every
+table at most once. The shipped tables cover the federal brackets of 2023 and
+2024, the 2024 brackets of every state and DC, and a few Maryland counties.
+"""
+import os
+
+from .income import MonthlyNetIncome, compile_brackets
+
+TABLE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tax_tables')
+LEVELS = ('federal', 'state', 'local', 'payroll')
+FILING_STATUSES = ('single', 'married_joint', 'married_separate', 'head_of_household')
+ANY_STATUS = '*'
+
+
+class TaxTableRegistry:
+    def __init__(self, directory=TABLE_DIRECTORY):
+        """
+        Initialize the TaxTableRegistry; nothing is read until a table is needed.
+
+        :param directory: Directory holding one subdirectory of table files per year
+        """
+        self.directory = directory
+        self.files_loaded = 0
+        self.tables_parsed = 0
+        self._raw = {}  # (year, level) -> {(jurisdiction, status): unparsed bracket text}
+        self._tables = {}  # (year, level, jurisdiction, status) -> tuple of (limit, rate) brackets
+
+    def years(self):
+        """
+        Years that have tables.
+
+        :return: Sorted list of years
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(int(name) for name in os.listdir(self.directory) if name.isdigit())
+
+    def _load(self, year, level):
+        """Read a table file into unparsed lines, once."""
+        raw = self._raw.get((year, level))
+        if raw is None:
+            if level not in LEVELS:
+                raise ValueError(f"Unknown tax level: {level}")
+            raw = {}
+            path = os.path.join(self.directory, str(year), f'{level}.csv')
+            if os.path.exists(path):
+                with open(path) as file:
+                    for line in file:
+                        line = line.strip()
+                        if not line or line.startswith('#'):
+                            continue
+                        jurisdiction, status, brackets = line.split(',', 2)
+                        raw[(jurisdiction, status)] = brackets
+                self.files_loaded += 1
+            self._raw[(year, level)] = raw
+        return raw
+
+    def jurisdictions(self, year, level):
+        """
+        Jurisdictions with a table for a year and level.
+
+        :param year: Tax year
+        :param level: One of LEVELS
+        :return: Sorted list of jurisdiction codes
+        """
+        return sorted({jurisdiction for jurisdiction, _ in self._load(year, level)})
+
+    def brackets(self, year, level, jurisdiction, filing_status='single'):
+        """
+        Look up a bracket table, parsing it on first use.
+
+        :param year: Tax year
+        :param level: One of LEVELS
+        :param jurisdiction: "US", a state code such as "MD", a locality such as "MD-Howard",
+                             or "social_security" or "medicare" for the payroll level
+        :param filing_status: One of FILING_STATUSES
+        :return: Tuple of (limit, rate) tuples, the last limit being infinity
+        """
+        key = (year, level, jurisdiction, filing_status)
+        table = self._tables.get(key)
+        if table is None:
+            raw = self._load(year, level)
+            text = raw.get((jurisdiction, filing_status), raw.get((jurisdiction, ANY_STATUS)))
+            if text is None:
+                raise KeyError(f"No {year} {level} tax table for {jurisdiction} ({filing_status})")
+            table = tuple(
+                (float(limit), float(rate))
+                for limit, rate in (pair.split(':') for pair in text.split())
+            )
+            self.tables_parsed += 1
+            compile_brackets(table)  # Warm the compiled array cache as well
+            self._tables[key] = table
+        return table
+
+    def federal(self, year, filing_status='single'):
+        """
+        Federal brackets for a year and filing status.
+
+        :param year: Tax year
+        :param filing_status: One of FILING_STATUSES
+        :return: Tuple of (limit, rate) tuples
+        """
+        return self.brackets(year, 'federal', 'US', filing_status)
+
+    def state(self, year, state, filing_status='single'):
+        """
+        State brackets for a year and filing status.
+
+        :param year: Tax year
+        :param state: Two-letter state code
+        :param filing_status: One of FILING_STATUSES
+        :return: Tuple of (limit, rate) tuples
+        """
+        return self.brackets(year, 'state', state, filing_status)
+
+    def social_security(self, year, filing_status='single'):
+        """
+        Social Security brackets for a year: the rate up to the wage base, 0 above it.
+
+        :param year: Tax year
+        :param filing_status: One of FILING_STATUSES
+        :return: Tuple of (limit, rate) tuples
+        """
+        return self.brackets(year, 'payroll', 'social_security', filing_status)
+
+    def medicare(self, year, filing_status='single'):
+        """
+        Medicare tax brackets for a year and filing status, the top one including the additional Medicare tax.
+
+        :param year: Tax year
+        :param filing_status: One of FILING_STATUSES
+        :return: Tuple of (limit, rate) tuples
+        """
+        return self.brackets(year, 'payroll', 'medicare', filing_status)
+
+    def local_rate(self, year, locality, filing_status='single'):
+        """
+        Flat local tax rate of a locality, as MonthlyNetIncome takes it.
+
+        :param year: Tax year
+        :param locality: Locality code such as "MD-Howard"
+        :param filing_status: One of FILING_STATUSES
+        :return: Rate as a decimal
+        """
+        table = self.brackets(year, 'local', locality, filing_status)
+        if len(table) != 1:
+            raise ValueError(f"{locality} has a graduated local tax; use brackets() instead")
+        return table[0][1]
+
+    def net_income(self, gross_annual_salary, year, state, filing_status='single', locality=None, medicare_annual_cost=0, retirement_contribution_annual=0, savings_rate=0, car_insurance_annual_cost=0, pre_tax_deductions_annual=0, retirement_pre_tax=False):
+        """
+        Build a MonthlyNetIncome with the federal, state, local and payroll taxes of a household's location.
+
+        :param gross_annual_salary: Annual salary before deductions
+        :param year: Tax year
+        :param state: Two-letter state code
+        :param filing_status: One of FILING_STATUSES
+        :param locality: Locality code such as "MD-Howard", or None for no local tax
+        :param medicare_annual_cost: Annual cost of Medicare
+        :param retirement_contribution_annual: Annual retirement contribution
+        :param savings_rate: Savings rate as a decimal
+        :param car_insurance_annual_cost: Annual cost of car insurance
+        :param pre_tax_deductions_annual: Other annual deductions taken before income taxes
+        :param retirement_pre_tax: Whether the retirement contribution is taken before income taxes
+        :return: Instance of MonthlyNetIncome
+        """
+        return MonthlyNetIncome(
+            gross_annual_salary,
+            self.federal(year, filing_status),
+            self.state(year, state, filing_status),
+            0.0 if locality is None else self.local_rate(year, locality, filing_status),
+            0.0,  # Replaced by the Social Security brackets
+            medicare_annual_cost,
+            retirement_contribution_annual,
+            savings_rate,
+            car_insurance_annual_cost,
+            self.social_security(year, filing_status),
+            self.medicare(year, filing_status),
+            pre_tax_deductions_annual,
+            retirement_pre_tax
+        )
+
+    def resolve_income(self, income):
+        """
+        Fill in the brackets and local rate of a JSON income profile that names its location instead.
+
+        :param income: Income dictionary; "tax_year", "state", optional "filing_status" and optional
+                       "locality" stand in for "federal_tax_brackets", "state_tax_brackets", "local_tax_rate",
+                       "social_security_brackets" and "medicare_tax_brackets" ("fica_rate" is then optional)
+        :return: Income dictionary with every MonthlyNetIncome argument
+        """
+        if 'tax_year' not in income:
+            return income
+        year = int(income['tax_year'])
+        filing_status = income.get('filing_status', 'single')
+        resolved = dict(income)
+        if 'federal_tax_brackets' not in resolved:
+            resolved['federal_tax_brackets'] = self.federal(year, filing_status)
+        if 'state_tax_brackets' not in resolved:
+            resolved['state_tax_brackets'] = self.state(year, income['state'], filing_status)
+        if 'local_tax_rate' not in resolved:
+            locality = income.get('locality')
+            resolved['local_tax_rate'] = 0.0 if locality is None else self.local_rate(year, locality, filing_status)
+        if 'social_security_brackets' not in resolved:
+            resolved['social_security_brackets'] = self.social_security(year, filing_status)
+        if 'medicare_tax_brackets' not in resolved:
+            resolved['medicare_tax_brackets'] = self.medicare(year, filing_status)
+        resolved.setdefault('fica_rate', 0.0)
+        return resolved
+
+    def stats(self):
+        """
+        Summarize what has been read so far.
+
+        :return: Dictionary with the number of files loaded and tables parsed
+        """
+        return {'files_loaded': self.files_loaded, 'tables_parsed': self.tables_parsed}
+
+
+# Registry shared by the scripts, reading the tables shipped with budget_core
+tax_tables = TaxTableRegistry()
@@ -0,0 +1,104 @@
+"""
+Matplotlib time-series chart of the budget summary across many periods.
+
+Each series is decimated once into a LevelOfDetail pyramid. Whenever the x
+limits change (on set_data, or when the user pans or zooms with the toolbar),
+every line is pointed at a slice of the level that fits the axes width, so
+redrawing a long history never touches more than a few points per pixel.
+
+This module imports matplotlib, so it is not re-exported from budget_core and
+must be imported explicitly by the GUI scripts.
+"""
+import matplotlib.dates as mdates
+import numpy as np
+
+from .budget import SUMMARY_LABELS
+from .downsample import LevelOfDetail
+from .pie_chart import palette
+
+
+def period_numbers(periods):
+    """
+    Convert periods into Matplotlib date numbers.
+
+    :param periods: Periods as "YYYY-MM" or "YYYY-MM-DD" strings (months start on their first day)
+    :return: Array of date numbers
+    """
+    return mdates.date2num(np.array(periods, dtype='datetime64[D]'))
+
+
+class TimeSeriesChart:
+    def __init__(self, ax, canvas, labels=SUMMARY_LABELS, min_points=512):
+        """
+        Initialize the TimeSeriesChart on an existing axes and canvas.
+
+        :param ax: Matplotlib axes to draw the lines on
+        :param canvas: FigureCanvasTkAgg or FigureCanvasQTAgg holding the axes
+        :param labels: Series labels, in the order the series are passed to set_data
+        :param min_points: Smallest level of detail to build for each series
+        """
+        self.ax = ax
+        self.canvas = canvas
+        self.labels = list(labels)
+        self.min_points = min_points
+        self.details = []  # LevelOfDetail of each series
+        self._views = []  # (level, first, stop) each line currently shows
+
+        colors = palette(len(self.labels))  # Same colors as the pie slices
+        self.lines = [self.ax.plot([], [], color=color, label=label)[0] for label, color in zip(self.labels, colors)]
+        self.ax.xaxis_date()
+        self.ax.legend(loc='upper left')
+        self.ax.grid(True, alpha=0.3)
+        self.ax.callbacks.connect('xlim_changed', self.refresh)
+
+    def set_data(self, periods, series):
+        """
+        Show new series and zoom out to all of them.
+
+        :param periods: Sorted periods as "YYYY-MM" or "YYYY-MM-DD" strings, or date numbers
+        :param series: One sequence of values per label, each as long as periods
+        """
+        if len(series) != len(self.labels):
+            raise ValueError(f"Expected {len(self.labels)} series, got {len(series)}")
+        x = period_numbers(periods) if len(periods) and isinstance(periods[0], str) else np.asarray(periods, dtype=float)
+        self.details = [LevelOfDetail(x, values, self.min_points) for values in series]
+        self._views = [None] * len(self.lines)
+
+        if len(x):
+            low = min(float(np.min(detail.levels[-1][1])) for detail in self.details)
+            high = max(float(np.max(detail.levels[-1][1])) for detail in self.details)
+            margin = (high - low) * 0.05 or 1.0
+            self.ax.set_ylim(low - margin, high + margin)
+            # Setting the x limits fires xlim_changed, which fills in the lines
+            self.ax.set_xlim(x[0], x[-1] if x[-1] > x[0] else x[0] + 1)
+        else:
+            for line in self.lines:
+                line.set_data([], [])
+        self.canvas.draw_idle()
+
+    def refresh(self, ax=None):
+        """
+        Point every line at the level of detail that fits the current x limits.
+
+        :param ax: Axes whose limits changed (passed by the xlim_changed callback)
+        """
+        if not self.details:
+            return
+        start, end = self.ax.get_xlim()
+        max_points = max(2 * int(self.ax.bbox.width), 2)
+        for index, (line, detail) in enumerate(zip(self.lines, self.details)):
+            view = detail.view(start, end, max_points)
+            if view == self._views[index]:
+                continue  # Already showing this slice
+            level, first, stop = view
+            x, y = detail.levels[level]
+            line.set_data(x[first:stop], y[first:stop])
+            self._views[index] = view
+
+    def visible_points(self):
+        """
+        Number of points each line currently draws.
+
+        :return: List of point counts
+        """
+        return [len(line.get_xdata()) for line in self.lines]
@@ -0,0 +1,242 @@
+"""
+Streaming ingestion of bank transaction exports into monthly budgets.
+
+Transactions are read lazily from CSV or OFX files as (month, description, amount)
+tuples, categorized into the MortgageAndDebt and Utilities line items by rule,
+and summed per month as they stream past, so memory only grows with the number
+of months, not the number of transactions.
+"""
+import csv
+from datetime import datetime
+import re
+
+from .budget import MonthlyBudget
+from .expenses import MortgageAndDebt, Utilities
+from .rules import RuleEngine
+
+# Line items transactions can be categorized into, in bucket order
+BUCKETS = tuple(attribute for attribute, _ in MortgageAndDebt.FIELDS + Utilities.FIELDS)
+BUCKET_INDEX = {attribute: index for index, attribute in enumerate(BUCKETS)}
+# Extra bucket for spending that no rule matched
+UNCATEGORIZED = len(BUCKETS)
+
+# Starter rules: case-insensitive description keyword -> line item (see rules.py for exact and regex rules)
+DEFAULT_RULES = [
+    ('RENT PAYMENT', 'rent'),
+    ('APARTMENT', 'rent'),
+    ('MORTGAGE', 'rent'),
+    ('AUTO LOAN', 'auto_payment'),
+    ('TOYOTA FINANCIAL', 'auto_payment'),
+    ('GEICO', 'car_insurance'),
+    ('PROGRESSIVE', 'car_insurance'),
+    ('STATE FARM', 'car_insurance'),
+    ('CREDIT CARD PAYMENT', 'credit_card_payment'),
+    ('CARD PAYMENT', 'credit_card_payment'),
+    ('SHELL', 'gas_electric_car'),
+    ('EXXON', 'gas_electric_car'),
+    ('CHEVRON', 'gas_electric_car'),
+    ('SUPERCHARGER', 'gas_electric_car'),
+    ('BGE', 'electric_gas_house'),
+    ('ELECTRIC', 'electric_gas_house'),
+    ('WATER', 'sewer_water'),
+    ('SEWER', 'sewer_water'),
+    ('COMCAST', 'internet'),
+    ('XFINITY', 'internet'),
+    ('VERIZON FIOS', 'internet'),
+    ('T-MOBILE', 'cellphone'),
+    ('MINT MOBILE', 'cellphone'),
+    ('SPOTIFY', 'entertainment'),
+    ('NETFLIX', 'entertainment'),
+    ('HULU', 'entertainment'),
+    ('OPENAI', 'entertainment'),
+    ('APPLE.COM/BILL', 'entertainment'),
+    ('DIRECTV', 'cable'),
+    ('LANDLINE', 'landline'),
+]
+
+
+class Categorizer:
+    def __init__(self, rules=DEFAULT_RULES, memo_size=100000):
+        """
+        Initialize the Categorizer and compile its rules into a RuleEngine.
+
+        Matching cost does not grow with the number of rules. Results are also
+        memoized per description, since bank exports repeat the same merchants
+        over and over.
+
+        :param rules: List of (pattern, line item attribute) or (pattern, line item attribute, kind) tuples
+        :param memo_size: Number of distinct descriptions to remember before starting over
+        """
+        self.engine = RuleEngine(
+            (rule[0], BUCKET_INDEX[rule[1]]) + tuple(rule[2:]) for rule in rules
+        )
+        self.memo_size = memo_size
+        self._memo = {}
+
+    def categorize(self, description):
+        """
+        Find the bucket of a transaction description.
+
+        :param description: Transaction description or payee name
+        :return: Index into BUCKETS, or UNCATEGORIZED
+        """
+        bucket = self._memo.get(description)
+        if bucket is None:
+            bucket = self.engine.match(description)
+            if bucket is None:
+                bucket = UNCATEGORIZED
+            if len(self._memo) >= self.memo_size:
+                self._memo.clear()
+            self._memo[description] = bucket
+        return bucket
+
+
+def read_csv_transactions(path, date_column='Date', description_column='Description', amount_column='Amount', date_format=None):
+    """
+    Read transactions from a CSV export, one row at a time.
+
+    :param path: Path of the CSV file
+    :param date_column: Header of the date column
+    :param description_column: Header of the description column
+    :param amount_column: Header of the amount column (negative amounts are spending)
+    :param date_format: strptime format of the dates (default is ISO "YYYY-MM-DD", read without parsing)
+    :return: Generator of (month, description, amount) tuples, month as "YYYY-MM"
+    """
+    with open(path, newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader)
+        date_index = header.index(date_column)
+        description_index = header.index(description_column)
+        amount_index = header.index(amount_column)
+        for row in reader:
+            if not row:
+                continue
+            date = row[date_index]
+            if date_format is None:
+                month = date[:7]
+            else:
+                month = datetime.strptime(date, date_format).strftime('%Y-%m')
+            yield month, row[description_index], float(row[amount_index].replace(',', '').replace('$', ''))
+
+
+_OFX_TAG = re.compile(r'<(/?)(\w+)>([^<\r\n]*)')
+
+
+def read_ofx_transactions(path):
+    """
+    Read transactions from an OFX (SGML or XML) export, one line at a time.
+
+    :param path: Path of the OFX file
+    :return: Generator of (month, description, amount) tuples, month as "YYYY-MM"
+    """
+    transaction = None
+    with open(path, errors='replace') as file:
+        for line in file:
+            for closing, tag, value in _OFX_TAG.findall(line):
+                tag = tag.upper()
+                if tag == 'STMTTRN':
+                    if closing:
+                        if transaction is not None and 'DTPOSTED' in transaction and 'TRNAMT' in transaction:
+                            description = transaction.get('NAME') or transaction.get('MEMO', '')
+                            posted = transaction['DTPOSTED']
+                            yield f"{posted[:4]}-{posted[4:6]}", description, float(transaction['TRNAMT'])
+                        transaction = None
+                    else:
+                        transaction = {}
+                elif transaction is not None and not closing:
+                    transaction[tag] = value.strip()
+
+
+class MonthlyAggregator:
+    def __init__(self, categorizer=None):
+        """
+        Initialize the MonthlyAggregator with empty monthly totals.
+
+        :param categorizer: Categorizer for the transaction descriptions (default uses DEFAULT_RULES)
+        """
+        self.categorizer = categorizer if categorizer is not None else Categorizer()
+        self.spending = {}  # month -> list of totals, one per bucket plus uncategorized
+        self.income = {}  # month -> total of the positive amounts
+        self.count = 0
+
+    def add(self, month, description, amount):
+        """
+        Add one transaction to its month.
+
+        :param month: Month as "YYYY-MM"
+        :param description: Transaction description
+        :param amount: Signed amount; negative is spending, positive is income
+        """
+        self.consume([(month, description, amount)])
+
+    def consume(self, transactions):
+        """
+        Add every transaction from an iterable, without holding them in memory.
+
+        :param transactions: Iterable of (month, description, amount) tuples
+        :return: This aggregator, for chaining
+        """
+        spending = self.spending
+        income = self.income
+        categorize = self.categorizer.categorize
+        empty = [0.0] * (UNCATEGORIZED + 1)
+        count = 0
+        for month, description, amount in transactions:
+            count += 1
+            if amount >= 0:
+                income[month] = income.get(month, 0.0) + amount
+                continue
+            totals = spending.get(month)
+            if totals is None:
+                totals = spending[month] = empty.copy()
+            totals[categorize(description)] -= amount
+        self.count += count
+        return self
+
+    def months(self):
+        """
+        Months that have transactions, in order.
+
+        :return: List of "YYYY-MM" strings
+        """
+        return sorted(set(self.spending) | set(self.income))
+
+    def bucket_totals(self, month):
+        """
+        Spending of a month by line item.
+
+        :param month: Month as "YYYY-MM"
+        :return: Dictionary mapping each line item attribute (and "uncategorized") to its total
+        """
+        totals = self.spending.get(month, [0.0] * (UNCATEGORIZED + 1))
+        result = dict(zip(BUCKETS, totals))
+        result['uncategorized'] = totals[UNCATEGORIZED]
+        return result
+
+    def to_expenses(self, month):
+        """
+        Build the MortgageAndDebt and Utilities of a month from its spending.
+
+        Uncategorized spending is added to Utilities as an "Other" line item so the
+        budget still accounts for it.
+
+        :param month: Month as "YYYY-MM"
+        :return: Tuple of (MortgageAndDebt, Utilities)
+        """
+        totals = self.bucket_totals(month)
+        mortgage_and_debt = MortgageAndDebt(**{attribute: totals[attribute] for attribute, _ in MortgageAndDebt.FIELDS})
+        utilities = Utilities(**{attribute: totals[attribute] for attribute, _ in Utilities.FIELDS})
+        if totals['uncategorized']:
+            utilities.add_item('Other', totals['uncategorized'])
+        return mortgage_and_debt, utilities
+
+    def monthly_budget(self, month, monthly_net_income):
+        """
+        Build the MonthlyBudget of a month from its spending.
+
+        :param month: Month as "YYYY-MM"
+        :param monthly_net_income: Instance of MonthlyNetIncome
+        :return: Instance of MonthlyBudget
+        """
+        mortgage_and_debt, utilities = self.to_expenses(month)
+        return MonthlyBudget(monthly_net_income, mortgage_and_debt, utilities)
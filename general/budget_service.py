@@ -0,0 +1,126 @@
+"""
+Local HTTP/JSON service for the budget calculator, for tools that need the numbers without the GUI.
+
+    POST /budget   one budget profile, a list of them, or {"items": [...]}
+    POST /loan     one loan, a list of them, or {"items": [...]}
+    GET  /stats    response cache counters
+    GET  /health   liveness check
+
+Run with: python general/budget_service.py [--host 127.0.0.1] [--port 8765] [--workers N]
+"""
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+
+from budget_core.service import COMPUTATIONS, BudgetService
+
+EXAMPLE_PROFILE = {
+    "income": {
+        "gross_annual_salary": 100300,
+        "federal_tax_brackets": [[11000, 0.10], [44725, 0.12], [95375, 0.22], [182100, 0.24]],
+        "state_tax_brackets": [[1000, 0.02], [2000, 0.04], [3000, 0.0475], [float('inf'), 0.05]],
+        "local_tax_rate": 0.032,
+        "fica_rate": 0.062,
+        "medicare_annual_cost": 1454,
+        "retirement_contribution_annual": 8024,
+        "savings_rate": 0.10,
+        "car_insurance_annual_cost": 3960
+    },
+    "mortgage_and_debt": {"rent": 1500, "auto_payment": 350, "car_insurance": 350, "credit_card_payment": 300},
+    "utilities": {
+        "gas_electric_car": 250, "electric_gas_house": 75, "sewer_water": 75,
+        "internet": 75, "cellphone": 30, "entertainment": 43
+    },
+    "period": "monthly"
+}
+
+
+class BudgetRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep connections alive between requests
+    disable_nagle_algorithm = True  # Headers and body are written separately; do not wait for an ACK in between
+    service = None  # BudgetService shared by every handler thread
+
+    def do_GET(self):
+        # Report the cache counters or answer the liveness check
+        if self.path == '/stats':
+            self.send_json(200, json.dumps(self.service.stats()).encode())
+        elif self.path == '/health':
+            self.send_json(200, b'{"status":"ok"}')
+        else:
+            self.send_error_json(404, f"Unknown path: {self.path}")
+
+    def do_POST(self):
+        # Compute the budgets or loans in the request body
+        kind = self.path.strip('/')
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except ValueError:
+            self.send_error_json(400, "Request body must be JSON")
+            return
+        try:
+            body = self.service.handle(kind, payload)
+        except KeyError as e:
+            if kind not in COMPUTATIONS:
+                self.send_error_json(404, f"Unknown path: {self.path}")
+            else:
+                self.send_error_json(400, f"Missing field: {e}")
+        except (TypeError, ValueError) as e:
+            self.send_error_json(400, str(e))
+        except Exception as e:
+            # Answer anything unexpected too, so the client is never left without a response
+            self.send_error_json(500, f"{type(e).__name__}: {e}")
+        else:
+            self.send_json(200, body)
+
+    def send_json(self, status, body):
+        # Send an encoded JSON body
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status, message):
+        # Send an error as a JSON object
+        self.send_json(status, json.dumps({"error": message}).encode())
+
+    def log_message(self, format, *args):
+        # Keep the console quiet under load
+        pass
+
+
+def make_server(host='127.0.0.1', port=8765, service=None):
+    """
+    Create the HTTP server; call serve_forever() on it to start answering.
+
+    :param host: Interface to listen on
+    :param port: Port to listen on (0 picks a free one)
+    :param service: BudgetService to answer with (default is a new one with a process pool)
+    :return: ThreadingHTTPServer
+    """
+    handler = type('Handler', (BudgetRequestHandler,), {'service': service if service is not None else BudgetService()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve budget and loan calculations over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=None, help="process pool size, 0 to compute in the request threads")
+    parser.add_argument('--cache-mb', type=int, default=16, help="response cache size in megabytes")
+    args = parser.parse_args()
+
+    service = BudgetService(workers=args.workers, cache_bytes=args.cache_mb * 1024 * 1024)
+    server = make_server(args.host, args.port, service)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}")
+    print(f"Try: curl -d '{json.dumps(EXAMPLE_PROFILE)}' http://{args.host}:{server.server_address[1]}/budget")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
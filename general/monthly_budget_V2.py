@@ -2,323 +2,9 @@ import tkinter as tk
 from tkinter import ttk
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-import numpy as np
-
-
-class MonthlyNetIncome:
-    def __init__(self, gross_annual_salary, federal_tax_brackets, state_tax_brackets, local_tax_rate, fica_rate, medicare_annual_cost, retirement_contribution_annual, savings_rate, car_insurance_annual_cost):
-        """
-        Initialize the MonthlyNetIncome with necessary parameters.
-
-        :param gross_annual_salary: Annual salary before deductions
-        :param federal_tax_brackets: List of tuples for federal tax brackets (limit, rate)
-        :param state_tax_brackets: List of tuples for state tax brackets (limit, rate)
-        :param local_tax_rate: Local tax rate as a decimal
-        :param fica_rate: FICA tax rate as a decimal
-        :param medicare_annual_cost: Annual cost of Medicare
-        :param retirement_contribution_annual: Annual retirement contribution
-        :param savings_rate: Savings rate as a decimal
-        :param car_insurance_annual_cost: Annual cost of car insurance
-        """
-        self.gross_annual_salary = gross_annual_salary
-        self.federal_tax_brackets = federal_tax_brackets
-        self.state_tax_brackets = state_tax_brackets
-        self.local_tax_rate = local_tax_rate
-        self.fica_rate = fica_rate
-        self.medicare_annual_cost = medicare_annual_cost
-        self.retirement_contribution_annual = retirement_contribution_annual
-        self.savings_rate = savings_rate
-        self.car_insurance_annual_cost = car_insurance_annual_cost
-
-    def calculate_federal_tax(self):
-        """
-        Calculate the federal tax based on the given tax brackets.
-
-        :return: Total federal tax
-        """
-        federal_tax = 0
-        previous_bracket_limit = 0
-
-        # Iterate through each federal tax bracket
-        for bracket_limit, rate in self.federal_tax_brackets:
-            if self.gross_annual_salary > previous_bracket_limit:
-                # Calculate income within the current bracket
-                income_in_bracket = min(self.gross_annual_salary, bracket_limit) - previous_bracket_limit
-                # Add the tax for this bracket to the total federal tax
-                federal_tax += income_in_bracket * rate
-                # Update the previous bracket limit
-                previous_bracket_limit = bracket_limit
-        return federal_tax
-
-    def calculate_state_tax(self):
-        """
-        Calculate the state tax based on the given tax brackets.
-
-        :return: Total state tax
-        """
-        state_tax = 0
-        previous_bracket_limit = 0
-
-        # Iterate through each state tax bracket
-        for bracket_limit, rate in self.state_tax_brackets:
-            if self.gross_annual_salary > previous_bracket_limit:
-                # Calculate income within the current bracket
-                income_in_bracket = min(self.gross_annual_salary, bracket_limit) - previous_bracket_limit
-                # Add the tax for this bracket to the total state tax
-                state_tax += income_in_bracket * rate
-                # Update the previous bracket limit
-                previous_bracket_limit = bracket_limit
-        return state_tax
-
-    def calculate_local_tax(self):
-        """
-        Calculate the local tax.
-
-        :return: Total local tax
-        """
-        return self.gross_annual_salary * self.local_tax_rate
-
-    def calculate_fica(self):
-        """
-        Calculate the FICA tax.
-
-        :return: Total FICA tax
-        """
-        return self.gross_annual_salary * self.fica_rate
-
-    def calculate_savings(self):
-        """
-        Calculate the savings amount.
-
-        :return: Total savings amount
-        """
-        return self.gross_annual_salary * self.savings_rate
-
-    def calculate_total_deductions(self):
-        """
-        Calculate the total deductions from the gross annual salary.
-
-        :return: Total deductions
-        """
-        # Sum all the individual deductions
-        return (
-            self.calculate_federal_tax() +
-            self.calculate_state_tax() +
-            self.calculate_local_tax() +
-            self.calculate_fica() +
-            self.medicare_annual_cost +
-            self.retirement_contribution_annual +
-            self.calculate_savings() +
-            self.car_insurance_annual_cost 
-        )
-
-    def calculate_net_annual_income(self):
-        """
-        Calculate the net annual income after all deductions.
-
-        :return: Net annual income
-        """
-        # Subtract total deductions from gross annual salary
-        return self.gross_annual_salary - self.calculate_total_deductions()
-
-    def calculate_net_monthly_income(self):
-        """
-        Calculate the net monthly income after all deductions.
-
-        :return: Net monthly income
-        """
-        # Divide net annual income by 12 to get monthly income
-        return self.calculate_net_annual_income() / 12
-
-    def print_summary(self):
-        """
-        Print a summary of the income calculations.
-        """
-        print("=" * 59)
-        print("=" * 22 + " Gross Income " + "=" * 23)
-        print("=" * 59)
-        print(f"Gross Annual Salary: ${self.gross_annual_salary:.2f}")
-        print("\n")
-
-        print("=" * 59)
-        print("=" * 26 + " Taxes " + "=" * 26)
-        print("=" * 59)
-        print(f"Federal Tax: ${self.calculate_federal_tax():.2f}")
-        print(f"State Tax: ${self.calculate_state_tax():.2f}")
-        print(f"Local Tax: ${self.calculate_local_tax():.2f}")
-        print(f"FICA: ${self.calculate_fica():.2f}")
-        print("\n")
-
-        print("=" * 59)
-        print("=" * 20 + " Health Insurance " + "=" * 21)
-        print("=" * 59)
-        print(f"Medicare: ${self.medicare_annual_cost:.2f}")
-        print("\n")
-
-        print("=" * 59)
-        print("=" * 23 + " Retirement " + "=" * 24)
-        print("=" * 59)
-        print(f"Company Retirement Contribution: ${self.retirement_contribution_annual:.2f}")
-        print(f"Savings: ${self.calculate_savings():.2f}")
-        print("\n")
-
-        print("=" * 59)
-        print("=" * 22 + " Car Insurance " + "=" * 22)
-        print("=" * 59)
-        print(f"Car Insurance: ${self.car_insurance_annual_cost:.2f}")
-        print("\n")
-
-
-        print("=" * 59)
-        print("=" * 25 + " Summary " + "=" * 25)
-        print("=" * 59)
-        print(f"Total Deductions: ${self.calculate_total_deductions():.2f}")
-        print(f"Net Annual Income: ${self.calculate_net_annual_income():.2f}")
-        print(f"Net Monthly Income: ${self.calculate_net_monthly_income():.2f}")
-        print("\n")
-
-
-class MortgageAndDebt:
-    def __init__(self, rent, auto_payment, car_insurance, credit_card_payment):
-        """
-        Initialize the MortgageAndDebt with necessary parameters.
-
-        :param rent: Monthly rent cost
-        :param auto_payment: Monthly auto payment
-        :param car_insurance: Monthly car insurance cost
-        :param credit_card_payment: Monthly credit card payment
-        """
-        self.rent = rent
-        self.auto_payment = auto_payment
-        self.car_insurance = car_insurance
-        self.credit_card_payment = credit_card_payment
-
-    def calculate_total_monthly_debt(self):
-        """
-        Calculate the total monthly debt payments.
-
-        :return: Total monthly debt payments
-        """
-        return self.rent + self.auto_payment + self.car_insurance + self.credit_card_payment
-
-    def print_debt_summary(self):
-        """
-        Print a summary of the monthly debt payments.
-        """
-        print("=" * 59)
-        print("=" * 26 + " Rent " + "=" * 27)
-        print("=" * 59)
-        print(f"Rent: ${self.rent:.2f}")
-        print("\n")
-
-        print("=" * 59)
-        print("=" * 24 + " Car Bills " + "=" * 24)
-        print("=" * 59)
-        print(f"Auto Payment: ${self.auto_payment:.2f}")
-        print(f"Car Insurance: ${self.car_insurance:.2f}")
-        print("\n")
-
-        print("=" * 59)
-        print("=" * 23 + " Credit Card " + "=" * 23)
-        print("=" * 59)
-        print(f"Credit Card Payment: ${self.credit_card_payment:.2f}")
-        print("\n")
-        
-
-        print("=" * 59)
-        print("=" * 19 + " Total Monthly Bills " + "=" * 19)
-        print("=" * 59)
-        print(f"Total Monthly Debt Payments: ${self.calculate_total_monthly_debt():.2f}")
-        print("\n")
-
-
-class Utilities:
-    def __init__(self, gas_electric_car, electric_gas_house, sewer_water, internet, cellphone, entertainment, cable=0, landline=0):
-        """
-        Initialize the Utilities with necessary parameters.
-
-        :param gas_electric_car: Monthly cost for gas/electric for car
-        :param electric_gas_house: Monthly cost for electric and gas for house/apartment
-        :param sewer_water: Monthly cost for sewer and water
-        :param internet: Monthly cost for internet
-        :param cellphone: Monthly cost for cellphone
-        :param entertainment: Monthly cost for entertainment
-        :param cable: Monthly cost for cable (default is 0)
-        :param landline: Monthly cost for landline (default is 0)
-        """
-        self.gas_electric_car = gas_electric_car
-        self.electric_gas_house = electric_gas_house
-        self.sewer_water = sewer_water
-        self.internet = internet
-        self.cellphone = cellphone
-        self.entertainment = entertainment
-        self.cable = cable
-        self.landline = landline
-
-    def calculate_total_monthly_utilities(self):
-        """
-        Calculate the total monthly utility costs.
-
-        :return: Total monthly utility costs
-        """
-        return self.gas_electric_car + self.electric_gas_house + self.sewer_water + self.internet + self.cellphone + self.entertainment + self.cable + self.landline
-
-    def print_utilities_summary(self):
-        """
-        Print a summary of the monthly utility costs.
-        """
-        print("=" * 59)
-        print("=" * 21 + " Utilities Bills " + "=" * 21)
-        print("=" * 59)
-        print(f"Gas/Electric for Car: ${self.gas_electric_car:.2f}")
-        print(f"Electric/Gas for House: ${self.electric_gas_house:.2f}")
-        print(f"Sewer and Water: ${self.sewer_water:.2f}")
-        print(f"Internet: ${self.internet:.2f}")
-        print(f"Cellphone: ${self.cellphone:.2f}")
-        print(f"Entertainment: ${self.entertainment:.2f}")
-        print(f"Cable: ${self.cable:.2f}")
-        print(f"Landline: ${self.landline:.2f}")
-        print(f"Total Monthly Utility and Entertainment Costs: ${self.calculate_total_monthly_utilities():.2f}")
-        print("\n")
-
-
-class MonthlyBudget:
-    def __init__(self, monthly_net_income, mortgage_and_debt, utilities):
-        """
-        Initialize the MonthlyBudget with necessary parameters.
-
-        :param monthly_net_income: Instance of MonthlyNetIncome
-        :param mortgage_and_debt: Instance of MortgageAndDebt
-        :param utilities: Instance of Utilities
-        """
-        self.monthly_net_income = monthly_net_income
-        self.mortgage_and_debt = mortgage_and_debt
-        self.utilities = utilities
-
-    def calculate_leftover_money(self):
-        """
-        Calculate the leftover money after all monthly deductions.
-
-        :return: Leftover money after all deductions
-        """
-        total_monthly_debt = self.mortgage_and_debt.calculate_total_monthly_debt()
-        total_monthly_utilities = self.utilities.calculate_total_monthly_utilities()
-        net_monthly_income = self.monthly_net_income.calculate_net_monthly_income()
-        leftover_money = net_monthly_income - total_monthly_debt - total_monthly_utilities
-        return leftover_money
-
-    def print_budget_summary(self):
-        """
-        Print a summary of the budget calculations.
-        """
-        print("=" * 59)
-        print("=" * 21 + " Leftover Money " + "=" * 22)
-        print("=" * 59)
-        print(f"Leftover Money after all deductions: ${self.calculate_leftover_money():.2f}")
-        print("\n")
-
-
+from budget_core import PERIODS, MonthlyNetIncome, MortgageAndDebt, Utilities, MonthlyBudget
+from budget_core.instrumentation import enable_from_environment, instrument_classes, instrumentation
+from budget_core.pie_chart import PieChart
 
 
 class BudgetGUI:
@@ -347,8 +33,14 @@ class BudgetGUI:
         header_frame.pack(padx=10, pady=10, fill=tk.X)
 
         # Create a label for the header
-        header_label = ttk.Label(header_frame, text=f"{self.period} Budget", font=("Helvetica", 16))
-        header_label.pack()
+        self.header_label = ttk.Label(header_frame, text=f"{self.period} Budget", font=("Helvetica", 16))
+        self.header_label.pack()
+
+        # Create a period selector; switching period reuses the computed budget
+        self.period_var = tk.StringVar(value=self.period)
+        period_selector = ttk.Combobox(header_frame, textvariable=self.period_var, values=[period.title() for period in PERIODS], state="readonly")
+        period_selector.bind("<<ComboboxSelected>>", lambda event: self.set_period(self.period_var.get()))
+        period_selector.pack()
 
         # Create a frame for the pie chart
         frame = ttk.Frame(self.root)
@@ -360,57 +52,33 @@ class BudgetGUI:
         # Bind the motion event to display tooltips
         self.canvas.mpl_connect('motion_notify_event', self.on_hover)
 
+        # Show the timing counters below the chart when instrumentation is on
+        if instrumentation.enabled:
+            self.debug_panel = ttk.Label(self.root, font=("Courier", 9), justify=tk.LEFT)
+            self.debug_panel.pack(padx=10, pady=10, fill=tk.X)
+            self.refresh_debug_panel()
+
     def create_pie_chart(self, frame):
         """Create and draw the pie chart."""
         fig = Figure(figsize=(6, 6), dpi=100)
         self.ax = fig.add_subplot(111)
 
-        # Data for the pie chart
-        net_monthly_income = self.monthly_net_income.calculate_net_monthly_income()
-        total_monthly_debt = self.mortgage_and_debt.calculate_total_monthly_debt()
-        total_monthly_utilities = self.utilities.calculate_total_monthly_utilities()
-        leftover_money = net_monthly_income - total_monthly_debt - total_monthly_utilities
-
-        # Combine all taxes into one segment
-        total_taxes = (
-            self.monthly_net_income.calculate_federal_tax() +
-            self.monthly_net_income.calculate_state_tax() +
-            self.monthly_net_income.calculate_local_tax() +
-            self.monthly_net_income.calculate_fica() +
-            self.monthly_net_income.medicare_annual_cost
-        ) / 12
-
-        # Combine mortgage and debt into one segment
-        mortgage_and_debt = self.mortgage_and_debt.calculate_total_monthly_debt()
-
-        # Combine utilities into one segment
-        utilities = self.utilities.calculate_total_monthly_utilities()
-
-        # Combine free money (leftover and retirement)
-        free_money = leftover_money + (self.monthly_net_income.retirement_contribution_annual / 12)
-
-        self.labels = ['Taxes', 'Mortgage and Debt', 'Utilities', 'Free Money']
-        self.sizes = [
-            total_taxes,
-            mortgage_and_debt,
-            utilities,
-            free_money
-        ]
+        # Data for the pie chart comes from the shared budget core
+        self.budget = MonthlyBudget(self.monthly_net_income, self.mortgage_and_debt, self.utilities)
+        self.labels, self.sizes = self.budget.summary_segments(self.period)
 
         # Store original data for restoring later
         self.original_labels = self.labels.copy()
         self.original_sizes = self.sizes.copy()
 
-        colors = plt.cm.tab20(np.linspace(0, 1, len(self.labels)))
-
-        # Create the pie chart
-        wedges, texts, autotexts = self.ax.pie(self.sizes, labels=self.labels, autopct='%1.1f%%', startangle=140, colors=colors)
-        self.ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
-
         # Add the pie chart to the Tkinter frame
         self.canvas = FigureCanvasTkAgg(fig, master=frame)  # Ensure canvas is properly created here
-        self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        instrumentation.wrap(self.canvas, 'draw', 'canvas.draw')
+
+        # Draw the pie chart through the shared chart layer, which caches renderings
+        self.pie_chart = PieChart(self.ax, self.canvas)
+        self.pie_chart.draw(self.labels, self.sizes)
 
     def on_hover(self, event):
         """
@@ -419,71 +87,20 @@ class BudgetGUI:
         :param event: The event triggered by mouse movement
         """
         if event.inaxes == self.ax:
-            for i, wedge in enumerate(self.ax.patches):
-                if wedge.contains_point([event.x, event.y]):
-                    if self.labels[i] == 'Taxes':
-                        self.expand_taxes()
-                    elif self.labels[i] == 'Mortgage and Debt':
-                        self.expand_mortgage_and_debt()
-                    elif self.labels[i] == 'Utilities':
-                        self.expand_utilities()
-                    elif self.labels[i] == 'Free Money':
-                        self.expand_free_money()
-                    else:
-                        self.show_tooltip(event, i)
-                    break
+            i = self.pie_chart.wedge_index_at(event.x, event.y)
+            if i is not None:
+                segments = self.budget.breakdown_segments(self.labels[i], self.period)
+                if segments is not None:
+                    self.labels, self.sizes = segments
+                    self.update_pie_chart()
+                else:
+                    self.show_tooltip(event, i)
             else:
                 self.restore_pie_chart()
                 if self.tooltip:
                     self.tooltip.destroy()
                     self.tooltip = None
 
-    def expand_taxes(self):
-        """Expand the Taxes slice into its individual components."""
-        self.labels = ['Federal Tax', 'State Tax', 'Local Tax', 'FICA', 'Medicare']
-        self.sizes = [
-            self.monthly_net_income.calculate_federal_tax() / 12,
-            self.monthly_net_income.calculate_state_tax() / 12,
-            self.monthly_net_income.calculate_local_tax() / 12,
-            self.monthly_net_income.calculate_fica() / 12,
-            self.monthly_net_income.medicare_annual_cost / 12
-        ]
-        self.update_pie_chart()
-
-    def expand_mortgage_and_debt(self):
-        """Expand the Mortgage and Debt slice into its individual components."""
-        self.labels = ['Rent', 'Auto Payment', 'Credit Card Payment']
-        self.sizes = [
-            self.mortgage_and_debt.rent,
-            self.mortgage_and_debt.auto_payment,
-            self.mortgage_and_debt.credit_card_payment
-        ]
-        self.update_pie_chart()
-
-    def expand_utilities(self):
-        """Expand the Utilities slice into its individual components."""
-        self.labels = ['Car Gas/Electric', 'Electric and Gas (Home)', 'Cable', 'Internet', 'Cellphone', 'Sewer and Water']
-        self.sizes = [
-            self.utilities.gas_electric_car,
-            self.utilities.electric_gas_house,
-            self.utilities.cable,
-            self.utilities.internet,
-            self.utilities.cellphone,
-            self.utilities.sewer_water
-        ]
-        self.update_pie_chart()
-
-    def expand_free_money(self):
-        """Expand the Free Money slice into its individual components."""
-        self.labels = ['Leftover', 'Retirement Funding']
-        leftover_money = self.monthly_net_income.calculate_net_monthly_income() - self.mortgage_and_debt.calculate_total_monthly_debt() - self.utilities.calculate_total_monthly_utilities()
-        retirement_funding = self.monthly_net_income.retirement_contribution_annual / 12
-        self.sizes = [
-            leftover_money,
-            retirement_funding
-        ]
-        self.update_pie_chart()
-
     def restore_pie_chart(self):
         """Restore the original pie chart data."""
         self.labels = self.original_labels.copy()
@@ -492,11 +109,20 @@ class BudgetGUI:
 
     def update_pie_chart(self):
         """Update the pie chart with the current labels and sizes."""
-        self.ax.clear()
-        colors = plt.cm.tab20(np.linspace(0, 1, len(self.labels)))
-        wedges, texts, autotexts = self.ax.pie(self.sizes, labels=self.labels, autopct='%1.1f%%', startangle=140, colors=colors)
-        self.ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle.
-        self.canvas.draw()
+        self.pie_chart.draw(self.labels, self.sizes)
+
+    def set_period(self, period):
+        """
+        Show the budget per another period, without recalculating it.
+
+        :param period: Period name, e.g. "Weekly" or "Annual"
+        """
+        self.period = period
+        self.header_label.configure(text=f"{self.period} Budget")
+        self.labels, self.sizes = self.budget.summary_segments(self.period)
+        self.original_labels = self.labels.copy()
+        self.original_sizes = self.sizes.copy()
+        self.update_pie_chart()
 
     def show_tooltip(self, event, index):
         """
@@ -514,6 +140,11 @@ class BudgetGUI:
         label = ttk.Label(self.tooltip, text=tooltip_text, background="white", relief="solid", borderwidth=1)
         label.pack()
 
+    def refresh_debug_panel(self):
+        """Show the latest instrumentation counters in the debug panel, once a second."""
+        self.debug_panel.configure(text=instrumentation.format_stats())
+        self.root.after(1000, self.refresh_debug_panel)
+
     def run(self):
         """Run the Tkinter main loop."""
         self.root.mainloop()
@@ -536,7 +167,7 @@ state_tax_brackets = [
     (1000, 0.02),    # 2% on the first $1,000
     (2000, 0.04),    # 4% on income between $1,001 and $2,000
     (3000, 0.0475),  # 4.75% on income between $2,001 and $3,000
-    (gross_annual_salary, 0.05)  # 5% on income above $3,000
+    (float('inf'), 0.05)  # 5% on income above $3,000
 ]
 
 # Maryland local tax rate (assuming the worst rate)
@@ -619,6 +250,11 @@ monthly_budget = MonthlyBudget(monthly_net_income, mortgage_and_debt, utilities)
 # Print the budget summary
 monthly_budget.print_budget_summary()
 
-# Create an instance of the BudgetGUI class and run the GUI
-budget_gui = BudgetGUI(monthly_net_income, mortgage_and_debt, utilities)
-budget_gui.run()
+# Time the hot spots when BUDGET_INSTRUMENT is set; this has to happen before the GUI is created
+if enable_from_environment():
+    instrument_classes(BudgetGUI)
+
+# Create an instance of the BudgetGUI class and run the GUI, unless the script is imported
+if __name__ == "__main__":
+    budget_gui = BudgetGUI(monthly_net_income, mortgage_and_debt, utilities)
+    budget_gui.run()
@@ -1,212 +1,12 @@
-from PyQt5 import QtWidgets, QtCore
-from PyQt5.QtWidgets import QApplication, QMainWindow, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QWidget, QScrollArea
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
-import numpy as np
+from PyQt5 import QtWidgets, QtCore, QtGui
+from PyQt5.QtWidgets import QApplication, QMainWindow, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout, QWidget, QScrollArea, QStackedWidget, QComboBox
 import sys
-
-
-class MonthlyNetIncome:
-    def __init__(self, gross_annual_salary, federal_tax_brackets, state_tax_brackets, local_tax_rate, fica_rate, medicare_annual_cost, retirement_contribution_annual, savings_rate, car_insurance_annual_cost):
-        # Initialize the MonthlyNetIncome class with various financial parameters
-        self.gross_annual_salary = gross_annual_salary
-        self.federal_tax_brackets = federal_tax_brackets
-        self.state_tax_brackets = state_tax_brackets
-        self.local_tax_rate = local_tax_rate
-        self.fica_rate = fica_rate
-        self.medicare_annual_cost = medicare_annual_cost
-        self.retirement_contribution_annual = retirement_contribution_annual
-        self.savings_rate = savings_rate
-        self.car_insurance_annual_cost = car_insurance_annual_cost
-
-    def calculate_federal_tax(self):
-        # Calculate the total federal tax based on the gross annual salary and federal tax brackets
-        federal_tax = 0
-        previous_bracket_limit = 0
-        for bracket_limit, rate in self.federal_tax_brackets:
-            if self.gross_annual_salary > previous_bracket_limit:
-                income_in_bracket = min(self.gross_annual_salary, bracket_limit) - previous_bracket_limit
-                federal_tax += income_in_bracket * rate
-                previous_bracket_limit = bracket_limit
-        return federal_tax
-
-    def calculate_state_tax(self):
-        # Calculate the total state tax based on the gross annual salary and state tax brackets
-        state_tax = 0
-        previous_bracket_limit = 0
-        for bracket_limit, rate in self.state_tax_brackets:
-            if self.gross_annual_salary > previous_bracket_limit:
-                income_in_bracket = min(self.gross_annual_salary, bracket_limit) - previous_bracket_limit
-                state_tax += income_in_bracket * rate
-                previous_bracket_limit = bracket_limit
-        return state_tax
-
-    def calculate_local_tax(self):
-        # Calculate the total local tax based on the gross annual salary and local tax rate
-        return self.gross_annual_salary * self.local_tax_rate
-
-    def calculate_fica(self):
-        # Calculate the FICA tax based on the gross annual salary and FICA rate
-        return self.gross_annual_salary * self.fica_rate
-
-    def calculate_savings(self):
-        # Calculate the annual savings based on the gross annual salary and savings rate
-        return self.gross_annual_salary * self.savings_rate
-
-    def calculate_total_deductions(self):
-        # Calculate the total deductions including federal tax, state tax, local tax, FICA, Medicare, retirement contribution, savings, and car insurance
-        return (
-            self.calculate_federal_tax() +
-            self.calculate_state_tax() +
-            self.calculate_local_tax() +
-            self.calculate_fica() +
-            self.medicare_annual_cost +
-            self.retirement_contribution_annual +
-            self.calculate_savings() +
-            self.car_insurance_annual_cost 
-        )
-
-    def calculate_net_annual_income(self):
-        # Calculate the net annual income after all deductions
-        return self.gross_annual_salary - self.calculate_total_deductions()
-
-    def calculate_net_monthly_income(self):
-        # Calculate the net monthly income based on the net annual income
-        return self.calculate_net_annual_income() / 12
-
-    def print_summary(self):
-        # Print a detailed summary of the gross income, taxes, health insurance, retirement contributions, car insurance, and net income
-        print("=" * 59)
-        print("=" * 22 + " Gross Income " + "=" * 23)
-        print("=" * 59)
-        print(f"Gross Annual Salary: ${self.gross_annual_salary:.2f}")
-        print("\n")
-        print("=" * 59)
-        print("=" * 26 + " Taxes " + "=" * 26)
-        print("=" * 59)
-        print(f"Federal Tax: ${self.calculate_federal_tax():.2f}")
-        print(f"State Tax: ${self.calculate_state_tax():.2f}")
-        print(f"Local Tax: ${self.calculate_local_tax():.2f}")
-        print(f"FICA: ${self.calculate_fica():.2f}")
-        print("\n")
-        print("=" * 59)
-        print("=" * 20 + " Health Insurance " + "=" * 21)
-        print("=" * 59)
-        print(f"Medicare: ${self.medicare_annual_cost:.2f}")
-        print("\n")
-        print("=" * 59)
-        print("=" * 23 + " Retirement " + "=" * 24)
-        print("=" * 59)
-        print(f"Company Retirement Contribution: ${self.retirement_contribution_annual:.2f}")
-        print(f"Savings: ${self.calculate_savings():.2f}")
-        print("\n")
-        print("=" * 59)
-        print("=" * 22 + " Car Insurance " + "=" * 22)
-        print("=" * 59)
-        print(f"Car Insurance: ${self.car_insurance_annual_cost:.2f}")
-        print("\n")
-        print("=" * 59)
-        print("=" * 25 + " Summary " + "=" * 25)
-        print("=" * 59)
-        print(f"Total Deductions: ${self.calculate_total_deductions():.2f}")
-        print(f"Net Annual Income: ${self.calculate_net_annual_income():.2f}")
-        print(f"Net Monthly Income: ${self.calculate_net_monthly_income():.2f}")
-        print("\n")
-
-
-class MortgageAndDebt:
-    def __init__(self, rent, auto_payment, car_insurance, credit_card_payment):
-        # Initialize the MortgageAndDebt class with various debt-related parameters
-        self.rent = rent
-        self.auto_payment = auto_payment
-        self.car_insurance = car_insurance
-        self.credit_card_payment = credit_card_payment
-
-    def calculate_total_monthly_debt(self):
-        # Calculate the total monthly debt including rent, auto payment, car insurance, and credit card payment
-        return self.rent + self.auto_payment + self.car_insurance + self.credit_card_payment
-
-    def print_debt_summary(self):
-        # Print a detailed summary of the monthly debt payments
-        print("=" * 59)
-        print("=" * 26 + " Rent " + "=" * 27)
-        print("=" * 59)
-        print(f"Rent: ${self.rent:.2f}")
-        print("\n")
-        print("=" * 59)
-        print("=" * 24 + " Car Bills " + "=" * 24)
-        print("=" * 59)
-        print(f"Auto Payment: ${self.auto_payment:.2f}")
-        print(f"Car Insurance: ${self.car_insurance:.2f}")
-        print("\n")
-        print("=" * 59)
-        print("=" * 23 + " Credit Card " + "=" * 23)
-        print("=" * 59)
-        print(f"Credit Card Payment: ${self.credit_card_payment:.2f}")
-        print("\n")
-        print("=" * 59)
-        print("=" * 19 + " Total Monthly Bills " + "=" * 19)
-        print("=" * 59)
-        print(f"Total Monthly Debt Payments: ${self.calculate_total_monthly_debt():.2f}")
-        print("\n")
-
-
-class Utilities:
-    def __init__(self, gas_electric_car, electric_gas_house, sewer_water, internet, cellphone, entertainment, cable=0, landline=0):
-        # Initialize the Utilities class with various utility-related parameters
-        self.gas_electric_car = gas_electric_car
-        self.electric_gas_house = electric_gas_house
-        self.sewer_water = sewer_water
-        self.internet = internet
-        self.cellphone = cellphone
-        self.entertainment = entertainment
-        self.cable = cable
-        self.landline = landline
-
-    def calculate_total_monthly_utilities(self):
-        # Calculate the total monthly utility costs including gas/electric for car, electric/gas for house, sewer and water, internet, cellphone, entertainment, cable, and landline
-        return self.gas_electric_car + self.electric_gas_house + self.sewer_water + self.internet + self.cellphone + self.entertainment + self.cable + self.landline
-
-    def print_utilities_summary(self):
-        # Print a detailed summary of the monthly utility and entertainment costs
-        print("=" * 59)
-        print("=" * 21 + " Utilities Bills " + "=" * 21)
-        print("=" * 59)
-        print(f"Gas/Electric for Car: ${self.gas_electric_car:.2f}")
-        print(f"Electric/Gas for House: ${self.electric_gas_house:.2f}")
-        print(f"Sewer and Water: ${self.sewer_water:.2f}")
-        print(f"Internet: ${self.internet:.2f}")
-        print(f"Cellphone: ${self.cellphone:.2f}")
-        print(f"Entertainment: ${self.entertainment:.2f}")
-        print(f"Cable: ${self.cable:.2f}")
-        print(f"Landline: ${self.landline:.2f}")
-        print(f"Total Monthly Utility and Entertainment Costs: ${self.calculate_total_monthly_utilities():.2f}")
-        print("\n")
-
-
-class MonthlyBudget:
-    def __init__(self, monthly_net_income, mortgage_and_debt, utilities):
-        # Initialize the MonthlyBudget class with instances of MonthlyNetIncome, MortgageAndDebt, and Utilities
-        self.monthly_net_income = monthly_net_income
-        self.mortgage_and_debt = mortgage_and_debt
-        self.utilities = utilities
-
-    def calculate_leftover_money(self):
-        # Calculate the leftover money after all monthly debt and utility costs are deducted from the net monthly income
-        total_monthly_debt = self.mortgage_and_debt.calculate_total_monthly_debt()
-        total_monthly_utilities = self.utilities.calculate_total_monthly_utilities()
-        net_monthly_income = self.monthly_net_income.calculate_net_monthly_income()
-        leftover_money = net_monthly_income - total_monthly_debt - total_monthly_utilities
-        return leftover_money
-
-    def print_budget_summary(self):
-        # Print a detailed summary of the leftover money after all deductions
-        print("=" * 59)
-        print("=" * 21 + " Leftover Money " + "=" * 22)
-        print("=" * 59)
-        print(f"Leftover Money after all deductions: ${self.calculate_leftover_money():.2f}")
-        print("\n")
+import time
+from budget_core import FORM_LABELS, PERIODS, MonthlyNetIncome, MortgageAndDebt, Utilities, parse_form, payments_per_year
+from budget_core.instrumentation import enable_from_environment, instrument_classes, instrumentation
+from budget_core.scenarios import ScenarioWorkspace
+from budget_core.session_cache import SessionCache, default_session_path, inputs_key
+from budget_core.storage import BudgetHistory, default_history_path
 
 
 class BudgetInputForm(QWidget):
@@ -226,16 +26,8 @@ class BudgetInputForm(QWidget):
         scroll_content = QWidget()
         scroll_layout = QVBoxLayout(scroll_content)
 
-        # List of labels for the input fields
-        labels = [
-            "Gross Annual Salary", "Federal Tax Brackets", "State Tax Brackets", "Local Tax Rate", "FICA Rate",
-            "Medicare Annual Cost", "Retirement Contribution Annual", "Savings Rate", "Car Insurance Annual Cost",
-            "Rent", "Auto Payment", "Car Insurance", "Credit Card Payment",
-            "Gas/Electric Car", "Electric/Gas House", "Sewer Water", "Internet", "Cellphone", "Entertainment", "Cable", "Landline"
-        ]
-
         self.entries = {}
-        for label in labels:
+        for label in FORM_LABELS:
             # Create a row for each input field
             row = QWidget()
             row_layout = QHBoxLayout(row)
@@ -261,195 +53,261 @@ class BudgetInputForm(QWidget):
     def update_budget(self):
         # Update the budget data with the values entered in the input form
         try:
-            # Get the input values
-            gross_annual_salary = float(self.entries["Gross Annual Salary"].text())
-            federal_tax_brackets = eval(self.entries["Federal Tax Brackets"].text())
-            state_tax_brackets = eval(self.entries["State Tax Brackets"].text())
-            local_tax_rate = float(self.entries["Local Tax Rate"].text())
-            fica_rate = float(self.entries["FICA Rate"].text())
-            medicare_annual_cost = float(self.entries["Medicare Annual Cost"].text())
-            retirement_contribution_annual = float(self.entries["Retirement Contribution Annual"].text())
-            savings_rate = float(self.entries["Savings Rate"].text())
-            car_insurance_annual_cost = float(self.entries["Car Insurance Annual Cost"].text())
-            rent = float(self.entries["Rent"].text())
-            auto_payment = float(self.entries["Auto Payment"].text())
-            car_insurance = float(self.entries["Car Insurance"].text())
-            credit_card_payment = float(self.entries["Credit Card Payment"].text())
-            gas_electric_car = float(self.entries["Gas/Electric Car"].text())
-            electric_gas_house = float(self.entries["Electric/Gas House"].text())
-            sewer_water = float(self.entries["Sewer Water"].text())
-            internet = float(self.entries["Internet"].text())
-            cellphone = float(self.entries["Cellphone"].text())
-            entertainment = float(self.entries["Entertainment"].text())
-            cable = float(self.entries["Cable"].text())
-            landline = float(self.entries["Landline"].text())
-
-            # Update the budget data
-            self.budget_gui.monthly_net_income = MonthlyNetIncome(
-                gross_annual_salary,
-                federal_tax_brackets,
-                state_tax_brackets,
-                local_tax_rate,
-                fica_rate,
-                medicare_annual_cost,
-                retirement_contribution_annual,
-                savings_rate,
-                car_insurance_annual_cost
-            )
-            self.budget_gui.mortgage_and_debt = MortgageAndDebt(rent, auto_payment, car_insurance, credit_card_payment)
-            self.budget_gui.utilities = Utilities(
-                gas_electric_car, electric_gas_house, sewer_water, internet, cellphone, entertainment, cable, landline
-            )
+            # Get the input values and update the budget data
+            values = {label: entry.text() for label, entry in self.entries.items()}
+            (
+                self.budget_gui.monthly_net_income,
+                self.budget_gui.mortgage_and_debt,
+                self.budget_gui.utilities
+            ) = parse_form(values)
 
             # Redraw the pie chart with updated data
             self.budget_gui.create_pie_chart()
+
+            # Keep a snapshot of every update of the base scenario in the history database, once it computed
+            if self.budget_gui.history is not None and self.budget_gui.scenario == self.budget_gui.workspace.base_name:
+                self.budget_gui.history.save(
+                    self.budget_gui.household,
+                    time.strftime("%Y-%m"),
+                    self.budget_gui.monthly_net_income,
+                    self.budget_gui.mortgage_and_debt,
+                    self.budget_gui.utilities
+                )
+
+            if self.budget_gui.charts.currentIndex() == 1:
+                self.budget_gui.load_history_chart()
+            elif self.budget_gui.charts.currentIndex() == 2:
+                self.budget_gui.refresh_comparison()
         except Exception as e:
             # Print error message if updating budget fails
             print("Error updating budget:", e)
 
 
+class SessionPlaceholder(QWidget):
+    # Emitted once, after the placeholder has been painted for the first time
+    painted = QtCore.pyqtSignal()
+
+    def __init__(self, session_state=None):
+        # Stand in for the chart area with the last session's chart image and values until the charts are built
+        super().__init__()
+        self.has_painted = False
+        # The timers are children of the placeholder, so none of them fires once it is deleted
+        self.paint_timer = QtCore.QTimer(self)
+        self.paint_timer.setSingleShot(True)
+        self.paint_timer.timeout.connect(self.emit_painted)
+        # Go on anyway if the window is not painted soon, e.g. when it starts minimized
+        self.fallback_timer = QtCore.QTimer(self)
+        self.fallback_timer.setSingleShot(True)
+        self.fallback_timer.timeout.connect(self.emit_painted)
+        self.fallback_timer.start(500)
+        layout = QVBoxLayout(self)
+        if session_state is None:
+            layout.addWidget(QLabel("Loading...", self), alignment=QtCore.Qt.AlignCenter)
+            return
+
+        if session_state['image'] is not None:
+            image = QLabel(self)
+            image.setPixmap(QtGui.QPixmap(session_state['image']))
+            image.setAlignment(QtCore.Qt.AlignCenter)
+            layout.addWidget(image)
+        values = "\n".join(
+            f"{label}: ${size:,.2f}" for label, size in zip(session_state['labels'], session_state['sizes'])
+        )
+        layout.addWidget(QLabel(values, self), alignment=QtCore.Qt.AlignCenter)
+
+    def paintEvent(self, event):
+        # Signal the first paint on the next event loop turn, so the shell reaches the screen before the slow steps
+        super().paintEvent(event)
+        if not self.has_painted:
+            self.paint_timer.start(0)
+
+    def emit_painted(self):
+        # Emit the painted signal only once
+        if not self.has_painted:
+            self.has_painted = True
+            self.paint_timer.stop()
+            self.fallback_timer.stop()
+            self.painted.emit()
+
+    def stop(self):
+        # Stop the timers and disconnect the painted signal, before the placeholder is deleted
+        self.paint_timer.stop()
+        self.fallback_timer.stop()
+        try:
+            self.painted.disconnect()
+        except TypeError:
+            pass  # Nothing connected
+
+
 class BudgetGUI(QMainWindow):
-    def __init__(self, monthly_net_income, mortgage_and_debt, utilities, period="Monthly"):
+    def __init__(self, monthly_net_income, mortgage_and_debt, utilities, period="Monthly", history=None, household="default",
+                 session=None, progressive=False):
         # Initialize the BudgetGUI class with instances of MonthlyNetIncome, MortgageAndDebt, and Utilities
         super().__init__()
-        self.setWindowTitle("Budget GUI")
         self.monthly_net_income = monthly_net_income
         self.mortgage_and_debt = mortgage_and_debt
         self.utilities = utilities
         self.period = period
         self.tooltip = None  # Initialize tooltip attribute
+        self.history = history  # BudgetHistory that saves each update, or None
+        self.household = household
+        self.session = session  # SessionCache that keeps the last summary and chart for the next launch, or None
+        self.progressive = progressive  # Paint a shell first, then build the form and the charts
+        self.placeholder = None
+        # Variant budgets sharing their unchanged inputs; the one shown is self.scenario
+        self.workspace = ScenarioWorkspace(monthly_net_income, mortgage_and_debt, utilities)
+        self.scenario = self.workspace.base_name
+
+        # Reopen on the period of the last session, and reuse its chart if the budget has not changed since
+        self.session_state = session.load(household) if session is not None else None
+        if self.session_state is not None:
+            self.period = self.session_state['period']
+            if self.session_state['key'] != inputs_key(monthly_net_income, mortgage_and_debt, utilities):
+                self.session_state = None
+        self.setWindowTitle(f"{self.period} Budget")
         self.init_ui()
 
     def init_ui(self):
         # Initialize the main GUI
         widget = QWidget()
-        layout = QHBoxLayout(widget)
+        self.main_layout = QHBoxLayout(widget)
+        widget.setLayout(self.main_layout)
+        self.setCentralWidget(widget)
+
+        if self.progressive:
+            # Only the shell is built now; the form follows its first paint and the charts follow the form
+            self.placeholder = SessionPlaceholder(self.session_state)
+            self.placeholder.painted.connect(self.build_form)
+            self.main_layout.addWidget(self.placeholder)
+        else:
+            self.build_form()
+            self.build_charts()
 
+    def build_form(self):
         # Add the input form to the left side
-        input_form = BudgetInputForm(self)
-        layout.addWidget(input_form)
+        self.input_form = BudgetInputForm(self)
+        self.main_layout.insertWidget(0, self.input_form)
+        if self.placeholder is not None:
+            # Build the charts on the next event loop turn, with a timer owned by the window
+            self.charts_timer = QtCore.QTimer(self)
+            self.charts_timer.setSingleShot(True)
+            self.charts_timer.timeout.connect(self.build_charts)
+            self.charts_timer.start(0)
+
+    def build_charts(self):
+        # matplotlib is by far the slowest import of the front end, so it is only loaded here
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT as NavigationToolbar
+        from budget_core.pie_chart import PieChart
+        from budget_core.timeseries_chart import TimeSeriesChart
 
         # Create the pie chart area
         self.figure = Figure(figsize=(6, 6), dpi=100)
         self.ax = self.figure.add_subplot(111)
         self.canvas = FigureCanvas(self.figure)
-
-        layout.addWidget(self.canvas)
-        widget.setLayout(layout)
-        self.setCentralWidget(widget)
+        instrumentation.wrap(self.canvas, 'draw', 'canvas.draw')
+        self.pie_chart = PieChart(self.ax, self.canvas)
+
+        # Create the history chart area, with a toolbar to pan and zoom through the periods
+        self.history_figure = Figure(figsize=(6, 6), dpi=100)
+        self.history_ax = self.history_figure.add_subplot(111)
+        self.history_canvas = FigureCanvas(self.history_figure)
+        self.history_chart = TimeSeriesChart(self.history_ax, self.history_canvas)
+        history_widget = QWidget()
+        history_layout = QVBoxLayout(history_widget)
+        history_layout.addWidget(NavigationToolbar(self.history_canvas, history_widget))
+        history_layout.addWidget(self.history_canvas)
+
+        # Create the side-by-side comparison of the scenarios
+        self.comparison = QLabel(self)
+        self.comparison.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+        self.comparison.setAlignment(QtCore.Qt.AlignTop | QtCore.Qt.AlignLeft)
+        comparison_area = QScrollArea()
+        comparison_area.setWidgetResizable(True)
+        comparison_area.setWidget(self.comparison)
+
+        # Show one chart at a time, switched by the buttons under them
+        self.charts = QStackedWidget()
+        self.charts.addWidget(self.canvas)
+        self.charts.addWidget(history_widget)
+        self.charts.addWidget(comparison_area)
+        chart_area = QWidget()
+        chart_layout = QVBoxLayout(chart_area)
+        # Scenario selector; a new scenario starts as a copy of the one shown
+        scenario_row = QWidget()
+        scenario_layout = QHBoxLayout(scenario_row)
+        self.scenario_selector = QComboBox(self)
+        self.scenario_selector.addItems(self.workspace.names())
+        self.scenario_selector.currentTextChanged.connect(self.set_scenario)
+        scenario_layout.addWidget(self.scenario_selector)
+        new_scenario_button = QPushButton("New Scenario", self)
+        new_scenario_button.clicked.connect(self.new_scenario)
+        scenario_layout.addWidget(new_scenario_button)
+        chart_layout.addWidget(scenario_row)
+        # Period selector; switching period reuses the computed budget
+        self.period_selector = QComboBox(self)
+        self.period_selector.addItems([period.title() for period in PERIODS])
+        self.period_selector.setCurrentText(self.period)
+        self.period_selector.currentTextChanged.connect(self.set_period)
+        chart_layout.addWidget(self.period_selector)
+        chart_layout.addWidget(self.charts)
+        self.chart_mode_button = QPushButton("Show History", self)
+        self.chart_mode_button.clicked.connect(self.toggle_chart_mode)
+        chart_layout.addWidget(self.chart_mode_button)
+        self.compare_button = QPushButton("Compare Scenarios", self)
+        self.compare_button.clicked.connect(self.toggle_comparison)
+        chart_layout.addWidget(self.compare_button)
+
+        if self.placeholder is not None:
+            self.main_layout.replaceWidget(self.placeholder, chart_area)
+            self.placeholder.stop()
+            self.placeholder.deleteLater()
+            self.placeholder = None
+        else:
+            self.main_layout.addWidget(chart_area)
+
+        # Add the debug panel with timing counters on the right side when instrumentation is on
+        if instrumentation.enabled:
+            self.debug_panel = QLabel(self)
+            self.debug_panel.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+            self.debug_panel.setAlignment(QtCore.Qt.AlignTop)
+            self.main_layout.addWidget(self.debug_panel)
+            self.debug_timer = QtCore.QTimer(self)
+            self.debug_timer.timeout.connect(self.refresh_debug_panel)
+            self.debug_timer.start(1000)
 
         self.create_pie_chart()
 
         self.canvas.mpl_connect('motion_notify_event', self.on_hover)
 
     def create_pie_chart(self):
-        # Create the pie chart based on the budget data
-        self.ax.clear()
-
-        net_monthly_income = self.monthly_net_income.calculate_net_monthly_income()
-        total_monthly_debt = self.mortgage_and_debt.calculate_total_monthly_debt()
-        total_monthly_utilities = self.utilities.calculate_total_monthly_utilities()
-        leftover_money = net_monthly_income - total_monthly_debt - total_monthly_utilities
-
-        total_taxes = (
-            self.monthly_net_income.calculate_federal_tax() +
-            self.monthly_net_income.calculate_state_tax() +
-            self.monthly_net_income.calculate_local_tax() +
-            self.monthly_net_income.calculate_fica() +
-            self.monthly_net_income.medicare_annual_cost
-        ) / 12
-
-        mortgage_and_debt = self.mortgage_and_debt.calculate_total_monthly_debt()
-
-        utilities = self.utilities.calculate_total_monthly_utilities()
-
-        free_money = leftover_money + (self.monthly_net_income.retirement_contribution_annual / 12)
-
-        self.labels = ['Taxes', 'Mortgage and Debt', 'Utilities', 'Free Money']
-        self.sizes = [
-            total_taxes,
-            mortgage_and_debt,
-            utilities,
-            free_money
-        ]
+        # Create the pie chart based on the budget data; the workspace only recomputes it if the inputs changed
+        self.workspace.update(self.scenario, self.monthly_net_income, self.mortgage_and_debt, self.utilities)
+        self.budget = self.workspace.budget(self.scenario)
+        self.labels, self.sizes = self.budget.summary_segments(self.period)
 
         self.original_labels = self.labels.copy()
         self.original_sizes = self.sizes.copy()
 
-        colors = plt.cm.tab20(np.linspace(0, 1, len(self.labels)))
-
         # Draw the pie chart
-        wedges, texts, autotexts = self.ax.pie(self.sizes, labels=self.labels, autopct='%1.1f%%', startangle=140, colors=colors)
-        self.ax.axis('equal')
-        self.canvas.draw()
+        self.pie_chart.draw(self.labels, self.sizes)
 
     def on_hover(self, event):
         # Handle hover events over the pie chart to show detailed segments
         if event.inaxes == self.ax:
-            for i, wedge in enumerate(self.ax.patches):
-                if wedge.contains_point([event.x, event.y]):
-                    if self.labels[i] == 'Taxes':
-                        self.expand_taxes()
-                    elif self.labels[i] == 'Mortgage and Debt':
-                        self.expand_mortgage_and_debt()
-                    elif self.labels[i] == 'Utilities':
-                        self.expand_utilities()
-                    elif self.labels[i] == 'Free Money':
-                        self.expand_free_money()
-                    else:
-                        self.show_tooltip(event, i)
-                    break
+            i = self.pie_chart.wedge_index_at(event.x, event.y)
+            if i is not None:
+                segments = self.budget.breakdown_segments(self.labels[i], self.period)
+                if segments is not None:
+                    self.labels, self.sizes = segments
+                    self.update_pie_chart()
+                else:
+                    self.show_tooltip(event, i)
             else:
                 self.restore_pie_chart()
                 if self.tooltip:
                     self.tooltip.hide()
 
-    def expand_taxes(self):
-        # Expand the 'Taxes' segment to show detailed breakdown
-        self.labels = ['Federal Tax', 'State Tax', 'Local Tax', 'FICA', 'Medicare']
-        self.sizes = [
-            self.monthly_net_income.calculate_federal_tax() / 12,
-            self.monthly_net_income.calculate_state_tax() / 12,
-            self.monthly_net_income.calculate_local_tax() / 12,
-            self.monthly_net_income.calculate_fica() / 12,
-            self.monthly_net_income.medicare_annual_cost / 12
-        ]
-        self.update_pie_chart()
-
-    def expand_mortgage_and_debt(self):
-        # Expand the 'Mortgage and Debt' segment to show detailed breakdown
-        self.labels = ['Rent', 'Auto Payment', 'Credit Card Payment']
-        self.sizes = [
-            self.mortgage_and_debt.rent,
-            self.mortgage_and_debt.auto_payment,
-            self.mortgage_and_debt.credit_card_payment
-        ]
-        self.update_pie_chart()
-
-    def expand_utilities(self):
-        # Expand the 'Utilities' segment to show detailed breakdown
-        self.labels = ['Car Gas/Electric', 'Electric and Gas (Home)', 'Cable', 'Internet', 'Cellphone', 'Sewer and Water']
-        self.sizes = [
-            self.utilities.gas_electric_car,
-            self.utilities.electric_gas_house,
-            self.utilities.cable,
-            self.utilities.internet,
-            self.utilities.cellphone,
-            self.utilities.sewer_water
-        ]
-        self.update_pie_chart()
-
-    def expand_free_money(self):
-        # Expand the 'Free Money' segment to show detailed breakdown
-        self.labels = ['Leftover', 'Retirement Funding']
-        leftover_money = self.monthly_net_income.calculate_net_monthly_income() - self.mortgage_and_debt.calculate_total_monthly_debt() - self.utilities.calculate_total_monthly_utilities()
-        retirement_funding = self.monthly_net_income.retirement_contribution_annual / 12
-        self.sizes = [
-            leftover_money,
-            retirement_funding
-        ]
-        self.update_pie_chart()
-
     def restore_pie_chart(self):
         # Restore the pie chart to its original state
         self.labels = self.original_labels.copy()
@@ -458,11 +316,7 @@ class BudgetGUI(QMainWindow):
 
     def update_pie_chart(self):
         # Update the pie chart with the current labels and sizes
-        self.ax.clear()
-        colors = plt.cm.tab20(np.linspace(0, 1, len(self.labels)))
-        wedges, texts, autotexts = self.ax.pie(self.sizes, labels=self.labels, autopct='%1.1f%%', startangle=140, colors=colors)
-        self.ax.axis('equal')
-        self.canvas.draw()
+        self.pie_chart.draw(self.labels, self.sizes)
 
     def show_tooltip(self, event, index):
         # Show a tooltip with detailed information when hovering over a segment
@@ -477,6 +331,111 @@ class BudgetGUI(QMainWindow):
         self.tooltip.move(tooltip_x, tooltip_y)
         self.tooltip.show()
 
+    def set_period(self, period):
+        # Show the budget per another period without recalculating it
+        self.period = period
+        self.setWindowTitle(f"{period} Budget")
+        self.labels, self.sizes = self.budget.summary_segments(self.period)
+        self.original_labels = self.labels.copy()
+        self.original_sizes = self.sizes.copy()
+        self.update_pie_chart()
+        if self.charts.currentIndex() == 1:
+            self.load_history_chart()
+        elif self.charts.currentIndex() == 2:
+            self.refresh_comparison()
+
+    def set_scenario(self, name):
+        # Show another scenario; its budget is only recomputed if its inputs changed since it was last shown
+        self.scenario = name
+        self.monthly_net_income, self.mortgage_and_debt, self.utilities = self.workspace.components(name)
+        self.create_pie_chart()
+        if self.charts.currentIndex() == 2:
+            self.refresh_comparison()
+
+    def new_scenario(self):
+        # Add a scenario that shares the inputs of the one shown until either is updated, and switch to it
+        number = len(self.workspace)
+        while f"Scenario {number}" in self.workspace:
+            number += 1
+        name = f"Scenario {number}"
+        self.workspace.add_scenario(name, based_on=self.scenario)
+        self.scenario_selector.addItem(name)
+        self.scenario_selector.setCurrentText(name)
+
+    def toggle_chart_mode(self):
+        # Switch between the pie chart of the current budget and the history chart
+        if self.charts.currentIndex() != 1:
+            self.load_history_chart()
+            self.charts.setCurrentIndex(1)
+            self.chart_mode_button.setText("Show Pie Chart")
+        else:
+            self.charts.setCurrentIndex(0)
+            self.chart_mode_button.setText("Show History")
+        self.compare_button.setText("Compare Scenarios")
+
+    def toggle_comparison(self):
+        # Switch between the side-by-side scenario comparison and the pie chart
+        if self.charts.currentIndex() != 2:
+            self.refresh_comparison()
+            self.charts.setCurrentIndex(2)
+            self.compare_button.setText("Show Pie Chart")
+        else:
+            self.charts.setCurrentIndex(0)
+            self.compare_button.setText("Compare Scenarios")
+        self.chart_mode_button.setText("Show History")
+
+    def refresh_comparison(self):
+        # Show every scenario side by side for the selected period
+        self.comparison.setText(self.workspace.to_text(self.period))
+
+    def load_history_chart(self):
+        # Plot every saved period of the household; the chart downsamples long histories itself
+        if self.history is None:
+            return
+        periods, series = self.history.summary_series(self.household, "0000", "9999")
+        # The history holds monthly amounts
+        scale = 12 / payments_per_year(self.period)
+        self.history_chart.set_data(periods, [[value * scale for value in values] for values in series])
+
+    def refresh_debug_panel(self):
+        # Show the latest instrumentation counters in the debug panel
+        self.debug_panel.setText(instrumentation.format_stats())
+
+    def save_session(self):
+        # Keep the summary and an image of the pie chart so the next launch can show them at once
+        if self.session is None or not hasattr(self, 'budget'):
+            return
+        if self.labels != self.original_labels:
+            self.restore_pie_chart()
+        buffer = QtCore.QBuffer()
+        buffer.open(QtCore.QIODevice.WriteOnly)
+        self.canvas.grab().save(buffer, "PNG")
+        self.session.save(
+            self.household,
+            inputs_key(self.monthly_net_income, self.mortgage_and_debt, self.utilities),
+            self.period,
+            self.original_labels,
+            self.original_sizes,
+            bytes(buffer.data())
+        )
+
+
+def run_event_loop(app, main_window):
+    """
+    Run the Qt event loop, then delete the window while the QApplication still exists.
+
+    Left to the garbage collector at interpreter exit, the widgets may be destroyed after the QApplication,
+    which crashes the process on exit.
+
+    :param app: Instance of QApplication
+    :param main_window: Top level window of the application
+    :return: Exit status of the event loop
+    """
+    status = app.exec_()
+    main_window.deleteLater()
+    app.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    return status
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -484,7 +443,7 @@ if __name__ == "__main__":
     # Initialize with dummy data
     gross_annual_salary = 100300
     federal_tax_brackets = [(11000, 0.10), (44725, 0.12), (95375, 0.22), (182100, 0.24)]
-    state_tax_brackets = [(1000, 0.02), (2000, 0.04), (3000, 0.0475), (gross_annual_salary, 0.05)]
+    state_tax_brackets = [(1000, 0.02), (2000, 0.04), (3000, 0.0475), (float('inf'), 0.05)]
     local_tax_rate = 0.032
     fica_rate = 0.062
     medicare_annual_cost = 1454
@@ -521,8 +480,20 @@ if __name__ == "__main__":
     mortgage_and_debt = MortgageAndDebt(rent, auto_payment, car_insurance, credit_card_payment)
     utilities = Utilities(gas_electric_car, electric_gas_house, sewer_water, internet, cellphone, entertainment, cable, landline)
 
-    # Create an instance of BudgetGUI
-    budget_gui = BudgetGUI(monthly_net_income, mortgage_and_debt, utilities)
+    # Start from the last saved budget instead of the dummy data when there is one
+    history = BudgetHistory(default_history_path())
+    saved = history.latest("default")
+    if saved is not None:
+        monthly_net_income, mortgage_and_debt, utilities = saved
+
+    # Time the hot spots when BUDGET_INSTRUMENT is set; this has to happen before the GUI is created
+    if enable_from_environment():
+        instrument_classes(BudgetGUI, BudgetInputForm)
+
+    # Create an instance of BudgetGUI; it paints the last session's chart at once and builds the rest after
+    session = SessionCache(default_session_path())
+    budget_gui = BudgetGUI(monthly_net_income, mortgage_and_debt, utilities, history=history, session=session, progressive=True)
+    app.aboutToQuit.connect(budget_gui.save_session)
 
     # Create the main window and set the BudgetGUI as the central widget
     main_window = QMainWindow()
@@ -531,4 +502,4 @@ if __name__ == "__main__":
     main_window.show()
 
     # Start the Qt event loop
-    sys.exit(app.exec_())
+    sys.exit(run_event_loop(app, main_window))
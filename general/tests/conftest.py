@@ -0,0 +1,64 @@
+"""
+Shared fixtures of the budget_core and front-end tests.
+
+Run with: python -m pytest general/tests
+"""
+import os
+import runpy
+import sys
+
+import pytest
+
+GENERAL = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, GENERAL)
+# The PyQt5 front end runs without a display in the tests
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from budget_core import MonthlyNetIncome, MortgageAndDebt, Utilities  # noqa: E402
+
+FEDERAL_TAX_BRACKETS = [(11000, 0.10), (44725, 0.12), (95375, 0.22), (182100, 0.24)]
+STATE_TAX_BRACKETS = [(1000, 0.02), (2000, 0.04), (3000, 0.0475), (float('inf'), 0.05)]
+
+
+def demo_components(gross_annual_salary=100300):
+    """The budget of the demo scripts, as (MonthlyNetIncome, MortgageAndDebt, Utilities)."""
+    return (
+        MonthlyNetIncome(
+            gross_annual_salary, FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS, 0.032, 0.062, 1454, 8024, 0.10, 330 * 12
+        ),
+        MortgageAndDebt(1500, 350, 350, 300),
+        Utilities(250, 75, 75, 75, 30, 43, 0, 0),
+    )
+
+
+def load_script(name):
+    """Run a front-end script without its __main__ block and return its namespace."""
+    return runpy.run_path(os.path.join(GENERAL, name), run_name=name[:-3])
+
+
+@pytest.fixture
+def demo_budget():
+    return demo_components()
+
+
+@pytest.fixture(scope='session')
+def qt_app():
+    QtWidgets = pytest.importorskip('PyQt5.QtWidgets')
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def tk_display():
+    tkinter = pytest.importorskip('tkinter')
+    try:
+        tkinter.Tk().destroy()
+    except tkinter.TclError as error:
+        pytest.skip(f"Tk cannot open a display: {error}")
+
+
+@pytest.fixture
+def tk_root(tk_display):
+    import tkinter
+    root = tkinter.Tk()
+    yield root
+    root.destroy()
@@ -0,0 +1,111 @@
+"""
+Loan schedules: NumPy columns against the row loop, and variable-rate, irregular-payment amortization.
+"""
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from budget_core import amortize, loan_schedule, loan_schedule_columns, monthly_payment
+from budget_core.amortization import SCHEDULE_COLUMNS
+from conftest import GENERAL
+
+
+def reference_amortize(principal, annual_rates, n_payments, extra_payments, skipped_months):
+    """Month by month, recomputing the payment at rate resets and after skipped months."""
+    balance = principal
+    payment = None
+    rows = []
+    for month in range(1, n_payments + 1):
+        rate = annual_rates[month - 1] / 12
+        interest = balance * rate
+        if month in skipped_months:
+            balance += interest
+            rows.append((month, 0.0, interest, balance))
+            continue
+        if payment is None or annual_rates[month - 1] != annual_rates[month - 2] or month - 1 in skipped_months:
+            payment = monthly_payment(balance, rate * 12, n_payments - month + 1)
+        paid = payment + extra_payments.get(month, 0)
+        if month == n_payments or paid >= balance + interest:
+            paid = balance + interest
+        balance += interest - paid
+        rows.append((month, paid, interest, balance))
+        if balance <= 0.005:
+            break
+    return np.array(rows)
+
+
+def assert_schedule(schedule, rows):
+    np.testing.assert_array_equal(schedule.month, rows[:, 0])
+    np.testing.assert_allclose(schedule.payment, rows[:, 1], rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(schedule.interest_payment, rows[:, 2], rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(schedule.remaining_balance, rows[:, 3], rtol=1e-9, atol=1e-6)
+
+
+@pytest.mark.parametrize('principal, rate, years, extra', [
+    (25000, 0.065, 5, 0), (25000, 0.065, 5, 150), (300000, 0.07, 30, 0), (12000, 0.0, 3, 100),
+])
+def test_columns_match_row_loop(principal, rate, years, extra):
+    rows = loan_schedule(principal, rate, years, extra)
+    columns = loan_schedule_columns(principal, rate, years, extra)
+    assert len(columns) == len(rows) == columns.payoff_month
+    for name, values in columns.columns().items():
+        np.testing.assert_allclose(values, [row[name] for row in rows], rtol=1e-9, atol=1e-6)
+    assert columns.total_interest == pytest.approx(sum(row['Interest Payment'] for row in rows))
+    assert columns.total_paid == pytest.approx(sum(row['Payment'] for row in rows))
+    assert list(columns.to_records()[0]) == list(SCHEDULE_COLUMNS)
+
+
+def test_dataframe_view_is_built_once_on_demand():
+    pd = pytest.importorskip('pandas')
+    schedule = loan_schedule_columns(25000, 0.065, 5)
+    frame = schedule.to_dataframe()
+    assert isinstance(frame, pd.DataFrame) and list(frame.columns) == list(SCHEDULE_COLUMNS)
+    assert frame.to_dict('records') == schedule.to_records()
+    assert schedule.to_dataframe() is frame
+
+    script = 'import sys; from budget_core import loan_schedule_columns; loan_schedule_columns(25000, 0.065, 5); print("pandas" in sys.modules)'
+    loaded = subprocess.run([sys.executable, '-c', script], cwd=GENERAL, capture_output=True, text=True, check=True).stdout
+    assert loaded.strip() == 'False'
+
+
+def test_fixed_rate_matches_monthly_payment():
+    result = amortize(25000, 0.065, 60)
+    assert result['payment'] == pytest.approx(monthly_payment(25000, 0.065, 60))
+    assert result['months'] == 60 and result['segments'] == 1 and result['remaining_balance'] == 0
+    assert result['total_paid'] == pytest.approx(60 * result['payment'])
+    assert_schedule(result['schedule'], reference_amortize(25000, [0.065] * 60, 60, {}, set()))
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_variable_rates_and_irregular_payments(seed):
+    rng = np.random.default_rng(seed)
+    n_payments = int(rng.integers(24, 240))
+    resets = {1: 0.05}
+    for month in rng.choice(np.arange(2, n_payments + 1), 3, replace=False):
+        resets[int(month)] = float(rng.choice([0.0, 0.03, 0.06, 0.09]))
+    extra_payments = {int(month): float(rng.uniform(100, 5000)) for month in rng.choice(np.arange(1, n_payments + 1), 4)}
+    skipped_months = {int(month) for month in rng.choice(np.arange(1, n_payments), 2)}
+    principal = float(rng.uniform(5000, 200000))
+
+    result = amortize(principal, resets, n_payments, extra_payments, skipped_months)
+    annual_rates = np.empty(n_payments)
+    for month in sorted(resets):
+        annual_rates[month - 1:] = resets[month]
+    rows = reference_amortize(principal, annual_rates, n_payments, extra_payments, skipped_months)
+    assert_schedule(result['schedule'], rows)
+    assert result['months'] == rows[-1, 0]
+    assert result['total_interest'] == pytest.approx(rows[:, 2].sum())
+    assert result['total_paid'] == pytest.approx(rows[:, 1].sum())
+    assert result['remaining_balance'] == pytest.approx(0, abs=0.005)
+
+    totals = amortize(principal, resets, n_payments, extra_payments, skipped_months, include_schedule=False)
+    assert totals['schedule'] is None
+    assert totals['total_interest'] == pytest.approx(result['total_interest'])
+    assert totals['months'] == result['months']
+
+
+def test_rate_resets_need_month_one():
+    with pytest.raises(ValueError):
+        amortize(10000, {12: 0.05}, 60)
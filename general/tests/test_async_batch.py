@@ -0,0 +1,130 @@
+"""
+Vectorized batch summaries and the asyncio micro-batching front end.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import copy
+
+import pytest
+
+from budget_core.async_batch import compute_budget_list, compute_budgets
+from budget_core.batch import budget_batch
+from budget_core.service import compute_budget
+from budget_service import EXAMPLE_PROFILE
+
+
+def profiles(count):
+    result = []
+    for index in range(count):
+        profile = copy.deepcopy(EXAMPLE_PROFILE)
+        profile['income']['gross_annual_salary'] = 40000 + 1000 * index
+        if index % 3 == 0:
+            profile['income']['state_tax_brackets'] = [[10000, 0.03], [1000000, 0.06]]
+        if index % 4 == 0:
+            profile['extra_items'] = {'utilities': [['Gym', 40]]}
+        if index % 5 == 0:
+            profile['income'].update(pre_tax_deductions_annual=2400, retirement_pre_tax=index % 10 == 0)
+        result.append(profile)
+    return result
+
+
+async def source(items, delay=0.0, read=None):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        if read is not None:
+            read.append(item)
+        yield item
+
+
+async def aenumerate(items):
+    index = 0
+    async for item in items:
+        yield index, item
+        index += 1
+
+
+def test_batch_matches_single_profiles():
+    batch = profiles(12)
+    for index, profile in enumerate(batch):
+        if index % 2:
+            profile['period'] = 'weekly' if index % 4 == 1 else 'Annual'
+    for period in ('monthly', 'biweekly'):
+        for profile, result in zip(batch, budget_batch(batch, period)):
+            expected = compute_budget(dict({'period': period}, **profile))
+            assert result.keys() == expected.keys() and result['period'] == expected['period']
+            for key in ('net_income', 'leftover_money', 'free_money'):
+                assert result[key] == pytest.approx(expected[key])
+            assert result['summary'] == pytest.approx(expected['summary'])
+            for label, breakdown in expected['breakdowns'].items():
+                assert list(result['breakdowns'][label]) == list(breakdown)
+                assert result['breakdowns'][label] == pytest.approx(breakdown)
+    located = copy.deepcopy(EXAMPLE_PROFILE)
+    del located['income']['federal_tax_brackets'], located['income']['state_tax_brackets']
+    located['income'].update(tax_year=2024, state='CA', filing_status='married_joint', gross_annual_salary=260000)
+    assert budget_batch([located])[0]['net_income'] == pytest.approx(compute_budget(located)['net_income'])
+    assert budget_batch([]) == []
+    broken = copy.deepcopy(EXAMPLE_PROFILE)
+    broken['utilities']['gym'] = 40
+    with pytest.raises(TypeError):
+        budget_batch([broken])
+
+
+def test_results_come_back_in_order_in_micro_batches():
+    batch = profiles(50)
+    results = asyncio.run(compute_budget_list(source(batch), batch_size=8, max_pending=2))
+    assert results == budget_batch(batch)
+    # A slow source sends partial batches after the linger time instead of waiting for a full one
+    results = asyncio.run(compute_budget_list(source(batch[:3], delay=0.02), batch_size=100, linger=0.005))
+    assert results == budget_batch(batch[:3])
+
+
+def test_backpressure_bounds_the_profiles_read_ahead():
+    batch = profiles(200)
+    read = []
+
+    async def consume():
+        ahead = []
+        async for _ in compute_budgets(source(batch, read=read), batch_size=10, max_pending=2):
+            await asyncio.sleep(0.001)
+            ahead.append(len(read))
+        return ahead
+
+    ahead = asyncio.run(consume())
+    assert len(ahead) == 200
+    # The batches holding a slot and the one waiting for a slot cap how far the reader runs ahead
+    assert max(read_count - consumed for consumed, read_count in enumerate(ahead, 1)) < (2 + 1) * 10
+
+
+def test_batches_only_start_computing_with_a_slot():
+    started = []
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def submit(self, *args, **kwargs):
+            started.append(1)
+            return super().submit(*args, **kwargs)
+
+    async def consume(executor):
+        ahead = []
+        async for index, _ in aenumerate(compute_budgets(source(profiles(100)), batch_size=10, max_pending=2, executor=executor)):
+            await asyncio.sleep(0.001)
+            ahead.append(len(started) - index // 10)
+        return ahead
+
+    with CountingExecutor(2) as executor:
+        ahead = asyncio.run(consume(executor))
+    assert len(started) == 10 and max(ahead) <= 2
+
+
+def test_errors_reach_the_consumer():
+    broken = copy.deepcopy(EXAMPLE_PROFILE)
+    del broken['utilities']['internet']
+
+    async def failing_source():
+        yield EXAMPLE_PROFILE
+        raise RuntimeError("source failed")
+
+    with pytest.raises(KeyError):
+        asyncio.run(compute_budget_list(source([EXAMPLE_PROFILE, broken]), batch_size=1))
+    with pytest.raises(RuntimeError, match="source failed"):
+        asyncio.run(compute_budget_list(failing_source()))
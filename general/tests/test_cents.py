@@ -0,0 +1,80 @@
+"""
+Integer-cents mode: exact rounding, bracket taxes that agree between the scalar
+and array paths and with the float path, and loan schedules that end at zero.
+"""
+import numpy as np
+import pytest
+
+from budget_core import MonthlyNetIncome, loan_schedule_columns
+from budget_core.amortization import SCHEDULE_COLUMNS, monthly_payment
+from budget_core.cents import MonthlyNetIncomeCents, bracket_tax_cents, loan_schedule_cents, round_div, to_cents
+from budget_core.income import calculate_bracket_tax
+from conftest import FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS
+
+
+def test_to_cents_rounds_half_away_from_zero():
+    assert to_cents(1.005) == 101
+    assert to_cents(-1.005) == -101
+    assert to_cents(12) == 1200
+    assert to_cents(np.array([1.005, -2.675, 0.004])).tolist() == [101, -268, 0]
+    assert round_div(5, 2) == 3 and round_div(np.array([4, 5, -5]), 2).tolist() == [2, 3, -2]
+
+
+@pytest.mark.parametrize('brackets', [FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS, [(168600, 0.062), (float('inf'), 0.0)]])
+def test_bracket_tax_scalar_and_array_agree(brackets):
+    incomes = np.concatenate([
+        np.random.default_rng(0).integers(-100000, 40000000, 2000),
+        [0, 1100000, 1100001, 4472500, 18210000, 18210001],
+    ]).astype(np.int64)
+    taxes = bracket_tax_cents(incomes, brackets)
+    assert taxes.dtype == np.int64
+    assert taxes.tolist() == [bracket_tax_cents(int(income), brackets) for income in incomes]
+    # Within half a cent of the float tax
+    assert np.abs(taxes - calculate_bracket_tax(incomes / 100, brackets) * 100).max() <= 0.5 + 1e-6
+
+
+def test_net_income_matches_float_path():
+    salaries = np.round(np.random.default_rng(1).uniform(20000, 300000, 1000), 2)
+    arguments = (FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS, 0.032, 0.062, 1454, 8024, 0.10, 3960)
+    cents = MonthlyNetIncomeCents(salaries, *arguments, pre_tax_deductions_annual=1200, retirement_pre_tax=True)
+    dollars = MonthlyNetIncome(salaries, *arguments, pre_tax_deductions_annual=1200, retirement_pre_tax=True)
+    net = cents.calculate_net_monthly_income()
+    assert net.dtype == np.int64
+    assert np.abs(net - dollars.calculate_net_monthly_income() * 100).max() <= 1
+    assert MonthlyNetIncomeCents(float(salaries[0]), *arguments).calculate_net_monthly_income() == (
+        MonthlyNetIncomeCents(salaries[:1], *arguments).calculate_net_monthly_income()[0]
+    )
+
+
+def reference_schedule(principal, annual_rate, years, extra_payment):
+    """Month-by-month cents schedule, written out plainly."""
+    rate = round(annual_rate * 1000000)
+    payment = to_cents(monthly_payment(principal, annual_rate, years * 12)) + to_cents(extra_payment)
+    balance = to_cents(principal)
+    rows = []
+    for month in range(1, years * 12 + 1):
+        interest = round_div(balance * rate, 12 * 1000000)
+        principal_payment = payment - interest
+        if principal_payment > balance or month == years * 12:
+            principal_payment = balance
+        balance -= principal_payment
+        rows.append((month, principal_payment + interest, principal_payment, interest, balance))
+        if balance == 0:
+            break
+    return rows
+
+
+@pytest.mark.parametrize('loan', [
+    (32000, 0.05, 30, 500), (250000, 0.0675, 30, 0), (1000, 0.0, 3, 7.5), (0, 0.05, 5, 0), (5000, 0.25, 1, 0),
+])
+def test_loan_schedule_cents(loan):
+    schedule = loan_schedule_cents(*loan)
+    columns = schedule.columns()
+    assert all(columns[name].dtype == np.int64 for name in SCHEDULE_COLUMNS)
+    assert [tuple(row.values()) for row in schedule.to_records()] == reference_schedule(*loan)
+    assert schedule.remaining_balance[-1] == 0
+    assert schedule.total_paid - schedule.total_interest == to_cents(loan[0])
+    assert isinstance(schedule.total_interest, int)
+    if loan[0]:
+        # Close to the float schedule, which it only departs from by the rounding
+        assert schedule.payoff_month == pytest.approx(loan_schedule_columns(*loan).payoff_month, abs=1)
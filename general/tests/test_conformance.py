@@ -0,0 +1,124 @@
+"""
+Conformance of the front ends with budget_core.
+
+The core must reproduce the numbers of the classes each script used to carry,
+and every front end (V1 console, V2/V3 Tkinter, V4 PyQt5) must show exactly the
+numbers the core computes, in every period and every drill-down.
+"""
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from budget_core import FORM_LABELS, SUMMARY_LABELS, MonthlyBudget, parse_form
+from conftest import GENERAL, demo_components, load_script
+
+# Monthly pie slices computed by the classes of the original monthly_budget_V2.py
+REFERENCE = {
+    100300: {
+        'summary': [2777.225, 2500, 548, 1367.275],
+        'Taxes': [1456.0, 414.375, 267.46666666666664, 518.2166666666667, 121.16666666666667],
+        'Free Money': [698.6083333333336, 668.6666666666666],
+    },
+    55000: {
+        'summary': [1394.9166666666667, 2500, 548, -647.9166666666666],
+        'Taxes': [617.2916666666666, 225.625, 146.66666666666666, 284.1666666666667, 121.16666666666667],
+        'Free Money': [-1316.5833333333333, 668.6666666666666],
+    },
+}
+PERIODS = ('Weekly', 'Monthly', 'Annual')
+FORM_VALUES = dict(zip(FORM_LABELS, [
+    "85000", "[(11000, 0.10), (44725, 0.12), (95375, 0.22)]", "[(1000, 0.02), (85000, 0.05)]", "0.02", "0.062",
+    "1200", "6000", "0.05", "3000",
+    "1800", "400", "150", "200",
+    "120", "90", "60", "70", "45", "30", "20", "0",
+]))
+
+
+@pytest.mark.parametrize('salary', sorted(REFERENCE))
+def test_core_matches_original_classes(salary):
+    budget = MonthlyBudget(*demo_components(salary))
+    labels, sizes = budget.summary_segments()
+    assert labels == SUMMARY_LABELS
+    np.testing.assert_allclose(sizes, REFERENCE[salary]['summary'], rtol=1e-12)
+    for label in ('Taxes', 'Free Money'):
+        np.testing.assert_allclose(budget.breakdown_segments(label)[1], REFERENCE[salary][label], rtol=1e-12)
+    for label, total in zip(SUMMARY_LABELS[1:3], REFERENCE[salary]['summary'][1:3]):
+        assert sum(budget.breakdown_segments(label)[1]) == pytest.approx(total)
+
+
+def test_v1_console_output_unchanged():
+    output = subprocess.run(
+        [sys.executable, 'monthly_budget_V1.py'], cwd=GENERAL, capture_output=True, text=True, check=True
+    ).stdout
+    with open(os.path.join(os.path.dirname(__file__), 'data', 'monthly_budget_V1.txt')) as file:
+        assert output == file.read()
+
+
+def hover(gui, index):
+    """Send the front end a mouse move over the middle of a wedge."""
+    wedge = gui.pie_chart.wedges[index]
+    middle = np.deg2rad((wedge.theta1 + wedge.theta2) / 2)
+    x, y = gui.ax.transData.transform((0.5 * np.cos(middle), 0.5 * np.sin(middle)))
+
+    class Event:
+        pass
+
+    event = Event()
+    event.inaxes, event.x, event.y = gui.ax, x, y
+    gui.on_hover(event)
+
+
+def assert_conforms(gui, components):
+    """Check every period and drill-down the front end shows against the core."""
+    budget = MonthlyBudget(*components)
+    for period in PERIODS:
+        gui.set_period(period)
+        labels, sizes = budget.summary_segments(period)
+        assert gui.labels == labels
+        np.testing.assert_allclose(gui.sizes, sizes, rtol=1e-12)
+        for index, label in enumerate(labels):
+            hover(gui, index)
+            expected_labels, expected_sizes = budget.breakdown_segments(label, period)
+            assert gui.labels == expected_labels
+            np.testing.assert_allclose(gui.sizes, expected_sizes, rtol=1e-12)
+            gui.restore_pie_chart()
+
+
+def fill_form(entries, insert):
+    for label, text in FORM_VALUES.items():
+        insert(entries[label], text)
+
+
+def test_v4_conforms(qt_app):
+    components = demo_components()
+    gui = load_script('monthly_budget_V4.py')['BudgetGUI'](*components)
+    assert_conforms(gui, components)
+
+    fill_form(gui.input_form.entries, lambda entry, text: entry.setText(text))
+    gui.input_form.update_budget()
+    assert_conforms(gui, parse_form(FORM_VALUES))
+
+
+def test_v3_conforms(tk_root):
+    components = demo_components()
+    script = load_script('monthly_budget_V3.py')
+    gui = script['BudgetGUI'](tk_root, *components)
+    assert_conforms(gui, components)
+
+    form = script['BudgetInputForm'](tk_root, gui)
+    fill_form(form.entries, lambda entry, text: entry.insert(0, text))
+    form.update_budget()
+    assert_conforms(gui, parse_form(FORM_VALUES))
+
+
+def test_v2_conforms(tk_display):
+    components = demo_components()
+    # V2 creates its own root window
+    gui = load_script('monthly_budget_V2.py')['BudgetGUI'](*components)
+    try:
+        assert_conforms(gui, components)
+    finally:
+        gui.root.destroy()
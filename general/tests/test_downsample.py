@@ -0,0 +1,64 @@
+"""
+Level-of-detail downsampling and the history chart that draws with it.
+"""
+import numpy as np
+import pytest
+
+from budget_core.downsample import LevelOfDetail, minmax_decimate
+
+
+def test_minmax_decimate_keeps_spikes_in_order():
+    x = np.arange(10.0)
+    y = np.array([0, 5, 1, 1, -3, 2, 2, 2, 9, 0], dtype=float)
+    decimated_x, decimated_y = minmax_decimate(x, y, 4)
+    assert decimated_x.tolist() == [0, 1, 4, 5, 8, 9]
+    assert decimated_y.tolist() == [0, 5, -3, 2, 9, 0]
+    np.testing.assert_array_equal(minmax_decimate(x, y, 1)[1], y)
+
+
+def test_levels_match_direct_decimation():
+    rng = np.random.default_rng(1)
+    y = rng.normal(size=5001)
+    x = np.arange(5001.0)
+    detail = LevelOfDetail(x, y, min_points=64)
+    assert len(detail) == 5001 and len(detail.levels) > 4
+    for level, (level_x, level_y) in enumerate(detail.levels):
+        expected_x, expected_y = minmax_decimate(x, y, 2 ** level)
+        np.testing.assert_array_equal(level_x, expected_x)
+        np.testing.assert_array_equal(level_y, expected_y)
+        assert level_y.min() == y.min() and level_y.max() == y.max()
+    with pytest.raises(ValueError):
+        LevelOfDetail(x, y[:-1])
+
+
+def test_view_fits_the_point_budget():
+    x = np.arange(100000.0)
+    detail = LevelOfDetail(x, np.sin(x / 50), min_points=256)
+    level, first, stop = detail.view(0, 99999, 1000)
+    assert level > 0 and stop - first <= 1000 + 2
+    # Zooming in switches to a more detailed level and a slice one point past each end
+    level, first, stop = detail.view(1000, 1100, 1000)
+    assert level == 0 and (first, stop) == (999, 1102)
+    assert detail.level_for(0, 99999, 10 ** 9) == 0
+
+
+def test_chart_redraws_a_slice_per_zoom():
+    pytest.importorskip('matplotlib')
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from budget_core.timeseries_chart import TimeSeriesChart, period_numbers
+
+    figure = Figure(figsize=(4, 3), dpi=50)
+    chart = TimeSeriesChart(figure.add_subplot(111), FigureCanvasAgg(figure), labels=['Taxes', 'Free Money'], min_points=64)
+    periods = np.arange(np.datetime64('1900-01'), np.datetime64('2100-01')).astype(str).tolist()
+    values = np.arange(len(periods), dtype=float)
+    chart.set_data(periods, [values, -values])
+    max_points = 2 * int(chart.ax.bbox.width)
+    assert all(count <= max_points + 2 for count in chart.visible_points())
+    assert chart.ax.get_xlim() == pytest.approx(tuple(period_numbers([periods[0], periods[-1]])))
+
+    start, end = period_numbers(['2000-01', '2000-12'])
+    chart.ax.set_xlim(start, end)
+    assert chart.visible_points() == [14, 14]
+    with pytest.raises(ValueError):
+        chart.set_data(periods, [values])
@@ -0,0 +1,81 @@
+"""
+Income taxes and payroll taxes, for one household and for arrays of households.
+"""
+import numpy as np
+import pytest
+
+from budget_core import MonthlyNetIncome, calculate_bracket_tax
+from conftest import FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS
+
+SOCIAL_SECURITY_BRACKETS = [(168600, 0.062), (float('inf'), 0.0)]
+MEDICARE_TAX_BRACKETS = [(200000, 0.0145), (float('inf'), 0.0235)]
+SALARIES = np.array([0.0, 11000.0, 50000.0, 168600.0, 190000.0, 200000.0, 350000.0])
+
+
+def payroll_income(salary, **options):
+    return MonthlyNetIncome(
+        salary, FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS, 0.032, 0.062, 1454, 8024, 0.10, 3960,
+        SOCIAL_SECURITY_BRACKETS, MEDICARE_TAX_BRACKETS, **options
+    )
+
+
+def test_bracket_tax_scalar_and_array_paths_agree():
+    incomes = np.concatenate((SALARIES, [-10.0, 44725.0, 1e7]))
+    for brackets in (FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS, SOCIAL_SECURITY_BRACKETS):
+        expected = [calculate_bracket_tax(float(income), brackets) for income in incomes]
+        np.testing.assert_allclose(calculate_bracket_tax(incomes, brackets), expected, rtol=1e-12, atol=1e-9)
+    # Income above a capped last bracket is not taxed, as in the original loop
+    assert calculate_bracket_tax(300000.0, [(100000, 0.1)]) == calculate_bracket_tax(np.array(300000.0), [(100000, 0.1)]) == 10000.0
+
+
+def test_social_security_stops_at_the_wage_base():
+    assert payroll_income(100000.0).calculate_fica() == pytest.approx(6200.0)
+    assert payroll_income(250000.0).calculate_fica() == pytest.approx(168600 * 0.062)
+    np.testing.assert_allclose(payroll_income(SALARIES).calculate_fica(), 0.062 * np.minimum(SALARIES, 168600))
+    # Without brackets the flat rate applies to the whole salary
+    flat = MonthlyNetIncome(250000.0, FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS, 0.032, 0.062, 1454, 8024, 0.10, 3960)
+    assert flat.calculate_fica() == pytest.approx(250000 * 0.062)
+    assert flat.calculate_medicare_tax() == 0.0
+
+
+def test_additional_medicare_tax_above_the_threshold():
+    expected = 0.0145 * SALARIES + 0.009 * np.maximum(SALARIES - 200000, 0)
+    np.testing.assert_allclose(payroll_income(SALARIES).calculate_medicare_tax(), expected)
+    income = payroll_income(SALARIES)
+    for index, salary in enumerate(SALARIES):
+        single = payroll_income(float(salary))
+        assert single.calculate_total_taxes() == pytest.approx(income.calculate_total_taxes()[index])
+        assert single.calculate_net_annual_income() == pytest.approx(income.calculate_net_annual_income()[index])
+
+
+def test_pre_tax_deductions_lower_only_the_income_taxes():
+    post_tax = payroll_income(100000.0)
+    pre_tax = payroll_income(100000.0, pre_tax_deductions_annual=2000, retirement_pre_tax=True)
+    assert pre_tax.calculate_pre_tax_deductions() == 2000 + 8024
+    assert pre_tax.calculate_taxable_income() == 100000 - 2000 - 8024
+    assert pre_tax.calculate_federal_tax() == calculate_bracket_tax(100000.0 - 10024, FEDERAL_TAX_BRACKETS)
+    assert pre_tax.calculate_local_tax() == pytest.approx((100000 - 10024) * 0.032)
+    # Payroll taxes stay on the gross salary
+    assert pre_tax.calculate_fica() == post_tax.calculate_fica()
+    assert pre_tax.calculate_medicare_tax() == post_tax.calculate_medicare_tax()
+    # The retirement contribution is deducted once either way; the pre-tax one saves income tax
+    saved = post_tax.calculate_total_taxes() - pre_tax.calculate_total_taxes()
+    assert pre_tax.calculate_net_annual_income() == pytest.approx(post_tax.calculate_net_annual_income() + saved - 2000)
+    assert payroll_income(5000.0, pre_tax_deductions_annual=9000).calculate_taxable_income() == 0
+
+
+def test_deduction_stages_match_the_methods():
+    retirement_pre_tax = np.arange(len(SALARIES)) % 2 == 0
+    households = payroll_income(SALARIES, pre_tax_deductions_annual=1500.0, retirement_pre_tax=retirement_pre_tax)
+    stages = households.calculate_deduction_stages()
+    np.testing.assert_allclose(stages['taxable_income'], np.maximum(SALARIES - 1500 - 8024 * retirement_pre_tax, 0))
+    np.testing.assert_allclose(stages['total_taxes'], households.calculate_total_taxes())
+    np.testing.assert_allclose(stages['total_deductions'], households.calculate_total_deductions())
+    np.testing.assert_allclose(stages['net_annual_income'], households.calculate_net_annual_income())
+    np.testing.assert_allclose(
+        stages['total_deductions'], stages['total_taxes'] + stages['pre_tax_deductions'] + stages['post_tax_deductions']
+    )
+    for index, salary in enumerate(SALARIES):
+        single = payroll_income(float(salary), pre_tax_deductions_annual=1500.0, retirement_pre_tax=bool(retirement_pre_tax[index]))
+        for name, value in single.calculate_deduction_stages().items():
+            assert value == pytest.approx(stages[name][index])
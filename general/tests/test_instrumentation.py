@@ -0,0 +1,79 @@
+"""
+Opt-in timing instrumentation: wrapping, counters, dumps and restoring the methods.
+"""
+import json
+
+import pytest
+
+from budget_core import MonthlyNetIncome, enable_from_environment
+from budget_core.instrumentation import Instrumentation
+from conftest import demo_components
+
+
+class Base:
+    def inherited(self):
+        return 'inherited'
+
+
+class Owner(Base):
+    def own(self, value):
+        return value * 2
+
+
+def test_wrap_does_nothing_until_enabled():
+    timings = Instrumentation()
+    original = Owner.own
+    timings.wrap(Owner, 'own')
+    assert Owner.own is original and timings.stats == {}
+
+
+def test_wrapped_methods_are_counted_and_restored():
+    timings = Instrumentation(max_events=2)
+    timings.enable()
+    original = Owner.own
+    timings.wrap(Owner, 'own')
+    timings.wrap(Owner, 'inherited')
+    instance = Owner()
+    timings.wrap(instance, 'own', name='instance.own')
+    try:
+        assert instance.own(3) == 6 and Owner().own(4) == 8
+        assert instance.inherited() == 'inherited'
+        snapshot = timings.snapshot()
+        # The instance wrapper calls the class wrapper, so both count its call
+        assert {name: entry['calls'] for name, entry in snapshot.items()} == {
+            'Owner.inherited': 1, 'Owner.own': 2, 'instance.own': 1,
+        }
+        assert len(timings.events) == 2  # Only the latest calls are kept for the trace
+        assert timings.format_stats().splitlines()[0].startswith('Operation')
+    finally:
+        timings.unwrap_all()
+    assert Owner.own is original
+    assert 'inherited' not in vars(Owner) and 'own' not in vars(instance)
+
+    timings.reset()
+    assert timings.snapshot() == {} and not timings.events
+
+
+def test_dump_formats(tmp_path):
+    timings = Instrumentation()
+    timings.enable()
+    timings.wrap(MonthlyNetIncome, 'calculate_federal_tax')
+    try:
+        demo_components()[0].calculate_federal_tax()
+    finally:
+        timings.unwrap_all()
+
+    timings.dump(tmp_path / 'stats.json')
+    stats = json.loads((tmp_path / 'stats.json').read_text())
+    assert stats['MonthlyNetIncome.calculate_federal_tax']['calls'] >= 1
+    timings.dump(tmp_path / 'trace.json', 'chrome')
+    events = json.loads((tmp_path / 'trace.json').read_text())['traceEvents']
+    assert {event['ph'] for event in events} == {'X'}
+    assert all(event['dur'] >= 0 for event in events)
+    with pytest.raises(ValueError):
+        timings.dump(tmp_path / 'other.txt', 'csv')
+
+
+def test_environment_switch(monkeypatch):
+    monkeypatch.delenv('BUDGET_INSTRUMENT', raising=False)
+    assert enable_from_environment() is False
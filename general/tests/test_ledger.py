@@ -0,0 +1,93 @@
+"""
+Expense ledger behind Utilities and MortgageAndDebt: running category totals,
+frequencies, copies, and per-household array amounts.
+"""
+import copy
+
+import numpy as np
+import pytest
+
+from budget_core import ExpenseLedger, MonthlyBudget, MortgageAndDebt, Utilities, payments_per_year
+from conftest import demo_components
+
+
+def test_running_totals_follow_every_change():
+    ledger = ExpenseLedger(capacity=1)
+    rent = ledger.add_item(("Housing", "Rent"), 1500)
+    ledger.add_item(("Housing", "Insurance"), 1200, 'annual')
+    gym = ledger.add_item(("Fun", "Gym"), 10, 'weekly')
+    assert ledger.total("Housing") == pytest.approx(1600)
+    assert ledger.total("Fun", "Gym") == pytest.approx(10 * 52 / 12)
+    assert ledger.total() == pytest.approx(1600 + 10 * 52 / 12)
+
+    ledger.set_amount(rent, 1400)
+    ledger.remove_item(gym)
+    assert ledger.total() == pytest.approx(1500)
+    assert ledger.children() == ["Housing", "Fun"]
+    assert ledger.breakdown("Housing") == (["Rent", "Insurance"], [pytest.approx(1400), pytest.approx(100)])
+    with pytest.raises(IndexError):
+        ledger.set_amount(gym, 5)
+    ledger.recompute_totals()
+    assert ledger.total("Housing") == pytest.approx(1500) and ledger.total("Fun") == 0
+
+
+def test_add_items_matches_add_item():
+    paths = [("Utilities", "Internet"), ("Utilities", "Phone"), ("Debt", "Card"), ("Utilities", "Internet")]
+    amounts = [75, 30, 300, 5]
+    bulk = ExpenseLedger()
+    bulk.add_items(paths, amounts, 'biweekly')
+    single = ExpenseLedger()
+    for path, amount in zip(paths, amounts):
+        single.add_item(path, amount, 'biweekly')
+    for path in [(), ("Utilities",), ("Debt",), ("Utilities", "Internet")]:
+        assert bulk.total(*path) == pytest.approx(single.total(*path))
+    assert bulk.monthly_amounts() == pytest.approx(single.monthly_amounts())
+
+
+def test_copy_is_independent():
+    utilities = Utilities(250, 75, 75, 75, 30, 43)
+    duplicate = copy.copy(utilities)
+    duplicate.internet = 100
+    duplicate.add_item("Gym", 40)
+    assert utilities.internet == 75 and utilities.extra_items() == []
+    assert duplicate.calculate_total() - utilities.calculate_total() == pytest.approx(65)
+
+
+def test_frequencies():
+    assert payments_per_year("Weekly") == 52 and payments_per_year(26) == 26
+    with pytest.raises(ValueError):
+        payments_per_year("hourly")
+
+
+def test_per_household_amounts():
+    rent = np.array([1500.0, 1200.0, 900.0])
+    mortgage_and_debt = MortgageAndDebt(rent, 350, 350, 300)
+    assert mortgage_and_debt.ledger.households == 3
+    assert mortgage_and_debt.rent.tolist() == rent.tolist()
+    assert mortgage_and_debt.auto_payment.tolist() == [350, 350, 350]
+    assert mortgage_and_debt.calculate_total_monthly_debt() == pytest.approx(rent + 1000)
+
+    mortgage_and_debt.auto_payment = np.array([0.0, 100.0, 200.0])
+    mortgage_and_debt.add_item("Loan", 120, 'annual')
+    expected = rent + np.array([650.0, 750.0, 850.0]) + 10
+    assert mortgage_and_debt.calculate_total_monthly_debt() == pytest.approx(expected)
+    mortgage_and_debt.ledger.recompute_totals()
+    assert mortgage_and_debt.calculate_total_monthly_debt() == pytest.approx(expected)
+    with pytest.raises(ValueError):
+        mortgage_and_debt.rent = np.array([1.0, 2.0])
+
+    # The same budget as three single-household ones
+    income, _, utilities = demo_components()
+    free_money = MonthlyBudget(income, mortgage_and_debt, utilities).calculate_free_money()
+    for household in range(3):
+        single = MortgageAndDebt(rent[household], [0, 100, 200][household], 350, 300)
+        single.add_item("Loan", 120, 'annual')
+        assert free_money[household] == pytest.approx(MonthlyBudget(income, single, utilities).calculate_free_money())
+
+
+def test_copy_with_household_amounts_does_not_share_totals():
+    utilities = Utilities(np.array([250.0, 100.0]), 75, 75, 75, 30, 43)
+    duplicate = copy.copy(utilities)
+    duplicate.internet = 100
+    assert utilities.calculate_total() == pytest.approx([548, 398])
+    assert duplicate.calculate_total() == pytest.approx([573, 423])
@@ -0,0 +1,86 @@
+"""
+Loan comparison report: closed-form summaries against full schedules.
+"""
+import csv
+import io
+
+import numpy as np
+import pytest
+
+from budget_core import REPORT_COLUMNS, LoanComparison, loan_schedule
+
+SCENARIOS = [
+    {'name': '30-year', 'principal': 300000, 'annual_rate': 0.07, 'years': 30},
+    {'name': '30-year, 1 point', 'principal': 300000, 'annual_rate': 0.0675, 'years': 30, 'fees': 3000},
+    {'name': '15-year', 'principal': 300000, 'annual_rate': 0.0625, 'years': 15, 'fees': 1500},
+    {'name': '30-year + $400', 'principal': 300000, 'annual_rate': 0.07, 'years': 30, 'extra_payment': 400},
+    {'name': 'Expensive', 'principal': 300000, 'annual_rate': 0.0725, 'years': 30, 'fees': 5000},
+    {'name': 'Interest free', 'principal': 12000, 'annual_rate': 0.0, 'years': 2},
+]
+
+
+def cumulative_interest(scenario):
+    rows = loan_schedule(scenario['principal'], scenario['annual_rate'], scenario['years'], scenario.get('extra_payment', 0))
+    return np.cumsum([row['Interest Payment'] for row in rows]), rows
+
+
+def test_summaries_match_schedules():
+    report = LoanComparison(SCENARIOS)
+    for index, scenario in enumerate(SCENARIOS):
+        interest, rows = cumulative_interest(scenario)
+        assert report.payment[index] == pytest.approx(rows[0]['Payment'])
+        assert report.payoff_month[index] == len(rows)
+        assert report.total_interest[index] == pytest.approx(interest[-1], abs=1e-6)
+        months = np.arange(1, len(rows) + 1)
+        np.testing.assert_allclose(report.interest_through(months, index), interest, rtol=1e-9, atol=1e-6)
+    assert report.total_cost.tolist() == pytest.approx((report.total_interest + report.fees).tolist())
+    assert report.interest_saved[0] == 0 and report.interest_saved[3] > 0
+
+
+def test_break_even_matches_month_by_month_costs():
+    report = LoanComparison(SCENARIOS[:5])
+    base, _ = cumulative_interest(SCENARIOS[0])
+    for index, scenario in enumerate(SCENARIOS[:5]):
+        interest, _ = cumulative_interest(scenario)
+        length = max(len(base), len(interest))
+        cost = scenario.get('fees', 0) + np.pad(interest, (0, length - len(interest)), mode='edge')
+        base_cost = np.pad(base, (0, length - len(base)), mode='edge')
+        if cost[-1] > base_cost[-1] + 1e-9:
+            expected = -1
+        elif scenario.get('fees', 0) <= 0:
+            expected = 0
+        else:
+            expected = int(np.argmax(cost <= base_cost + 1e-9)) + 1
+        assert report.break_even_month[index] == expected
+    assert report.break_even_month[4] == -1 and report.break_even_month[1] > 0
+
+
+def test_rendering():
+    report = LoanComparison(SCENARIOS, baseline=0)
+    rows = report.rows()
+    assert [list(row) for row in rows] == [list(REPORT_COLUMNS)] * len(SCENARIOS)
+    assert rows[4]['Break-Even Month'] is None
+
+    text = report.to_text().splitlines()
+    assert len(text) == len(SCENARIOS) + 2
+    assert text[0].startswith('Scenario') and 'never' in text[6]
+
+    parsed = list(csv.reader(io.StringIO(report.render('csv'))))
+    assert parsed[0] == list(REPORT_COLUMNS) and parsed[5][-1] == ''
+    assert float(parsed[3][3]) == pytest.approx(rows[2]['Total Interest'])
+    file = io.StringIO()
+    assert report.to_csv(file) is None and file.getvalue() == report.to_csv()
+    with pytest.raises(ValueError):
+        report.render('html')
+
+
+def test_bar_chart_stacks_fees_on_interest():
+    pytest.importorskip('matplotlib')
+    from matplotlib.figure import Figure
+    from budget_core.loan_chart import plot_loan_report
+
+    report = LoanComparison(SCENARIOS)
+    interest_bars, fee_bars = plot_loan_report(report, Figure().add_subplot(111))
+    assert [bar.get_height() for bar in interest_bars] == pytest.approx(report.total_interest.tolist())
+    assert [bar.get_y() for bar in fee_bars] == pytest.approx(report.total_interest.tolist())
+    assert [bar.get_height() for bar in fee_bars] == pytest.approx(report.fees.tolist())
@@ -0,0 +1,78 @@
+"""
+Household optimizer: the greedy split of leftover money against fixed splits and single households.
+"""
+import itertools
+
+import numpy as np
+import pytest
+
+from budget_core import MonthlyBudget, debts_from_budget, optimize_allocations, optimize_household, project_fixed_split
+from conftest import demo_components
+
+HOUSEHOLDS = dict(
+    leftover=[300.0, 800.0, 1500.0, 50.0],
+    debt_balances=[[4000.0, 15000.0], [0.0, 9000.0], [12000.0, 2000.0], [500.0, 0.0]],
+    debt_rates=[0.24, 0.06],
+    debt_payments=[150.0, 350.0],
+)
+OPTIONS = dict(horizon_months=60, match_rate=0.5, match_limit=3000.0, retirement_limit=1e9)
+
+
+def test_greedy_split_beats_every_fixed_split():
+    # Optimal while no yearly limit holds the household back (unused match room is lost each year)
+    options = dict(OPTIONS, match_rate=0.0)
+    best = optimize_allocations(**HOUSEHOLDS, **options)['net_worth']
+    shares = np.linspace(0, 1, 6)
+    for debt_share, retirement_share in itertools.product(shares, shares):
+        if debt_share + retirement_share > 1 + 1e-9:
+            continue
+        split = (debt_share, 1 - debt_share - retirement_share, retirement_share)
+        fixed = project_fixed_split(**HOUSEHOLDS, split=split, **options)['net_worth']
+        assert np.all(best >= fixed - 1e-6)
+
+
+def test_allocation_order_follows_value_at_the_horizon():
+    result = optimize_allocations(**HOUSEHOLDS, **OPTIONS)
+    first_month = result['first_month']
+    # The first month's cash is the leftover plus the payments of debts without a balance
+    np.testing.assert_allclose(first_month.sum(axis=1), [300.0, 950.0, 1500.0, 400.0])
+    # A 24% card beats the 50% match over 60 months, which beats a 6% loan
+    assert first_month[0].tolist() == pytest.approx([300.0, 0.0, 0.0])
+    assert first_month[1].tolist() == pytest.approx([0.0, 0.0, 950.0])
+    # Over a short horizon the match comes first
+    late = optimize_allocations(**HOUSEHOLDS, **dict(OPTIONS, horizon_months=6))['first_month']
+    assert late[0].tolist() == pytest.approx([0.0, 0.0, 300.0])
+    assert result['debt_free_month'][1, 0] == 0 and result['debt_free_month'][3, 1] == 0
+    assert np.all(result['debt_free_month'][:, 0] > -1)
+
+    # Without debts and a match, the use with the better return wins
+    no_debt = dict(leftover=[100.0], debt_balances=[[0.0]], debt_rates=[0.1], debt_payments=[0.0], horizon_months=12)
+    assert optimize_allocations(**no_debt, savings_yield=0.05, retirement_return=0.02)['first_month'][0].tolist() == pytest.approx([0, 100, 0])
+    # Past the yearly retirement limit the rest goes to savings
+    limited = optimize_allocations(**no_debt, savings_yield=0.02, retirement_return=0.07, retirement_limit=600)
+    assert limited['totals'][0].tolist() == pytest.approx([0, 600, 600])
+
+
+def test_households_are_independent():
+    batch = optimize_allocations(**HOUSEHOLDS, **OPTIONS)
+    for index in range(len(HOUSEHOLDS['leftover'])):
+        single = optimize_allocations(
+            [HOUSEHOLDS['leftover'][index]], [HOUSEHOLDS['debt_balances'][index]],
+            HOUSEHOLDS['debt_rates'], HOUSEHOLDS['debt_payments'], **OPTIONS
+        )
+        assert single['net_worth'][0] == pytest.approx(batch['net_worth'][index])
+        np.testing.assert_allclose(single['totals'][0], batch['totals'][index])
+
+
+def test_optimize_household_from_a_budget():
+    income, mortgage_and_debt, utilities = demo_components()
+    budget = MonthlyBudget(income, mortgage_and_debt, utilities)
+    debts = debts_from_budget(
+        mortgage_and_debt, {'credit_card_payment': 3000, 'auto_payment': 12000}, {'credit_card_payment': 0.22, 'auto_payment': 0.07}
+    )
+    assert [debt['payment'] for debt in debts] == [300, 350]
+    result = optimize_household(budget, debts, horizon_months=36)
+    assert sum(result['first_month'].values()) == pytest.approx(budget.calculate_leftover_money())
+    assert result['first_month']['Debt Prepayment'] == pytest.approx(budget.calculate_leftover_money())
+    assert set(result['debt_free_month']) == {'credit_card_payment', 'auto_payment'}
+    assert isinstance(result['net_worth'], float)
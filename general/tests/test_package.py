@@ -0,0 +1,33 @@
+"""
+The budget_core package imports only the budget classes up front and the rest of
+its names on first use.
+"""
+import subprocess
+import sys
+
+import pytest
+
+import budget_core
+from conftest import GENERAL
+
+
+def test_import_skips_heavy_modules():
+    heavy = ('sqlite3', 'asyncio', 'multiprocessing', 'concurrent.futures', 'budget_core.service')
+    loaded = subprocess.run(
+        [sys.executable, '-c', f'import sys, budget_core; print([m for m in {heavy!r} if m in sys.modules])'],
+        cwd=GENERAL, capture_output=True, text=True, check=True
+    ).stdout
+    assert loaded.strip() == '[]'
+
+
+@pytest.mark.parametrize('module, names', sorted(budget_core._LAZY_MODULES.items()))
+def test_lazy_names_resolve_to_submodule_objects(module, names):
+    submodule = __import__(f'budget_core.{module}', fromlist=list(names))
+    for name in names:
+        assert getattr(budget_core, name) is getattr(submodule, name)
+        assert name in dir(budget_core)
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        budget_core.not_a_name
@@ -0,0 +1,84 @@
+"""
+Multi-debt payoff simulator: strategies, roll-over and a plain reference loop.
+"""
+import numpy as np
+import pytest
+
+from budget_core import compare_strategies, monthly_payment, simulate_payoff
+from budget_core.payoff import PAID_OFF, payoff_order
+
+DEBTS = [
+    {'name': 'card', 'balance': 6000.0, 'annual_rate': 0.24, 'payment': 120.0},
+    {'name': 'store card', 'balance': 900.0, 'annual_rate': 0.18, 'payment': 35.0},
+    {'name': 'car', 'balance': 14000.0, 'annual_rate': 0.065, 'payment': 320.0},
+    {'name': 'student loan', 'balance': 22000.0, 'annual_rate': 0.045, 'payment': 230.0},
+]
+
+
+def reference_payoff(debts, extra_payment, priority, roll_over=True, max_months=360):
+    """One debt at a time, in plain Python."""
+    balances = [debt['balance'] for debt in debts]
+    interest = [0.0] * len(debts)
+    months = 0
+    while months < max_months and any(balance > 0 for balance in balances):
+        months += 1
+        available = extra_payment
+        for i, debt in enumerate(debts):
+            charged = balances[i] * debt['annual_rate'] / 12
+            interest[i] += charged
+            balances[i] += charged
+            paid = min(debt['payment'], balances[i])
+            balances[i] -= paid
+            if roll_over:
+                available += debt['payment'] - paid
+        for i in priority:
+            paid = min(available, balances[i])
+            balances[i] -= paid
+            available -= paid
+        balances = [0.0 if balance < PAID_OFF else balance for balance in balances]
+    return months, interest, balances
+
+
+@pytest.mark.parametrize('strategy', ['avalanche', 'snowball'])
+@pytest.mark.parametrize('roll_over', [True, False])
+def test_matches_reference_loop(strategy, roll_over):
+    result = simulate_payoff(DEBTS, 250, strategy, roll_over=roll_over)
+    months, interest, balances = reference_payoff(DEBTS, 250, payoff_order(DEBTS, strategy), roll_over)
+    assert result['months'] == months
+    assert [debt['interest'] for debt in result['debts']] == pytest.approx(interest)
+    np.testing.assert_allclose(result['balances'][-1], balances, atol=1e-6)
+    assert result['balances'].shape == (months, len(DEBTS))
+    assert result['total_paid'] == pytest.approx(sum(debt['balance'] for debt in DEBTS) + sum(interest))
+
+
+def test_strategies():
+    assert payoff_order(DEBTS, 'avalanche') == [0, 1, 2, 3]
+    assert payoff_order(DEBTS, 'snowball') == [1, 0, 2, 3]
+    assert payoff_order(DEBTS, 'custom', ['car', 'card']) == [2, 0, 1, 3]
+    with pytest.raises(ValueError):
+        payoff_order(DEBTS, 'custom')
+    with pytest.raises(KeyError):
+        payoff_order(DEBTS, 'custom', ['mortgage'])
+    with pytest.raises(ValueError):
+        payoff_order(DEBTS, 'highest')
+
+    results = compare_strategies(DEBTS, 250, orders={'car first': ['car']})
+    assert set(results) == {'avalanche', 'snowball', 'car first'}
+    assert results['avalanche']['total_interest'] <= results['snowball']['total_interest']
+    assert results['avalanche']['total_interest'] <= results['car first']['total_interest']
+    assert results['snowball']['debts'][1]['payoff_month'] < results['avalanche']['debts'][1]['payoff_month']
+    # Rolling paid-off minimums into the extra payment finishes sooner
+    assert simulate_payoff(DEBTS, 250)['months'] < simulate_payoff(DEBTS, 250, roll_over=False)['months']
+
+
+def test_single_loan_and_unpaid_debts():
+    payment = monthly_payment(10000, 0.06, 36)
+    loan = [{'name': 'loan', 'balance': 10000.0, 'annual_rate': 0.06, 'payment': payment}]
+    result = simulate_payoff(loan)
+    assert result['months'] == 36 and result['debts'][0]['payoff_month'] == 36
+    assert result['total_paid'] == pytest.approx(36 * payment)
+
+    short = simulate_payoff(loan, max_months=12)
+    assert short['months'] == 12 and short['debts'][0]['payoff_month'] is None
+    assert short['total_paid'] == pytest.approx(12 * payment)
+    assert simulate_payoff([dict(loan[0], balance=0.0)])['months'] == 0
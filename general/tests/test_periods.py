@@ -0,0 +1,42 @@
+"""
+Budget views per week, pay period, month or year, derived from one computation.
+"""
+import pytest
+
+from budget_core import FREQUENCIES, PERIODS, MonthlyBudget, MonthlyNetIncome, payments_per_year
+from conftest import demo_components
+
+
+def test_payments_per_year():
+    assert payments_per_year('Monthly') == 12.0
+    assert payments_per_year('biweekly') == 26.0
+    assert payments_per_year(6) == 6.0
+    assert set(PERIODS) <= set(FREQUENCIES)
+    with pytest.raises(ValueError):
+        payments_per_year('fortnightly')
+
+
+@pytest.mark.parametrize('period', PERIODS)
+def test_periods_scale_the_monthly_figures(period):
+    income, mortgage_and_debt, utilities = demo_components()
+    budget = MonthlyBudget(income, mortgage_and_debt, utilities)
+    scale = 12 / FREQUENCIES[period]
+    labels, monthly = budget.summary_segments()
+    assert budget.summary_segments(period) == (labels, pytest.approx([size * scale for size in monthly]))
+    for label in labels:
+        breakdown_labels, sizes = budget.breakdown_segments(label)
+        assert budget.breakdown_segments(label, period) == (breakdown_labels, pytest.approx([size * scale for size in sizes]))
+    assert income.calculate_net_income(period) == pytest.approx(income.calculate_net_monthly_income() * scale)
+    assert utilities.calculate_period_total(period) == pytest.approx(utilities.calculate_total() * scale)
+    assert budget.breakdown_segments('Unknown', period) is None
+
+
+def test_switching_period_does_not_recompute_taxes(monkeypatch):
+    calls = []
+    original = MonthlyNetIncome.calculate_deduction_stages
+    monkeypatch.setattr(MonthlyNetIncome, 'calculate_deduction_stages', lambda self: calls.append(1) or original(self))
+    budget = MonthlyBudget(*demo_components())
+    for period in PERIODS:
+        budget.summary_segments(period)
+        budget.breakdown_segments('Taxes', period)
+    assert len(calls) == 1
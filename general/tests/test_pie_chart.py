@@ -0,0 +1,76 @@
+"""
+Matplotlib pie chart shared by the GUI front ends.
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip('matplotlib')
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+import matplotlib.pyplot as plt  # noqa: E402
+
+from budget_core.pie_chart import PieChart, drawable_segments, palette, pie_layout  # noqa: E402
+
+
+@pytest.fixture
+def chart():
+    figure = Figure(figsize=(4, 4), dpi=50)
+    return PieChart(figure.add_subplot(111), FigureCanvasAgg(figure))
+
+
+def test_drawable_segments_clamps_deficits():
+    labels, sizes = drawable_segments(["Taxes", "Free Money"], [1200.0, -647.9166])
+    assert labels == ["Taxes", "Free Money (deficit $647.92)"]
+    assert sizes == [1200.0, 0.0]
+    with pytest.raises(ValueError):
+        pie_layout([1200.0, -647.9166])
+
+
+def test_draw_deficit_and_empty_budgets(chart):
+    chart.draw(["Taxes", "Free Money"], [1200.0, -300.0])
+    assert [wedge.get_label() for wedge in chart.wedges] == ["Taxes", "Free Money (deficit $300.00)"]
+    assert chart.wedges[1].theta2 - chart.wedges[1].theta1 == pytest.approx(0)
+
+    chart.draw(["Taxes", "Free Money"], [0.0, -300.0])
+    assert chart.wedges == []
+    assert chart.wedge_index_at(0, 0) is None
+    assert not any(artist.get_visible() for artist in chart._wedge_pool)
+
+
+def test_palette_is_computed_once_per_slice_count():
+    assert palette(4) is palette(4)
+    assert len(palette(4)) == 4 and len(palette(4)[0]) == 4
+    assert palette(4)[0] == tuple(plt.cm.tab20(0.0))
+
+
+def test_pooled_artists_match_axes_pie(chart):
+    sizes = [548.0, 2500.0, 2777.225, 1367.275]
+    chart.draw(["A", "B", "C", "D"], sizes)
+    pool = list(chart._wedge_pool)
+    reference_wedges, _, autotexts = Figure().add_subplot(111).pie(sizes, startangle=140, autopct='%1.1f%%')
+    for wedge, reference in zip(chart.wedges, reference_wedges):
+        assert wedge.theta1 == pytest.approx(reference.theta1)
+        assert wedge.theta2 == pytest.approx(reference.theta2)
+    assert [text.get_text() for text in chart._autotext_pool[:4]] == [text.get_text() for text in autotexts]
+
+    # Fewer slices hide the spare artists instead of creating new ones
+    chart.draw(["A", "B"], [1.0, 3.0])
+    assert chart._wedge_pool == pool
+    assert [wedge.get_visible() for wedge in pool] == [True, True, False, False]
+    assert not any(text.get_visible() for text in chart._text_pool[2:])
+
+
+def test_wedge_index_at_matches_contains_point(chart):
+    rng = np.random.default_rng(0)
+    chart.draw([str(index) for index in range(12)], rng.uniform(1, 100, 12))
+    points = chart.ax.transData.transform(rng.uniform(-1.2, 1.2, (2000, 2)))
+    for x, y in points:
+        expected = [index for index, wedge in enumerate(chart.wedges) if wedge.contains_point((x, y))]
+        index = chart.wedge_index_at(x, y)
+        if len(expected) == 1:
+            assert index == expected[0]
+        elif not expected:
+            # Only points right on the rim may disagree with the rendered path
+            data_x, data_y = chart.ax.transData.inverted().transform((x, y))
+            assert index is None or np.hypot(data_x, data_y) > 0.99
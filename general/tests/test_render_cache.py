@@ -0,0 +1,51 @@
+"""
+Pie render cache: content keys and the least-recently-used memory cap.
+"""
+import pytest
+
+from budget_core.render_cache import RenderCache, budget_hash
+
+
+def test_budget_hash_ignores_float_noise_only():
+    key = budget_hash(["Taxes", "Free Money"], [1200.0, 300.0], (400, 400), 100)
+    assert budget_hash(("Taxes", "Free Money"), [1200.0 + 1e-9, 300.0], (400, 400), 100) == key
+    assert budget_hash(["Taxes", "Free Money"], [1200.01, 300.0], (400, 400), 100) != key
+    assert budget_hash(["Taxes", "Free Money"], [1200.0, 300.0], (500, 400), 100) != key
+    assert budget_hash(["Free Money", "Taxes"], [1200.0, 300.0], (400, 400), 100) != key
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = RenderCache(max_bytes=300)
+    cache.put('a', 'A', 100)
+    cache.put('b', 'B', 100)
+    cache.put('c', 'C', 100)
+    assert cache.get('a') == 'A'  # 'b' is now the least recently used
+    cache.put('d', 'D', 100)
+    assert 'b' not in cache and len(cache) == 3
+    assert cache.get('b') is None
+
+    cache.put('a', 'A2', 150)  # Replacing an entry accounts for its new size
+    assert cache.current_bytes <= 300 and cache.get('a') == 'A2'
+    cache.put('huge', 'H', 301)
+    assert 'huge' not in cache
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'entries': len(cache), 'bytes': cache.current_bytes, 'max_bytes': 300}
+
+    cache.clear()
+    assert len(cache) == 0 and cache.current_bytes == 0 and cache.hits == 2
+
+
+def test_pie_chart_reuses_cached_renderings():
+    pytest.importorskip('matplotlib')
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from budget_core.pie_chart import PieChart
+
+    figure = Figure(figsize=(4, 4), dpi=50)
+    shared = RenderCache()
+    chart = PieChart(figure.add_subplot(111), FigureCanvasAgg(figure), render_cache=shared)
+    chart.draw(["Taxes", "Free Money"], [1200.0, 300.0])
+    chart.draw(["Taxes", "Fixed"], [1200.0, 800.0])
+    chart.draw(["Taxes", "Free Money"], [1200.0, 300.0])
+    assert (shared.hits, shared.misses, len(shared)) == (1, 2, 2)
+    assert [wedge.get_label() for wedge in chart.wedges] == ["Taxes", "Free Money"]
+    assert chart.wedges[0].theta2 - chart.wedges[0].theta1 == pytest.approx(360 * 0.8)
@@ -0,0 +1,77 @@
+"""
+Categorization rules: exact, contains and regex rules match with the documented
+priorities, whichever strategy the engine picks.
+"""
+import random
+import re
+
+import pytest
+
+from budget_core import rules
+from budget_core.rules import RuleEngine
+
+
+def sequential_match(contains_rules, description):
+    text = description.strip().upper()
+    for pattern, target in contains_rules:
+        if pattern.upper() in text:
+            return target
+    return None
+
+
+def test_kinds_are_tried_in_order():
+    engine = RuleEngine([
+        ("coffee", "Dining"),
+        ("starbucks coffee", "Treats", 'exact'),
+        (r"\bCOFFEE\b", "Regex", 'regex'),
+    ])
+    assert len(engine) == 3
+    assert engine.match("  Starbucks Coffee ") == "Treats"
+    assert engine.match("STARBUCKS COFFEE #12") == "Dining"
+    assert engine.match("tea") is None
+    with pytest.raises(ValueError):
+        RuleEngine([("x", "y", 'glob')])
+
+
+@pytest.mark.parametrize('threshold', [0, 1000])
+def test_contains_rules_first_listed_wins(monkeypatch, threshold):
+    monkeypatch.setattr(rules, 'AUTOMATON_THRESHOLD', threshold)
+    rng = random.Random(0)
+    alphabet = 'ABCDE '
+    contains_rules = [(''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))), index) for index in range(60)]
+    engine = RuleEngine(contains_rules)
+    assert (engine._patterns is None) == (threshold == 0)
+    for _ in range(500):
+        description = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        assert engine.match(description) == sequential_match(contains_rules, description)
+
+
+def test_regex_rules_keep_their_own_groups_and_flags():
+    engine = RuleEngine([
+        (r"(\w)\1{2}", "Repeated", 'regex'),
+        (r"(?P<store>WALMART) #(?P=store)", "Named", 'regex'),
+        (r"(?i)^amzn", "Amazon", 'regex'),
+        (r"(AB)+C", "Groups", 'regex'),
+        (r"PAYROLL|SALARY", "Income", 'regex'),
+    ])
+    assert engine.match("ZZZ MART") == "Repeated"
+    assert engine.match("xyz walmart #walmart") == "Named"
+    assert engine.match("amzn mktp") == "Amazon"
+    assert engine.match("x ababc") == "Groups"
+    assert engine.match("ACME salary") == "Income"
+    assert engine.match("abd") is None
+
+
+def test_leftmost_regex_match_wins_then_first_listed():
+    engine = RuleEngine([
+        (r"GROCERY", "Late", 'regex'),
+        (r"(\w)\1", "Double", 'regex'),
+        (r"SHOP", "Shop", 'regex'),
+        (r"SHOP(?:PING)?", "Shopping", 'regex'),
+    ])
+    assert engine.match("GROCERY SHOPPING") == "Late"
+    assert engine.match("BOOK SHOP GROCERY") == "Double"  # The OO comes before SHOP and GROCERY
+    assert engine.match("SHOP GROCERY") == "Shop"  # Both SHOP rules match at 0; the first listed wins
+    assert engine.match("AA GROCERY") == "Double"
+    with pytest.raises(re.error):
+        RuleEngine([("(", "Broken", 'regex')])
@@ -0,0 +1,118 @@
+"""
+Resumable multiprocess batch runner and its command line.
+"""
+import copy
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from budget_core import runner
+from budget_core.runner import chunk_lines, run_batch, run_chunk
+from budget_core.service import compute_budget
+from budget_service import EXAMPLE_PROFILE
+from conftest import GENERAL
+
+
+@pytest.fixture
+def households(tmp_path):
+    lines = []
+    for index in range(7):
+        profile = copy.deepcopy(EXAMPLE_PROFILE)
+        profile['income']['gross_annual_salary'] = 50000 + 5000 * index
+        lines.append(json.dumps(profile))
+    lines.insert(3, '{"income": {}}')  # Cannot be computed
+    lines.insert(5, '')
+    path = tmp_path / 'households.jsonl'
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+def expected_lines(path):
+    results = []
+    for line in path.read_text().splitlines():
+        if line.strip():
+            try:
+                results.append(compute_budget(json.loads(line)))
+            except KeyError as e:
+                results.append({"error": f"KeyError: {e}"})
+    return results
+
+
+def test_chunk_lines_skips_blank_lines(households):
+    chunks = list(chunk_lines(households, 3))
+    assert [index for index, _ in chunks] == [0, 1, 2]
+    assert [len(lines) for _, lines in chunks] == [3, 3, 2]
+
+
+@pytest.mark.filterwarnings('ignore:overflow:RuntimeWarning')
+def test_run_chunk_turns_every_failure_into_an_error_line(tmp_path, monkeypatch):
+    def compute(item):
+        if item == 'boom':
+            raise RuntimeError("boom")
+        return item
+
+    monkeypatch.setitem(runner.COMPUTATIONS, 'echo', compute)
+    part_path = str(tmp_path / 'part.jsonl')
+    lines = ['"boom"', '{"value": 1}', '"ok"']
+    assert run_chunk('echo', lines, part_path) == 3
+    assert [json.loads(line) for line in open(part_path)] == [{"error": "RuntimeError: boom"}, {"value": 1}, "ok"]
+
+    # A loan this large overflows to NaN, which json.dumps would write as invalid JSON
+    loans = [json.dumps({'principal': 1e308, 'annual_rate': 10, 'years': 30}), json.dumps({'principal': 1000, 'annual_rate': 0.05, 'years': 1})]
+    run_chunk('loan', loans, part_path)
+    with open(part_path) as file:
+        results = [json.loads(line, parse_constant=pytest.fail) for line in file]
+    assert list(results[0]) == ['error'] and results[1]['months'] == 12
+
+
+def test_output_lines_follow_input_lines(households, tmp_path):
+    output = str(tmp_path / 'budgets.jsonl')
+    assert run_batch(str(households), output, 'budget', workers=2, chunk_size=3, progress=False) == 8
+    results = [json.loads(line) for line in open(output)]
+    assert results == json.loads(json.dumps(expected_lines(households)))
+    assert not os.path.exists(output + '.parts')
+    with pytest.raises(ValueError):
+        run_batch(str(households), output, 'mortgage', progress=False)
+
+
+def test_resume_skips_finished_chunks(households, tmp_path):
+    output = str(tmp_path / 'budgets.jsonl')
+    checkpoint_dir = output + '.parts'
+    os.makedirs(checkpoint_dir)
+    stat = os.stat(households)
+    manifest = {
+        'input': os.path.abspath(households), 'size': stat.st_size, 'mtime': stat.st_mtime,
+        'kind': 'budget', 'chunk_size': 3,
+    }
+    with open(os.path.join(checkpoint_dir, 'manifest.json'), 'w') as file:
+        json.dump(manifest, file)
+    # A part left by the interrupted run, recognizable in the merged output
+    with open(os.path.join(checkpoint_dir, 'part-000000.jsonl'), 'w') as file:
+        file.write('{"earlier": 0}\n{"earlier": 1}\n{"earlier": 2}\n')
+
+    assert run_batch(str(households), output, 'budget', workers=1, chunk_size=3, progress=False) == 5
+    results = [json.loads(line) for line in open(output)]
+    assert results[:3] == [{"earlier": 0}, {"earlier": 1}, {"earlier": 2}]
+    assert results[3:] == json.loads(json.dumps(expected_lines(households)[3:]))
+
+    # A checkpoint of another run is never mixed in
+    os.makedirs(checkpoint_dir)
+    with open(os.path.join(checkpoint_dir, 'manifest.json'), 'w') as file:
+        json.dump(dict(manifest, chunk_size=4), file)
+    with pytest.raises(ValueError):
+        run_batch(str(households), output, 'budget', workers=1, chunk_size=3, progress=False)
+
+
+def test_command_line(households, tmp_path):
+    output = tmp_path / 'budgets.jsonl'
+    command = [sys.executable, 'budget_cli.py', 'budget', str(households), str(output), '--workers', '1', '--chunk-size', '4']
+    finished = subprocess.run(command, cwd=GENERAL, capture_output=True, text=True)
+    assert finished.returncode == 0
+    assert "Computed 8 profiles" in finished.stderr
+    assert len(output.read_text().splitlines()) == 8
+
+    missing = subprocess.run(command[:3] + [str(tmp_path / 'missing.jsonl'), str(output), '--quiet'], cwd=GENERAL, capture_output=True, text=True)
+    assert missing.returncode == 1 and missing.stderr.startswith("Error:")
@@ -0,0 +1,102 @@
+"""
+Scenario workspace: new scenarios share their inputs until they change them,
+and only the scenarios whose inputs changed are recomputed.
+"""
+import numpy as np
+import pytest
+
+from budget_core import MonthlyBudget, MonthlyNetIncome
+from budget_core.scenarios import COMPARISON_ROWS, ScenarioWorkspace
+from conftest import demo_components
+
+
+@pytest.fixture
+def workspace():
+    workspace = ScenarioWorkspace(*demo_components())
+    workspace.add_scenario("Cheaper Rent")
+    return workspace
+
+
+def test_new_scenario_shares_components_until_changed(workspace):
+    base = workspace.components("Base")
+    assert workspace.components("Cheaper Rent") == base
+    assert workspace.stats()['copies'] == 0
+
+    workspace.set("Cheaper Rent", 'mortgage_and_debt', 'rent', 1200)
+    changed = workspace.components("Cheaper Rent")
+    assert changed[0] is base[0] and changed[2] is base[2]
+    assert changed[1] is not base[1]
+    assert base[1].rent == 1500 and changed[1].rent == 1200
+    assert workspace.stats()['copies'] == 1
+
+
+def test_owned_copies_share_no_mutable_state(workspace):
+    workspace.set("Cheaper Rent", 'monthly_net_income', 'savings_rate', 0.05)
+    workspace.add_item("Cheaper Rent", 'utilities', "Gym", 40)
+    base_income, _, base_utilities = workspace.components("Base")
+    income, _, utilities = workspace.components("Cheaper Rent")
+    assert income.federal_tax_brackets == base_income.federal_tax_brackets
+    assert income.federal_tax_brackets is not base_income.federal_tax_brackets
+    assert income.state_tax_brackets is not base_income.state_tax_brackets
+    assert utilities.ledger.amounts is not base_utilities.ledger.amounts
+    assert "Gym" not in base_utilities.breakdown()[0]
+
+
+def test_only_changed_scenarios_are_recomputed(workspace):
+    workspace.results()
+    assert workspace.recomputed == 2
+    workspace.add_scenario("Copy")  # Starts out with the computed budget of the base
+    workspace.set("Cheaper Rent", 'mortgage_and_debt', 'rent', 1200)
+    workspace.set("Cheaper Rent", 'mortgage_and_debt', 'rent', 1200)
+    results = workspace.results()
+    assert workspace.recomputed == 3
+    assert list(results["Base"]) == list(COMPARISON_ROWS)
+    assert results["Base"]['Free Money'] - results["Cheaper Rent"]['Free Money'] == pytest.approx(-300)
+    _, sizes = MonthlyBudget(*workspace.components("Cheaper Rent")).summary_segments()
+    assert [results["Cheaper Rent"][label] for label in COMPARISON_ROWS[:4]] == pytest.approx(sizes)
+
+
+def test_array_inputs_compare_by_content(workspace):
+    salaries = np.array([60000.0, 100300.0, 150000.0])
+    workspace.set("Cheaper Rent", 'monthly_net_income', 'gross_annual_salary', salaries)
+    workspace.budget("Cheaper Rent")
+    recomputed = workspace.recomputed
+    workspace.set("Cheaper Rent", 'monthly_net_income', 'gross_annual_salary', salaries.copy())
+    assert workspace.recomputed == recomputed and "Cheaper Rent" in workspace._budgets
+    workspace.set("Cheaper Rent", 'monthly_net_income', 'gross_annual_salary', salaries[:2])
+    assert "Cheaper Rent" not in workspace._budgets
+
+    income, mortgage_and_debt, utilities = workspace.components("Cheaper Rent")
+    same = MonthlyNetIncome(*(getattr(income, name) for name in (
+        'gross_annual_salary', 'federal_tax_brackets', 'state_tax_brackets', 'local_tax_rate', 'fica_rate',
+        'medicare_annual_cost', 'retirement_contribution_annual', 'savings_rate', 'car_insurance_annual_cost',
+    )))
+    assert workspace.update("Cheaper Rent", same, mortgage_and_debt, utilities) == []
+
+
+def test_update_keeps_unchanged_components_shared(workspace):
+    income, mortgage_and_debt, _ = demo_components()
+    _, _, utilities = demo_components(55000)
+    utilities.internet = 90
+    assert workspace.update("Cheaper Rent", income, mortgage_and_debt, utilities) == ['utilities']
+    assert workspace.components("Cheaper Rent")[0] is workspace.components("Base")[0]
+
+
+def test_scenario_errors(workspace):
+    with pytest.raises(ValueError):
+        workspace.add_scenario("Cheaper Rent")
+    with pytest.raises(ValueError):
+        workspace.remove_scenario("Base")
+    with pytest.raises(AttributeError):
+        workspace.set("Cheaper Rent", 'utilities', 'pool', 10)
+    with pytest.raises(KeyError):
+        workspace.add_item("Cheaper Rent", 'monthly_net_income', "Bonus", 10)
+    workspace.remove_scenario("Cheaper Rent")
+    assert workspace.names() == ["Base"] and len(workspace) == 1
+
+
+def test_to_text_shows_deficits(workspace):
+    workspace.set("Cheaper Rent", 'mortgage_and_debt', 'rent', 9000)
+    text = workspace.to_text()
+    assert text.splitlines()[0].split() == ["Base", "Cheaper", "Rent"]
+    assert "-$" in text.splitlines()[-2]
@@ -0,0 +1,102 @@
+"""
+JSON budget and loan service: results match the core, repeated inputs come from
+the cache, and malformed requests always get an error response.
+"""
+import copy
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from budget_core import MonthlyBudget
+from budget_core.service import BudgetService, canonical_key, compute_budget, compute_loan
+from budget_service import EXAMPLE_PROFILE, make_server
+from conftest import demo_components
+
+
+@pytest.fixture
+def service():
+    service = BudgetService(workers=0)
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def url(service):
+    server = make_server(port=0, service=service)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def post(url, path, body):
+    request = urllib.request.Request(url + path, data=body if isinstance(body, bytes) else json.dumps(body).encode())
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_compute_budget_matches_core():
+    result = compute_budget(EXAMPLE_PROFILE)
+    labels, sizes = MonthlyBudget(*demo_components()).summary_segments()
+    assert list(result['summary']) == labels
+    assert list(result['summary'].values()) == pytest.approx(sizes)
+    assert result['free_money'] == pytest.approx(sizes[-1])
+
+    # The top state bracket is open-ended, so salaries above the example's are taxed in full
+    profile = copy.deepcopy(EXAMPLE_PROFILE)
+    profile['income']['gross_annual_salary'] = 250000
+    _, sizes = MonthlyBudget(*demo_components(250000)).summary_segments()
+    assert list(compute_budget(profile)['summary'].values()) == pytest.approx(sizes)
+
+
+def test_canonical_key_ignores_key_order_and_number_format():
+    reordered = json.loads(json.dumps(EXAMPLE_PROFILE), object_pairs_hook=lambda pairs: dict(reversed(pairs)))
+    reordered['mortgage_and_debt']['rent'] = 1500.0
+    assert canonical_key('budget', reordered) == canonical_key('budget', EXAMPLE_PROFILE)
+    assert canonical_key('loan', EXAMPLE_PROFILE) != canonical_key('budget', EXAMPLE_PROFILE)
+
+
+def test_batch_computes_each_distinct_item_once(service):
+    other = copy.deepcopy(EXAMPLE_PROFILE)
+    other['mortgage_and_debt']['rent'] = 1200
+    results = json.loads(service.handle('budget', {'items': [EXAMPLE_PROFILE, other, EXAMPLE_PROFILE]}))
+    assert results[0] == results[2] != results[1]
+    assert service.stats()['entries'] == 2
+    assert json.loads(service.handle('budget', EXAMPLE_PROFILE)) == results[0]
+
+
+def test_compute_loan():
+    result = compute_loan({'principal': 200000, 'annual_rate': 0.06, 'years': 30})
+    assert result['months'] == 360
+    assert result['monthly_payment'] == pytest.approx(1199.10, abs=0.01)
+    assert result['schedule'][-1]['Remaining Balance'] == pytest.approx(0, abs=1e-6)
+    assert 'schedule' not in compute_loan({'principal': 1000, 'annual_rate': 0.05, 'years': 1, 'include_schedule': False})
+
+
+@pytest.mark.parametrize('field, value', [
+    ('income', [1, 2]), ('income', "x"), ('mortgage_and_debt', [1]), ('utilities', None), ('extra_items', "x"),
+])
+def test_non_object_sections_are_bad_requests(url, field, value):
+    profile = copy.deepcopy(EXAMPLE_PROFILE)
+    profile[field] = value
+    assert post(url, '/budget', profile) == (400, {'error': f"{field} must be a JSON object"})
+
+
+def test_error_responses(url, service, monkeypatch):
+    assert post(url, '/budget', b'{') == (400, {'error': "Request body must be JSON"})
+    assert post(url, '/nothing', {})[0] == 404
+    assert post(url, '/budget', {'income': {}})[0] == 400
+    assert post(url, '/loan', {'principal': 1000, 'annual_rate': 0.05, 'years': 1.5})[0] == 400
+
+    def fail(kind, payload):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(service, 'handle', fail)
+    assert post(url, '/budget', EXAMPLE_PROFILE) == (500, {'error': "RuntimeError: boom"})
@@ -0,0 +1,88 @@
+"""
+Progressive startup of the V4 front end: the shell paints first, then the form
+and the charts replace the placeholder, and the process exits cleanly.
+"""
+import os
+import sys
+import time
+
+import pytest
+
+from budget_core.session_cache import SessionCache, inputs_key
+from conftest import GENERAL, demo_components, load_script
+
+sys.path.insert(0, os.path.join(GENERAL, 'benchmarks'))
+import bench_startup  # noqa: E402
+
+
+def wait_for(app, condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        app.processEvents()
+
+
+def test_progressive_startup_replaces_placeholder(qt_app):
+    gui = load_script('monthly_budget_V4.py')['BudgetGUI'](*demo_components(), progressive=True)
+    placeholder = gui.placeholder
+    assert not hasattr(gui, 'budget')
+    gui.show()
+    wait_for(qt_app, lambda: hasattr(gui, 'budget'))
+    assert gui.placeholder is None
+    assert not placeholder.paint_timer.isActive() and not placeholder.fallback_timer.isActive()
+    # The placeholder no longer builds the form once it is replaced
+    placeholder.has_painted = False
+    placeholder.emit_painted()
+    assert gui.main_layout.count() == 2
+    gui.close()
+
+
+@pytest.mark.parametrize('mode', ['progressive', 'snapshot'])
+def test_launch_exits_cleanly(mode, tmp_path):
+    for _ in range(3):
+        times = bench_startup.launch(mode, str(tmp_path))
+        assert times['first_paint'] <= times['ready']
+
+
+def test_session_cache_round_trip(tmp_path):
+    income, mortgage_and_debt, utilities = demo_components()
+    key = inputs_key(income, mortgage_and_debt, utilities)
+    assert inputs_key(*demo_components()) == key
+    assert inputs_key(*demo_components(55000)) != key
+
+    cache = SessionCache(str(tmp_path / 'session'))
+    assert cache.load('default') is None
+    cache.save('default', key, 'Weekly', ['Taxes', 'Free Money'], [1.5, 2], image=b'\x89PNG')
+    state = cache.load('default', key)
+    assert (state['period'], state['labels'], state['sizes']) == ('Weekly', ['Taxes', 'Free Money'], [1.5, 2.0])
+    assert state['image'] == cache.image_path and open(cache.image_path, 'rb').read() == b'\x89PNG'
+    assert cache.load('other') is None and cache.load('default', 'stale') is None
+
+    # Saving without an image drops the old one; unreadable or other-version snapshots are ignored
+    cache.save('default', key, 'Monthly', [], [])
+    assert cache.load('default')['image'] is None
+    with open(cache.state_path, 'w') as file:
+        file.write('{"version": 0}')
+    assert cache.load('default') is None
+    with open(cache.state_path, 'w') as file:
+        file.write('not json')
+    assert cache.load('default') is None
+    cache.clear()
+    assert not os.path.exists(cache.state_path)
+
+
+def test_v4_restores_the_last_session(qt_app, tmp_path):
+    script = load_script('monthly_budget_V4.py')
+    cache = SessionCache(str(tmp_path / 'session'))
+    gui = script['BudgetGUI'](*demo_components(), period="Annual", session=cache)
+    gui.save_session()
+    gui.close()
+    assert cache.load('default')['sizes'] == gui.original_sizes
+
+    restored = script['BudgetGUI'](*demo_components(), session=cache, progressive=True)
+    assert restored.period == "Annual" and restored.session_state is not None
+    restored.close()
+    # A budget whose inputs changed keeps the period but not the stale chart
+    changed = script['BudgetGUI'](*demo_components(55000), session=cache, progressive=True)
+    assert changed.period == "Annual" and changed.session_state is None
+    changed.close()
@@ -0,0 +1,114 @@
+"""
+SQLite budget history: snapshots round-trip every input, older databases gain
+the columns added since, and the series queries return the stored results.
+"""
+import inspect
+import sqlite3
+
+import pytest
+
+from budget_core import MonthlyBudget, MonthlyNetIncome
+from budget_core.storage import ADDED_COLUMNS, SNAPSHOT_COLUMNS, BudgetHistory, snapshot_row, snapshot_rows
+from conftest import FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS, demo_components
+
+PAYROLL_INCOME = MonthlyNetIncome(
+    150000, FEDERAL_TAX_BRACKETS, STATE_TAX_BRACKETS, 0.032, 0.062, 1454, 8024, 0.10, 3960,
+    social_security_brackets=[(168600, 0.062), (float('inf'), 0.0)],
+    medicare_tax_brackets=[(200000, 0.0145), (float('inf'), 0.0235)],
+    pre_tax_deductions_annual=2400,
+    retirement_pre_tax=True,
+)
+
+
+@pytest.fixture
+def history():
+    with BudgetHistory(':memory:') as history:
+        yield history
+
+
+def test_latest_round_trips_every_constructor_argument(history):
+    _, mortgage_and_debt, utilities = demo_components()
+    mortgage_and_debt.add_item("Student Loan", 220)
+    utilities.add_item("Gym", 35)
+    history.save("home", "2026-01", PAYROLL_INCOME, mortgage_and_debt, utilities)
+
+    monthly_net_income, restored_debt, restored_utilities = history.latest("home")
+    for parameter in inspect.signature(MonthlyNetIncome).parameters:
+        assert getattr(monthly_net_income, parameter) == getattr(PAYROLL_INCOME, parameter), parameter
+    assert restored_debt.breakdown() == mortgage_and_debt.breakdown()
+    assert restored_utilities.breakdown() == utilities.breakdown()
+    assert MonthlyBudget(monthly_net_income, restored_debt, restored_utilities).calculate_free_money() == pytest.approx(
+        MonthlyBudget(PAYROLL_INCOME, mortgage_and_debt, utilities).calculate_free_money()
+    )
+
+
+def test_latest_keeps_unset_payroll_brackets(history):
+    history.save("home", "2026-01", *demo_components())
+    monthly_net_income = history.latest("home")[0]
+    assert monthly_net_income.social_security_brackets is None
+    assert monthly_net_income.medicare_tax_brackets is None
+    assert monthly_net_income.retirement_pre_tax is False
+    assert history.latest("elsewhere") is None
+
+
+def test_older_database_gains_added_columns(tmp_path):
+    path = str(tmp_path / 'history.sqlite3')
+    old_columns = [column for column in SNAPSHOT_COLUMNS if column not in ADDED_COLUMNS]
+    row = dict(zip(SNAPSHOT_COLUMNS, snapshot_row("home", "2025-12", *demo_components())))
+    connection = sqlite3.connect(path)
+    connection.execute(f'CREATE TABLE snapshots (id INTEGER PRIMARY KEY, {", ".join(old_columns)})')
+    connection.execute(
+        f'INSERT INTO snapshots ({", ".join(old_columns)}) VALUES ({", ".join("?" * len(old_columns))})',
+        [row[column] for column in old_columns]
+    )
+    connection.commit()
+    connection.close()
+
+    with BudgetHistory(path) as history:
+        monthly_net_income = history.latest("home")[0]
+        assert monthly_net_income.pre_tax_deductions_annual == 0
+        assert monthly_net_income.retirement_pre_tax is False
+        assert monthly_net_income.social_security_brackets is None
+        history.save("home", "2026-01", PAYROLL_INCOME, *demo_components()[1:])
+        assert history.latest("home")[0].retirement_pre_tax is True
+        assert [period for period, _ in history.leftover_by_period("home", "2025-01", "2026-12")] == ["2025-12", "2026-01"]
+
+
+def test_series_uses_latest_snapshot_of_each_period(history):
+    components = demo_components()
+    history.save("home", "2026-01", *components)
+    history.save("home", "2026-02", PAYROLL_INCOME, *components[1:])
+    history.save("home", "2026-02", *components)
+    history.save("other", "2026-02", PAYROLL_INCOME, *components[1:])
+
+    periods, series = history.summary_series("home", "2026-01", "2026-12")
+    assert periods == ["2026-01", "2026-02"]
+    _, sizes = MonthlyBudget(*components).summary_segments()
+    for values, size in zip(series, sizes):
+        assert values == pytest.approx([size, size])
+    with pytest.raises(ValueError):
+        history.series("home", "2026-01", "2026-12", ('gross_annual_salary',))
+
+
+def test_snapshot_rows_match_snapshot_row(history):
+    snapshots = []
+    for index, salary in enumerate([0, 30000, 55000, 100300, 250000, 1000000]):
+        _, mortgage_and_debt, utilities = demo_components()
+        if index % 2:
+            utilities.add_item("Gym", 35 + index)
+        income = PAYROLL_INCOME if index == 3 else demo_components(salary)[0]
+        snapshots.append(("home", f"2026-{index + 1:02d}", income, mortgage_and_debt, utilities))
+
+    rows = snapshot_rows(iter(snapshots), created_at=1.0)
+    assert len(rows) == len(snapshots)
+    for snapshot, row in zip(snapshots, rows):
+        expected = snapshot_row(*snapshot, created_at=1.0)
+        assert len(row) == len(SNAPSHOT_COLUMNS)
+        for column, value, expected_value in zip(SNAPSHOT_COLUMNS, row, expected):
+            assert value == (pytest.approx(expected_value) if isinstance(expected_value, float) else expected_value), column
+    assert snapshot_rows([]) == []
+
+    history.save_rows(rows)
+    assert history.leftover_by_period("home", "2026-01", "2026-12") == [
+        (snapshot[1], pytest.approx(row[SNAPSHOT_COLUMNS.index('leftover_money')])) for snapshot, row in zip(snapshots, rows)
+    ]
@@ -0,0 +1,88 @@
+"""
+Tax table registry: lazy loading, caching and the tables shipped with budget_core.
+"""
+import pytest
+
+from budget_core import FILING_STATUSES, MonthlyNetIncome, TaxTableRegistry, tax_tables
+
+
+@pytest.fixture
+def registry(tmp_path):
+    year = tmp_path / '2030'
+    year.mkdir()
+    (year / 'federal.csv').write_text(
+        '# jurisdiction,filing status,brackets\n'
+        'US,single,10000:0.1 inf:0.2\n'
+        'US,married_joint,20000:0.1 inf:0.2\n'
+    )
+    (year / 'state.csv').write_text('XX,*,inf:0.05\nYY,single,5000:0.01 inf:0.03\n')
+    (year / 'local.csv').write_text('XX-Flat,*,inf:0.02\nXX-Graduated,*,1000:0.01 inf:0.02\n')
+    (tmp_path / 'notes').mkdir()
+    return TaxTableRegistry(str(tmp_path))
+
+
+def test_tables_are_read_and_parsed_once(registry):
+    assert registry.years() == [2030]
+    assert registry.stats() == {'files_loaded': 0, 'tables_parsed': 0}
+    assert registry.federal(2030) == ((10000.0, 0.1), (float('inf'), 0.2))
+    assert registry.federal(2030) is registry.federal(2030)
+    registry.federal(2030, 'married_joint')
+    assert registry.stats() == {'files_loaded': 1, 'tables_parsed': 2}
+
+    # "*" covers every filing status, each looked-up status is parsed once
+    assert registry.state(2030, 'XX', 'head_of_household') == registry.state(2030, 'XX') == ((float('inf'), 0.05),)
+    assert registry.jurisdictions(2030, 'state') == ['XX', 'YY']
+    assert registry.stats() == {'files_loaded': 2, 'tables_parsed': 4}
+
+
+def test_lookup_errors(registry):
+    with pytest.raises(KeyError):
+        registry.state(2030, 'YY', 'married_joint')
+    with pytest.raises(KeyError):
+        registry.federal(2031)
+    with pytest.raises(ValueError):
+        registry.brackets(2030, 'county', 'XX')
+    assert registry.local_rate(2030, 'XX-Flat') == 0.02
+    with pytest.raises(ValueError):
+        registry.local_rate(2030, 'XX-Graduated')
+    assert TaxTableRegistry(str(registry.directory) + '-missing').years() == []
+
+
+def test_shipped_tables():
+    assert {2023, 2024} <= set(tax_tables.years())
+    for status in FILING_STATUSES:
+        for year in (2023, 2024):
+            brackets = tax_tables.federal(year, status)
+            assert brackets[-1][0] == float('inf')
+            assert [limit for limit, _ in brackets] == sorted(limit for limit, _ in brackets)
+    assert tax_tables.federal(2024)[0] == (11600.0, 0.10)
+    assert tax_tables.social_security(2024) == ((168600.0, 0.062), (float('inf'), 0.0))
+
+
+def test_every_state_has_2024_tables():
+    states = tax_tables.jurisdictions(2024, 'state')
+    assert len(states) == 51 and 'DC' in states
+    for state in states:
+        for status in FILING_STATUSES:
+            brackets = tax_tables.state(2024, state, status)
+            limits = [limit for limit, _ in brackets]
+            assert limits[-1] == float('inf') and limits == sorted(set(limits))
+            assert all(0 <= rate < 0.15 for _, rate in brackets)
+    assert tax_tables.state(2024, 'CA', 'married_separate') == tax_tables.state(2024, 'CA', 'single')
+    assert tax_tables.state(2024, 'NY', 'married_joint')[0] == (17150.0, 0.04)
+
+
+def test_net_income_and_profiles_use_the_tables():
+    income = tax_tables.net_income(90000, 2024, 'MD', locality='MD-Howard', retirement_contribution_annual=5000)
+    expected = MonthlyNetIncome(
+        90000, tax_tables.federal(2024), tax_tables.state(2024, 'MD'), 0.032, 0.0, 0, 5000, 0, 0,
+        tax_tables.social_security(2024), tax_tables.medicare(2024)
+    )
+    assert income.calculate_net_monthly_income() == pytest.approx(expected.calculate_net_monthly_income())
+
+    resolved = tax_tables.resolve_income({'gross_annual_salary': 90000, 'tax_year': 2024, 'state': 'FL', 'filing_status': 'married_joint'})
+    assert resolved['federal_tax_brackets'] == tax_tables.federal(2024, 'married_joint')
+    assert resolved['state_tax_brackets'] == ((float('inf'), 0.0),)
+    assert (resolved['local_tax_rate'], resolved['fica_rate']) == (0.0, 0.0)
+    profile = {'gross_annual_salary': 90000, 'federal_tax_brackets': [[1, 0.1]]}
+    assert tax_tables.resolve_income(profile) is profile
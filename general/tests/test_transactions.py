@@ -0,0 +1,78 @@
+"""
+Streaming transaction ingestion: readers, categorization and monthly totals.
+"""
+import pytest
+
+from budget_core.transactions import BUCKET_INDEX, UNCATEGORIZED, Categorizer, MonthlyAggregator, read_csv_transactions, read_ofx_transactions
+from conftest import demo_components
+
+TRANSACTIONS = [
+    ('2024-01', 'RENT PAYMENT JAN', -1500.0),
+    ('2024-01', 'Netflix.com', -15.49),
+    ('2024-01', 'ACME PAYROLL', 4000.0),
+    ('2024-01', 'Corner Bakery', -12.5),
+    ('2024-02', 'Shell Oil 1234', -45.0),
+    ('2024-02', 'shell oil 1234', -5.0),
+]
+
+
+def test_categorizer_uses_rules_and_memo():
+    categorizer = Categorizer(memo_size=2)
+    assert categorizer.categorize('Comcast Cable') == BUCKET_INDEX['internet']
+    assert categorizer.categorize('Unknown Merchant') == UNCATEGORIZED
+    assert categorizer.categorize('GEICO *AUTO') == BUCKET_INDEX['car_insurance']
+    assert len(categorizer._memo) <= 2
+
+    custom = Categorizer([('LANDLORD LLC', 'rent', 'exact'), (r'^SQ \*', 'entertainment', 'regex')])
+    assert custom.categorize(' landlord llc ') == BUCKET_INDEX['rent']
+    assert custom.categorize('SQ *COFFEE') == BUCKET_INDEX['entertainment']
+    with pytest.raises(KeyError):
+        Categorizer([('X', 'groceries')])
+
+
+def test_add_and_consume_agree():
+    streamed = MonthlyAggregator().consume(iter(TRANSACTIONS))
+    added = MonthlyAggregator()
+    for transaction in TRANSACTIONS:
+        added.add(*transaction)
+    assert (streamed.spending, streamed.income, streamed.count) == (added.spending, added.income, added.count)
+    assert streamed.months() == ['2024-01', '2024-02']
+    assert streamed.income == {'2024-01': 4000.0}
+
+    january = streamed.bucket_totals('2024-01')
+    assert january['rent'] == 1500.0 and january['entertainment'] == 15.49 and january['uncategorized'] == 12.5
+    assert streamed.bucket_totals('2024-02')['gas_electric_car'] == 50.0
+    assert sum(streamed.bucket_totals('2023-12').values()) == 0
+
+
+def test_monthly_budget_accounts_for_uncategorized_spending():
+    aggregator = MonthlyAggregator().consume(TRANSACTIONS)
+    mortgage_and_debt, utilities = aggregator.to_expenses('2024-01')
+    assert mortgage_and_debt.calculate_total_monthly_debt() == 1500.0
+    assert utilities.calculate_total_monthly_utilities() == pytest.approx(15.49 + 12.5)
+    assert ('Other', 12.5) in zip(*utilities.breakdown())
+
+    budget = aggregator.monthly_budget('2024-01', demo_components()[0])
+    _, sizes = budget.summary_segments()
+    assert sizes[1:3] == pytest.approx([1500.0, 15.49 + 12.5])
+
+
+def test_readers(tmp_path):
+    csv_path = tmp_path / 'export.csv'
+    csv_path.write_text('Date,Description,Amount\n01/31/2024,"RENT, JANUARY","-$1,500.00"\n\n02/01/2024,Payroll,2000\n')
+    assert list(read_csv_transactions(csv_path, date_format='%m/%d/%Y')) == [
+        ('2024-01', 'RENT, JANUARY', -1500.0), ('2024-02', 'Payroll', 2000.0),
+    ]
+    iso_path = tmp_path / 'iso.csv'
+    iso_path.write_text('When,Payee,Value\n2024-03-05,Hulu,-7.99\n')
+    assert list(read_csv_transactions(iso_path, 'When', 'Payee', 'Value')) == [('2024-03', 'Hulu', -7.99)]
+
+    ofx_path = tmp_path / 'export.ofx'
+    ofx_path.write_text(
+        '<OFX><BANKTRANLIST>\n'
+        '<STMTTRN>\n<TRNTYPE>DEBIT\n<DTPOSTED>20240115120000\n<TRNAMT>-75.00\n<NAME>BGE ELECTRIC\n</STMTTRN>\n'
+        '<STMTTRN><DTPOSTED>20240201</DTPOSTED><TRNAMT>-30.00</TRNAMT><MEMO>MINT MOBILE</MEMO></STMTTRN>\n'
+        '<STMTTRN>\n<NAME>NO DATE\n<TRNAMT>-1.00\n</STMTTRN>\n'
+        '</BANKTRANLIST></OFX>\n'
+    )
+    assert list(read_ofx_transactions(ofx_path)) == [('2024-01', 'BGE ELECTRIC', -75.0), ('2024-02', 'MINT MOBILE', -30.0)]
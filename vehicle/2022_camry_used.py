@@ -3,37 +3,13 @@ Christopher Morales
 
 Paying the principal vs not paying the principal
 """
-import numpy_financial as npf
-import pandas as pd
-
-# Function to calculate loan details without extra payments
-def loan_schedule(principal, annual_rate, years, extra_payment=0):
-    monthly_rate = annual_rate / 12
-    n_payments = years * 12
-    monthly_payment = npf.pmt(monthly_rate, n_payments, -principal)
-    
-    balance = principal
-    schedule = []
-
-    for i in range(1, n_payments + 1):
-        interest = balance * monthly_rate
-        principal_payment = monthly_payment - interest
-        if extra_payment > 0:
-            principal_payment += extra_payment
-        balance -= principal_payment
-        
-        schedule.append({
-            'Month': i,
-            'Payment': monthly_payment + extra_payment,
-            'Principal Payment': principal_payment,
-            'Interest Payment': interest,
-            'Remaining Balance': balance
-        })
-        
-        if balance <= 0:
-            break
-
-    return pd.DataFrame(schedule)
+import os
+import sys
+
+# The loan schedule lives in the shared budget core next to the monthly budget scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'general'))
+from budget_core.amortization import loan_schedule_columns
+from budget_core.loan_report import LoanComparison
 
 # Boolean statement to create CSV file
 create_csv_file = False
@@ -45,14 +21,22 @@ years = 5  # Loan term in years
 extra_payment = 500  # Extra monthly payment towards principal
 
 # Calculate schedules
-schedule_without_extra = loan_schedule(principal, annual_rate, years)
-schedule_with_extra = loan_schedule(principal, annual_rate, years, extra_payment)
+schedule_without_extra = loan_schedule_columns(principal, annual_rate, years).to_dataframe()
+schedule_with_extra = loan_schedule_columns(principal, annual_rate, years, extra_payment).to_dataframe()
+
+# Side-by-side summary of both scenarios, from closed forms
+comparison = LoanComparison([
+    {'name': 'Without Extra Payments', 'principal': principal, 'annual_rate': annual_rate, 'years': years},
+    {'name': 'With Extra Payments', 'principal': principal, 'annual_rate': annual_rate, 'years': years, 'extra_payment': extra_payment},
+])
 
 # If true then create the CSV
 if create_csv_file:
     # Save to CSV files
     schedule_without_extra.to_csv('Loan_Schedule_Without_Extra_Payments.csv', index=False)
     schedule_with_extra.to_csv('Loan_Schedule_With_Extra_Payments.csv', index=False)
+    with open('Loan_Comparison.csv', 'w', newline='') as file:
+        comparison.to_csv(file)
 
 # Display the first few rows of the dataframes
 print("Loan Schedule Without Extra Payments")
@@ -60,3 +44,6 @@ print(schedule_without_extra.head())
 
 print("\nLoan Schedule With Extra Payments")
 print(schedule_with_extra.head())
+
+print("\nLoan Comparison")
+print(comparison.render())